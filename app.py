@@ -2,21 +2,47 @@ import requests
 from typing import List, Optional, Dict, Any
 from flask import Flask, jsonify, request, render_template, send_from_directory
 import chromadb
-from chromadb.utils import embedding_functions
 from chromadb.config import Settings
-from chromaviz import visualize_collection
+from chromaviz import start_visualizer, visualize_collection, visualizer_port
+from embeddings import (
+    CachedEmbeddingFunction,
+    CoalescingEmbeddingFunction,
+    EmbeddingsNotReady,
+    HttpEmbeddingFunction,
+    LazyEmbeddingFunction,
+    LengthBucketedEmbedding,
+    OnnxEmbeddingFunction,
+    SentenceTransformerEmbedding,
+    cache_from_env,
+    coalescing_from_env,
+    http_model_key,
+    local_model_key,
+    model_revision,
+    unwrap,
+)
+from importing import (
+    ImportFormatError,
+    ImportJobs,
+    NpyRows,
+    UnchangedFilter,
+    batched,
+    embed_ahead,
+    embed_batch,
+    iter_records,
+    record_embeddings,
+    with_embeddings,
+)
 import socket
 import webbrowser
 import threading
 from datetime import datetime
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 import numpy as np
 import json
 import subprocess
 import psutil
 import shutil
 import os
-from sentence_transformers import SentenceTransformer
 import time
 import sys
 import signal
@@ -56,6 +82,7 @@ CHROMA_DATA_PATH = ""
 EMBEDMODEL = ""
 EMBEDMODEL_LOCAL_PATH = ""
 EMBEDMODEL_CONTEXTWINDOW = 128
+EMBEDMODEL_DIMENSION = 384
 PROXY_URL = "" 
 CHROMAVIZ_PORT = 5013
 CHROMAVIZ_HOST = "127.0.0.1"
@@ -186,7 +213,7 @@ def load_settings_from_json(file_path: str):
         return v if v not in (None, "") else fallback
 
     global address_flask, CHROMA_DATA_PATH, EMBEDMODEL, EMBEDMODEL_LOCAL_PATH
-    global EMBEDMODEL_CONTEXTWINDOW, PROXY_URL, CHROMAVIZ_PORT, CHROMAVIZ_HOST
+    global EMBEDMODEL_CONTEXTWINDOW, EMBEDMODEL_DIMENSION, PROXY_URL, CHROMAVIZ_PORT, CHROMAVIZ_HOST
 
     # Allow env vars to override the file
     address_flask = _getenv("FLASK_SERVER_ENDPOINT", settings.get("flask_server_endpoint", defaults["flask_server_endpoint"]))
@@ -195,6 +222,7 @@ def load_settings_from_json(file_path: str):
     EMBEDMODEL = _getenv("EMBEDDING_MODEL", settings.get("embedding_model", defaults["embedding_model"]))
     EMBEDMODEL_LOCAL_PATH = _norm_path(_getenv("EMBEDDING_MODEL_PATH", settings.get("embedding_model_path", defaults["embedding_model_path"])))
     EMBEDMODEL_CONTEXTWINDOW = int(_getenv("EMBEDDING_CONTEXT_WINDOW", settings.get("embedding_context_window", defaults["embedding_context_window"])))
+    EMBEDMODEL_DIMENSION = int(_getenv("EMBEDDING_MODEL_DIMENSION", settings.get("embedding_model_dimension", defaults["embedding_model_dimension"])))
 
     # Ensure important folders exist
     os.makedirs(CHROMA_DATA_PATH, exist_ok=True)
@@ -253,6 +281,7 @@ print(f"  Chroma Data Path:          {CHROMA_DATA_PATH}")
 print(f"  Embedding Model:           {EMBEDMODEL}")
 print(f"  Embedding Model Path:      {EMBEDMODEL_LOCAL_PATH}")
 print(f"  Embedding Context Window:  {EMBEDMODEL_CONTEXTWINDOW}")
+print(f"  Embedding Dimension:       {EMBEDMODEL_DIMENSION}")
 print(f"  Proxy URL:                 {PROXY_URL if PROXY_URL else 'Not used'}")
 print("=======================================================================================================")
 
@@ -265,7 +294,6 @@ print("""
 \___/_/ /_/_/   \____/_/ /_/ /_/\__,_/  /_/ /_/\____/|__/|__/  /____/\__/\__,_/\__,_/_/\____/ 
 """)
 print("\n\n")
-time.sleep(3) 
 print("Starting up... please wait...\n\n")
 
 
@@ -306,146 +334,105 @@ def make_chroma_client():
 persistentChromaClient = make_chroma_client()
 
 
+def chroma_max_batch_size(chroma_client) -> Optional[int]:
+    """The most records the Chroma client accepts in one write, or None if it cannot tell."""
+    try:
+        getter = getattr(chroma_client, "get_max_batch_size", None)
+        size = int(getter() if getter is not None else chroma_client.max_batch_size)
+    except Exception as e:
+        print(f"Could not read Chroma's maximum batch size: {e}")
+        return None
+    return size if size > 0 else None
+
+
+# Import and clone batches default to this, and writes are split to fit it.
+# Lowered at runtime if Chroma still rejects a batch as too large.
+CHROMA_MAX_BATCH_SIZE = chroma_max_batch_size(persistentChromaClient)
+print(f"Chroma maximum batch size: {CHROMA_MAX_BATCH_SIZE or 'unknown'}")
+
+
 
 # ---- Embeddings: local OR HTTP server ---------------------------------------
-class HttpEmbeddingFunction:
-    """
-    Minimal wrapper so Chroma can call a remote embeddings API.
-    Expects a server that supports: POST {base_url}/embed?model=...
-    Request body: {"texts": [...], "mode": "auto"}
-    Response: {"vectors": [[float, ...], ...]}
-    """
-    def __init__(
-        self,
-        base_url: str,
-        model: str,
-        timeout: int = 30,
-        *,
-        headers: Optional[Dict[str, str]] = None,
-        verify: bool = True,
-        max_batch: Optional[int] = None,
-        retries: int = 2,
-        backoff: float = 0.5,
-    ):
-        import os, requests  # local import to avoid module-level side effects
-
-        self.base_url = base_url.rstrip("/")
-        self.model = model
-        self.timeout = timeout
-        self.verify = verify
-        self.retries = max(0, int(retries))
-        self.backoff = float(backoff)
-
-        # Optional max batch size (env can override)
-        env_max = os.getenv("EMBEDDINGS_HTTP_MAX_BATCH")
-        self.max_batch = int(env_max) if (env_max and env_max.isdigit()) else max_batch
-
-        # Reuse a session for performance; attach headers (e.g., auth)
-        self.session = requests.Session()
-        hdrs = dict(headers or {})
-        token = os.getenv("EMBEDDINGS_HTTP_AUTH_TOKEN", "").strip()
-        if token and not any(k.lower() == "authorization" for k in hdrs):
-            hdrs["Authorization"] = f"Bearer {token}"
-        # Default JSON content type (server may not require it but it's harmless)
-        hdrs.setdefault("Content-Type", "application/json")
-        self.session.headers.update(hdrs)
-
-    def __call__(self, texts):
-        import time
-
-        # Accept a single string or an iterable of strings
-        if isinstance(texts, str):
-            inputs = [texts]
-        else:
-            inputs = list(texts or [])
-        if not inputs:
-            return []
-
-        # Helper to split into batches
-        def _chunks(seq, n):
-            if not n or n <= 0:
-                yield seq
-                return
-            for i in range(0, len(seq), n):
-                yield seq[i : i + n]
-
-        vectors_out = []
-        for batch in _chunks(inputs, self.max_batch or 0):
-            vecs = self._post_embed(batch)
-            vectors_out.extend(vecs)
-
-        # Sanity check length
-        if len(vectors_out) != len(inputs):
-            raise RuntimeError(
-                f"Embedding server returned {len(vectors_out)} vectors for {len(inputs)} texts."
-            )
+# HttpEmbeddingFunction lives in embeddings.py
 
-        return vectors_out
 
-    def _post_embed(self, batch):
-        import time, json
+def _wrap_embedding_function(embedding_function, model: str):
+    """
+    Put the content-addressed embedding cache in front of `embedding_function`,
+    with single-text cache misses micro-batched by the coalescer behind it.
+    """
+    embedding_function = coalescing_from_env(embedding_function)
+    # Next to the model folder (not inside it: a non-empty folder counts as a downloaded model)
+    cache = cache_from_env(os.path.dirname(os.path.normpath(EMBEDMODEL_LOCAL_PATH)))
+    if cache is None:
+        return embedding_function
+    stats = cache.stats()
+    print(f"[embeddings] cache enabled (memory={stats['memory_limit']} vectors, disk={stats['disk_path'] or 'off'})")
+    return CachedEmbeddingFunction(embedding_function, model, cache)
+
+
+def _ensure_local_model():
+    """Download EMBEDMODEL into EMBEDMODEL_LOCAL_PATH unless it is already there."""
+    if os.path.isdir(EMBEDMODEL_LOCAL_PATH) and len(os.listdir(EMBEDMODEL_LOCAL_PATH)) > 0:
+        return
+    print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+    print(f"Not Found Locally - Downloading model {EMBEDMODEL} from Hugging Face...")
+    print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+    from sentence_transformers import SentenceTransformer
 
-        url = f"{self.base_url}/embed"
-        params = {"model": self.model}
-        payload = {"texts": list(batch), "mode": "auto"}
+    os.makedirs(EMBEDMODEL_LOCAL_PATH, exist_ok=True)
+    model = SentenceTransformer(EMBEDMODEL)
+    print("Saving Model to Embedding Path...")
+    model.save(EMBEDMODEL_LOCAL_PATH)
+    print(f"Model downloaded and saved to: {EMBEDMODEL_LOCAL_PATH}")
+
+
+def _local_embedding_options() -> dict:
+    """Batching and context-window settings shared by the local backends."""
+    return {
+        "context_window": EMBEDMODEL_CONTEXTWINDOW,
+        "token_budget": int(os.getenv("EMBEDDINGS_TOKEN_BUDGET", "4096")),
+        "batch_size": int(os.getenv("EMBEDDINGS_LOCAL_MAX_BATCH", "128")),
+        "overlength": (os.getenv("EMBEDDINGS_OVERLENGTH", "truncate") or "truncate").strip().lower(),
+    }
 
-        last_err = None
-        for attempt in range(self.retries + 1):
-            resp = None
-            try:
-                resp = self.session.post(
-                    url,
-                    params=params,
-                    json=payload,
-                    timeout=self.timeout,
-                    verify=self.verify,
-                )
-                resp.raise_for_status()
-
-                # Parse and validate JSON
-                data = resp.json()
-                if not isinstance(data, dict) or "vectors" not in data:
-                    raise ValueError("Response JSON missing 'vectors' key.")
-                vectors = data["vectors"]
-                if not isinstance(vectors, list):
-                    raise ValueError("'vectors' must be a list.")
-
-                # Ensure each vector is a list[float]
-                out = []
-                for v in vectors:
-                    if not isinstance(v, (list, tuple)):
-                        raise ValueError("Each embedding must be a list/tuple.")
-                    # Force to float to avoid np types leaking
-                    out.append([float(x) for x in v])
-                return out
 
-            except Exception as e:
-                last_err = e
-                # Backoff then retry (if any left)
-                if attempt < self.retries:
-                    sleep_for = self.backoff * (2 ** attempt)
-                    time.sleep(sleep_for)
-                else:
-                    body = getattr(resp, "text", None) if resp is not None else None
-                    raise RuntimeError(
-                        f"HTTP embeddings request failed after {self.retries + 1} attempt(s): {e}. "
-                        f"URL={url} params={params} "
-                        f"{' body='+body[:500] if body else ''}"
-                    ) from e
+def _local_model_key(backend: str, embedding_function) -> str:
+    """
+    Cache key of a local backend: the model folder's identity plus the context
+    window and overlength handling, which decide the vector of a long text.
+    """
+    key = local_model_key(backend, EMBEDMODEL, EMBEDMODEL_LOCAL_PATH)
+    return f"{key}:ctx{embedding_function.max_length}:{embedding_function.overlength}"
 
 
 def make_embedding_function():
     """
     Decide at runtime if we use:
       - local SentenceTransformers (default), OR
+      - the same local model on ONNX Runtime (EMBEDDINGS_MODE=onnx), OR
       - remote HTTP server (EMBEDDINGS_MODE=http)
     Env vars:
-      EMBEDDINGS_MODE:           'local' (default) | 'http'
-      EMBEDDINGS_HTTP_URL:       e.g. 'http://embeddings:9005'
+      EMBEDDINGS_MODE:           'local' (default) | 'onnx' | 'http'
+      EMBEDDINGS_ONNX_QUANTIZE:  'true' (default) | 'false'  # int8 dynamic quantization
+      EMBEDDINGS_ONNX_THREADS:   ONNX Runtime intra-op threads (default 0 = runtime decides)
+      EMBEDDINGS_TOKEN_BUDGET:   local batches hold at most this many (padded) tokens (default 4096)
+      EMBEDDINGS_LOCAL_MAX_BATCH: texts per local batch at most (default 128)
+      EMBEDDINGS_OVERLENGTH:     'truncate' (default) | 'chunk'  # texts over EMBEDDING_CONTEXT_WINDOW tokens
+      EMBEDDINGS_HTTP_URL:       e.g. 'http://embeddings:9005', or several comma-separated replicas
+      EMBEDDINGS_HTTP_BALANCE:   'least_outstanding' (default) | 'latency'  # how a replica is picked per batch
+      EMBEDDINGS_HTTP_BREAKER_FAILURES: consecutive failures that eject a replica (default 3)
+      EMBEDDINGS_HTTP_BREAKER_COOLDOWN: seconds an ejected replica sits out before a trial request (default 10)
+      EMBEDDINGS_HTTP_HEDGE:     'false' (default) | 'true'  # re-send straggling batches to a second replica
       EMBEDDINGS_HTTP_MODEL:     e.g. 'e5-large-v2' | 'mxbai' | 'arctic' | 'nomic' | 'bge-m3'
       EMBEDDINGS_HTTP_TIMEOUT:   seconds (default 30)
       EMBEDDINGS_HTTP_VERIFY:    'true' (default) | 'false'  # TLS verify for HTTPS endpoints
+      EMBEDDINGS_HTTP_MAX_BATCH: texts per /embed request (the starting size when adaptive)
+      EMBEDDINGS_HTTP_ADAPTIVE_BATCH: 'true' (default) | 'false'  # tune the batch size from latency and errors
+      EMBEDDINGS_HTTP_FORMAT:    'auto' (default, offer binary formats) | 'json'
+      EMBEDDINGS_HTTP_CONCURRENCY: /embed requests in flight at once (default 4)
       CONTINUE_WITHOUT_EMBEDDINGS: 'true'|'false' (default true)
+    Either way the function is wrapped by the embedding cache (see embeddings.cache_from_env).
     """
     mode = os.getenv("EMBEDDINGS_MODE", "local").lower()
     continue_without = os.getenv("CONTINUE_WITHOUT_EMBEDDINGS", "true").lower() == "true"
@@ -458,18 +445,30 @@ def make_embedding_function():
         # NEW: allow disabling TLS verification for self-signed certs, etc.
         verify_env = (os.getenv("EMBEDDINGS_HTTP_VERIFY", "true") or "").strip().lower()
         verify = verify_env in ("1", "true", "yes", "y", "on")
+        adaptive = (os.getenv("EMBEDDINGS_HTTP_ADAPTIVE_BATCH", "true") or "").strip().lower() in ("1", "true", "yes", "y", "on")
+        hedge = (os.getenv("EMBEDDINGS_HTTP_HEDGE", "false") or "").strip().lower() in ("1", "true", "yes", "y", "on")
+        balance = (os.getenv("EMBEDDINGS_HTTP_BALANCE", "least_outstanding") or "least_outstanding").strip().lower()
+        breaker_failures = int(os.getenv("EMBEDDINGS_HTTP_BREAKER_FAILURES", "3"))
+        breaker_cooldown = float(os.getenv("EMBEDDINGS_HTTP_BREAKER_COOLDOWN", "10"))
 
         print(f"[embeddings] Using HTTP server at {base_url} (model='{model}', verify={verify})")
         try:
             # Optional quick probe (respect verify); won't fail startup if it errors
-            try:
-                import requests
-                requests.get(f"{base_url.rstrip('/')}/healthz", timeout=timeout, verify=verify)
-            except Exception:
-                pass
+            import requests
+            for url in base_url.split(","):
+                try:
+                    requests.get(f"{url.strip().rstrip('/')}/healthz", timeout=timeout, verify=verify)
+                except Exception:
+                    pass
 
             # Pass verify through to the embedding function
-            return HttpEmbeddingFunction(base_url, model, timeout=timeout, verify=verify)
+            return _wrap_embedding_function(
+                HttpEmbeddingFunction(
+                    base_url, model, timeout=timeout, verify=verify, concurrency=4, adaptive=adaptive,
+                    balance=balance, failure_threshold=breaker_failures, cooldown=breaker_cooldown, hedge=hedge,
+                ),
+                http_model_key(base_url, model),
+            )
 
         except Exception as e:
             print(f"[embeddings] ERROR creating HTTP embedding function: {e}")
@@ -478,6 +477,21 @@ def make_embedding_function():
                 return None
             sys.exit(1)
 
+    # ---- ONNX (local model exported to ONNX Runtime) ----
+    if mode == "onnx":
+        quantize = (os.getenv("EMBEDDINGS_ONNX_QUANTIZE", "true") or "").strip().lower() in ("1", "true", "yes", "y", "on")
+        threads = int(os.getenv("EMBEDDINGS_ONNX_THREADS", "0"))
+        try:
+            _ensure_local_model()
+            onnx_function = OnnxEmbeddingFunction(
+                EMBEDMODEL_LOCAL_PATH, quantize=quantize, threads=threads, **_local_embedding_options()
+            )
+            print(f"[embeddings] Using ONNX Runtime: {onnx_function.onnx_path} (threads={threads or 'auto'})")
+            model_key = _local_model_key(f"onnx{':int8' if quantize else ''}", onnx_function)
+            return _wrap_embedding_function(onnx_function, f"{model_key}@{model_revision(onnx_function.onnx_path)}")
+        except Exception as e:
+            print(f"[embeddings] ONNX backend unavailable ({e}); falling back to local SentenceTransformers.")
+
     # ---- LOCAL (fallback/default) ----
     try:
         print("\n\nPre-checks from embedding function...\nChecking Embedding Model Path exists and contains models....")
@@ -487,18 +501,13 @@ def make_embedding_function():
             print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
             print(f"Found - Loaded model from local path:\n{EMBEDMODEL_LOCAL_PATH}")
             print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-            return embedding_functions.SentenceTransformerEmbeddingFunction(EMBEDMODEL_LOCAL_PATH)
-
-        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-        print(f"Not Found Locally - Downloading model {EMBEDMODEL} from Hugging Face...")
-        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-        os.makedirs(EMBEDMODEL_LOCAL_PATH, exist_ok=True)
-        model = SentenceTransformer(EMBEDMODEL)
-        print("Saving Model to Embedding Path...")
-        model.save(EMBEDMODEL_LOCAL_PATH)
-        print(f"Model downloaded and saved to: {EMBEDMODEL_LOCAL_PATH}")
+            local_function = SentenceTransformerEmbedding(EMBEDMODEL_LOCAL_PATH, **_local_embedding_options())
+            return _wrap_embedding_function(local_function, _local_model_key("local", local_function))
+
+        _ensure_local_model()
         print("Now Loading locally...")
-        return embedding_functions.SentenceTransformerEmbeddingFunction(EMBEDMODEL_LOCAL_PATH)
+        local_function = SentenceTransformerEmbedding(EMBEDMODEL_LOCAL_PATH, **_local_embedding_options())
+        return _wrap_embedding_function(local_function, _local_model_key("local", local_function))
 
     except Exception as e:
         print(f"\nError loading local embeddings: {e}")
@@ -508,8 +517,38 @@ def make_embedding_function():
             return None
         sys.exit(1)
 
-# Prepare embedding function via factory (local or HTTP)
-pyEmbedFunction = make_embedding_function()  # None if continuing without embeddings
+def _load_embedding_function():
+    try:
+        return make_embedding_function()
+    except SystemExit as e:
+        # CONTINUE_WITHOUT_EMBEDDINGS=false: a failed load still stops the app, even from the loader thread
+        os._exit(e.code if isinstance(e.code, int) else 1)
+
+
+def start_embedding_function():
+    """
+    Build the embedding function in the background so Flask starts serving at
+    once; the model is loaded, warmed up with a dummy batch and reported by /ready.
+    Env vars:
+      EMBEDDINGS_WARMUP:        'true' (default) | 'false'
+      EMBEDDINGS_READY_TIMEOUT: seconds an embedding request waits for the model (default 300)
+    """
+    warmup = (os.getenv("EMBEDDINGS_WARMUP", "true") or "").strip().lower() in ("1", "true", "yes", "y", "on")
+    wait_timeout = float(os.getenv("EMBEDDINGS_READY_TIMEOUT", "300"))
+    return LazyEmbeddingFunction(_load_embedding_function, warmup=warmup, wait_timeout=wait_timeout).start()
+
+# Prepare embedding function via factory (local or HTTP); calls wait until it has loaded
+pyEmbedFunction = start_embedding_function()
+
+
+def _visualizer_collection(name):
+    # Looked up per request so a client recreated by /restart is picked up
+    if persistentChromaClient is None:
+        raise RuntimeError("ChromaDB server is unavailable")
+    return persistentChromaClient.get_collection(name, embedding_function=pyEmbedFunction)
+
+# One long-lived visualizer service serves every collection (?collection=<name>)
+start_visualizer(CHROMAVIZ_PORT, _visualizer_collection)
 
 
 # Indicate that Flask will continue launching regardless of ChromaDB status
@@ -537,23 +576,35 @@ def index():
 def reinitialize_app():
     # reload settings so env/paths/ports are up to date
     load_settings_from_json("appsettings.json")
-    global client, persistentChromaClient, pyEmbedFunction
+    global client, persistentChromaClient, pyEmbedFunction, CHROMA_MAX_BATCH_SIZE
+
+    # Import jobs hold the old client: stop them at a batch boundary and resume once we are back
+    interrupted_jobs = import_jobs.stop_all("interrupted")
 
     # drop any cached client handles if you use them elsewhere
     client = None
 
     # recreate the Chroma client (important if CHROMA_MODE/host/port changed)
     persistentChromaClient = make_chroma_client()
+    CHROMA_MAX_BATCH_SIZE = chroma_max_batch_size(persistentChromaClient)
+    print(f"[reinit] Chroma maximum batch size: {CHROMA_MAX_BATCH_SIZE or 'unknown'}")
 
     # recreate the embedding function according to EMBEDDINGS_MODE
     print("\n\nReinitializing embedding function...")
-    pyEmbedFunction = make_embedding_function()
+    pyEmbedFunction = start_embedding_function()
 
     # (optional) log what we're using for quick visibility
     print(f"[reinit] embeddings mode: {os.getenv('EMBEDDINGS_MODE', 'local')}")
     if os.getenv('EMBEDDINGS_MODE', 'local').lower() == 'local':
         print(f"[reinit] local model path: {EMBEDMODEL_LOCAL_PATH}")
 
+    if visualizer_port() is not None and visualizer_port() != CHROMAVIZ_PORT:
+        print(f"[reinit] the visualizer keeps listening on port {visualizer_port()}; port {CHROMAVIZ_PORT} applies after a full restart")
+
+    for job_id in interrupted_jobs:
+        import_jobs.start(job_id)
+        print(f"[reinit] resumed import job {job_id}")
+
 
 
 # Example route to restart (reinitialize) the Flask server without killing the process
@@ -741,6 +792,8 @@ def get_embedding_model_info():
             "embedding_model": EMBEDMODEL,
             "embedding_model_path": EMBEDMODEL_LOCAL_PATH,
             "embedding_model_context_window": EMBEDMODEL_CONTEXTWINDOW,
+            "embedding_model_dimension": EMBEDMODEL_DIMENSION,
+            "embeddings_status": pyEmbedFunction.status(),
         }
         if mode == "http":
             info.update({
@@ -748,6 +801,21 @@ def get_embedding_model_info():
                 "http_model": os.getenv("EMBEDDINGS_HTTP_MODEL", "e5-large-v2"),
                 "http_timeout": int(os.getenv("EMBEDDINGS_HTTP_TIMEOUT", "30")),
             })
+            http_function = unwrap(pyEmbedFunction, HttpEmbeddingFunction)
+            if http_function is not None:
+                info["http_batching"] = http_function.batch_info()
+        cached = unwrap(pyEmbedFunction, CachedEmbeddingFunction)
+        if cached is not None:
+            info["embedding_cache"] = cached.stats()
+        local_function = unwrap(pyEmbedFunction, LengthBucketedEmbedding)
+        if local_function is not None:
+            info["local_batching"] = local_function.bucketing_stats()
+        onnx_function = unwrap(pyEmbedFunction, OnnxEmbeddingFunction)
+        if onnx_function is not None:
+            info["onnx_model"] = onnx_function.onnx_path
+        coalescer = unwrap(pyEmbedFunction, CoalescingEmbeddingFunction)
+        if coalescer is not None:
+            info["embedding_coalescer"] = coalescer.stats()
         return jsonify(info)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -758,6 +826,14 @@ def flask_heartbeat():
     return jsonify({'heartbeat': True})
 
 
+@app.route('/ready', methods=['GET'])
+def flask_ready():
+    # Unlike /heartbeat, only 200 once the embedding model has loaded (or is disabled)
+    status = pyEmbedFunction.status()
+    ready = status["state"] in ("ready", "disabled")
+    return jsonify({'ready': ready, 'embeddings': status}), (200 if ready else 503)
+
+
 def list_collection_names_safe(client) -> List[str]:
     """
     Return collection names across Chroma versions:
@@ -1070,7 +1146,10 @@ def clone_new_collection():
     data = request.json
     passed_collection_name = data.get("collection_name")
     new_collection_name = data.get("new_collection_name")
-    batch_limit = data.get('batch_limit', 100)  # Default to 100 if not provided
+    try:
+        batch_limit = _import_batch_limit(data.get('batch_limit'))  # Chroma's maximum batch size if not provided
+    except (TypeError, ValueError):
+        return jsonify({'error': 'batch_limit must be a positive integer.'}), 400
 
     # Debugging: print all extracted values to the server's log
     print(f"Received data:\ncollection_name={passed_collection_name}")
@@ -1108,12 +1187,15 @@ def clone_new_collection():
     # Now extract the old ids, documents, and metadata into object variables
     old_collection_metadata = pycollection_old.metadata
 
-    # Fetch the documents and their metadata
-    old_results = pycollection_old.get(include=["documents", "metadatas"])
+    # Fetch the documents, their metadata and stored embeddings (copied as they are, not re-embedded)
+    old_results = pycollection_old.get(include=["documents", "metadatas", "embeddings"])
 
     old_doc_ids = old_results['ids']
     old_documents = old_results['documents']
     old_document_metadata = old_results['metadatas']
+    old_embeddings = old_results.get('embeddings')
+    if old_embeddings is None or len(old_embeddings) != len(old_doc_ids):
+        old_embeddings = [None] * len(old_doc_ids)
 
     # Now we need to create a new one with the same parameters
     try:
@@ -1135,24 +1217,30 @@ def clone_new_collection():
         return jsonify({'error': f'Failed to create new collection: {str(e)}'}), 500
 
     # Function to split documents into smaller batches
-    def chunk_records(doc_ids, documents, metadata, batch_size):
+    def chunk_records(doc_ids, documents, metadata, embeddings, batch_size):
         for i in range(0, len(doc_ids), batch_size):
-            yield doc_ids[i:i + batch_size], documents[i:i + batch_size], metadata[i:i + batch_size]
+            yield doc_ids[i:i + batch_size], documents[i:i + batch_size], metadata[i:i + batch_size], embeddings[i:i + batch_size]
 
-    batches = chunk_records(old_doc_ids, old_documents, old_document_metadata, batch_limit)
+    batches = chunk_records(old_doc_ids, old_documents, old_document_metadata, old_embeddings, batch_limit)
 
     # Now we need to copy the data in batches
     try:
         print(f"Copying Data into New Cloned Collection...")
         
         # Process each batch separately
-        for batch_ids, batch_documents, batch_metadata in batches:
+        for batch_ids, batch_documents, batch_metadata, batch_embeddings in batches:
             try:
                 print(f"Upserting batch of size {len(batch_ids)}...")
-                pycollection_new.upsert(
+                # Records without a stored embedding (if any) are embedded by the new collection
+                vectors = {}
+                if all(vector is not None for vector in batch_embeddings):
+                    vectors = {'embeddings': np.asarray(batch_embeddings, dtype=np.float32).tolist()}
+                _upsert_in_parts(
+                    pycollection_new.upsert,
                     documents=batch_documents,
                     metadatas=batch_metadata,
-                    ids=batch_ids
+                    ids=batch_ids,
+                    **vectors
                 )
                 print(f"Upsert for batch successful!")
 
@@ -1269,7 +1357,7 @@ def delete_all_collections():
 
 @app.route('/generate-embedding', methods=['POST'])
 def generate_embedding():
-    if pyEmbedFunction is None:
+    if pyEmbedFunction.state == "disabled":
         return jsonify({"error": "Embeddings are disabled. Set EMBEDDINGS_MODE=local or http."}), 503
 
 
@@ -1284,6 +1372,8 @@ def generate_embedding():
         if isinstance(vec, np.ndarray):
             vec = vec.tolist()
         return jsonify({"embedding": vec})
+    except EmbeddingsNotReady as e:
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         return jsonify({"error": f"An error occurred while generating the embedding: {str(e)}"}), 500
 
@@ -1300,6 +1390,7 @@ def add_document():
     doc_id = str(data.get("id") or "").strip()
     doc_content = data.get("document")
     metadata = data.get("metadata", {}) or {}
+    embedding = data.get("embedding")
 
     # Allow metadata as JSON string
     if isinstance(metadata, str):
@@ -1319,6 +1410,14 @@ def add_document():
     except Exception as e:
         return jsonify({'error': f"Collection {collection_name} not found: {str(e)}"}), 500
 
+    # A precomputed embedding is stored as it is; the embedding function is not called
+    vectors = {}
+    if embedding is not None:
+        try:
+            vectors = {'embeddings': record_embeddings([{'id': doc_id, 'embedding': embedding}], _collection_dimension(coll))}
+        except ImportFormatError as e:
+            return jsonify({'error': str(e)}), 400
+
     try:
         # Prefer direct existence check over fetching whole collection
         exists = False
@@ -1341,7 +1440,8 @@ def add_document():
         coll.add(
             documents=[doc_content],
             metadatas=[metadata],
-            ids=[doc_id]
+            ids=[doc_id],
+            **vectors
         )
 
         return jsonify({'message': 'Document added successfully'}), 200
@@ -1421,7 +1521,13 @@ def import_data_file():
     # Extract collection name, records, and batch_limit from the incoming data
     passed_collection_name = data.get('collection_name')
     records = data.get('records', [])
-    batch_limit = data.get('batch_limit', 100)  # Default to 100 if not provided
+    try:
+        batch_limit = _import_batch_limit(data.get('batch_limit'))  # Chroma's maximum batch size if not provided
+    except (TypeError, ValueError):
+        return jsonify({'error': 'batch_limit must be a positive integer.'}), 400
+    if not isinstance(records, list):
+        return jsonify({'error': 'records must be a list of records.'}), 400
+    skip_unchanged = _import_flag(data.get('skip_unchanged'))
 
     print(f"Collection: {passed_collection_name}")
     print(f"Batch Limit: {batch_limit}")
@@ -1437,69 +1543,368 @@ def import_data_file():
         print(f"Collection {passed_collection_name} not found.")
         return jsonify({'error': 'Collection not found. Create the collection first.'}), 500
 
-    # Function to split the records into smaller batches
-    def chunk_records(records, batch_size):
-        for i in range(0, len(records), batch_size):
-            yield records[i:i + batch_size]
+    # "background": true runs the import as a resumable job instead (see /import-jobs)
+    if data.get('background'):
+        job = import_jobs.create(passed_collection_name, batch_limit, records, skip_unchanged=skip_unchanged)
+        return jsonify(job.to_dict()), 202
 
     # Split the records into batches based on the batch_limit
-    batches = chunk_records(records, batch_limit)
-
-    # Loop through each record and extract id, document, and metadata
-    #print(f"DEBUG - Looping through Records just to check...")
-    #for record in records:
-    #    record_id = record.get('id')
-    #    document = record.get('document')
-    #    metadata = record.get('metadata')
-    #
-    #    # Print the extracted variables to the console
-    #    print(f"ID: {record_id}")
-    #    print(f"Document: {document}")
-    #    print(f"Metadata: {metadata}")
-
-
-    # Process each batch separately
-    for batch in batches:
-        # Extract document ids and texts
-        document_ids = [record.get('id') for record in batch]
-        document_texts = [record.get('document') for record in batch]
-        
-        # Check if metadata is available
-        document_metadatas = [record.get('metadata', {}) for record in batch]
-        
-        # If metadata is empty (default is empty dict), we won't include it in the upsert
-        if all(not metadata for metadata in document_metadatas):
-            try:
-                print(f"Upserting batch of size {len(batch)} without metadata...")
-                pycollection.upsert(
-                    documents=document_texts,
-                    ids=document_ids
-                )
-                print(f"Upsert for batch successful!")
-            except Exception as e:
-                print(f"Error during upsert: {str(e)}")
-                # Handle the exception
-                return jsonify({'error': f'Failed to upsert documents without metadata: {str(e)}'}), 500
-        else:
-            # When metadata is available, proceed with upserting it as well
-            try:
-                print(f"Upserting batch of size {len(batch)} with metadata...")
-                pycollection.upsert(
-                    documents=document_texts,
-                    metadatas=document_metadatas,
-                    ids=document_ids
-                )
-                print(f"Upsert for batch successful!")
-            except Exception as e:
-                print(f"Error during upsert: {str(e)}")
-                # Check if the exception message contains "exceeds maximum batch size"
-                if "exceeds maximum batch size" in str(e):
-                    return jsonify({'error': str(e)}), 566
-                return jsonify({'error': f'Failed to upsert documents: {str(e)}'}), 500
-    
+    batches = batched(records, batch_limit)
+
+    changes = UnchangedFilter(pycollection) if skip_unchanged else None
+    imported, error = _import_batches(pycollection, batches, changes)
+    if error is not None:
+        return error
+
     # Return a success response once all batches are processed
-    return jsonify({"message": "Data received and imported successfully!"}), 200
-    
+    return jsonify({"message": "Data received and imported successfully!", **(changes.counts if changes else {})}), 200
+
+
+def _import_batch_limit(requested=None) -> int:
+    """
+    Records per import batch: `requested`, capped at Chroma's maximum batch
+    size, or when not given (or "auto") IMPORT_BATCH_SIZE or that maximum.
+    Raises ValueError for anything but a positive integer.
+    """
+    if requested in (None, "", "auto"):
+        requested = os.getenv("IMPORT_BATCH_SIZE") or CHROMA_MAX_BATCH_SIZE or 1000
+    requested = int(requested)
+    if requested < 1:
+        raise ValueError("batch_limit must be positive")
+    return min(requested, CHROMA_MAX_BATCH_SIZE) if CHROMA_MAX_BATCH_SIZE else requested
+
+
+def _upsert_in_parts(upsert, ids, **columns):
+    """
+    upsert(ids=..., **columns) in parts of at most CHROMA_MAX_BATCH_SIZE
+    records. A part Chroma rejects for exceeding its maximum batch size is
+    halved and sent again, and the smaller size is kept for later writes.
+    """
+    global CHROMA_MAX_BATCH_SIZE
+    start = 0
+    while start < len(ids):
+        size = min(len(ids) - start, CHROMA_MAX_BATCH_SIZE or len(ids))
+        end = start + size
+        try:
+            upsert(ids=ids[start:end], **{name: values[start:end] for name, values in columns.items()})
+        except Exception as e:
+            if "exceeds maximum batch size" not in str(e) or size <= 1:
+                raise
+            CHROMA_MAX_BATCH_SIZE = max(1, size // 2)
+            print(f"A batch of {size} exceeds Chroma's maximum batch size, retrying in parts of {CHROMA_MAX_BATCH_SIZE}...")
+            continue
+        start = end
+
+
+def _import_flag(value) -> bool:
+    """A boolean import option from a JSON payload or a query string."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y", "on")
+    return bool(value)
+
+
+def _collection_dimension(pycollection) -> int:
+    """
+    The dimension precomputed embeddings must have to go into `pycollection`:
+    that of a vector it already stores, or EMBEDMODEL_DIMENSION while it is empty.
+    """
+    try:
+        stored = pycollection.get(limit=1, include=['embeddings']).get('embeddings')
+    except Exception as e:
+        print(f"Could not read a stored embedding's dimension: {e}")
+        stored = None
+    if stored is not None and len(stored):
+        return len(stored[0])
+    return EMBEDMODEL_DIMENSION
+
+
+def _embedded_batches(pycollection, batches, changes=None):
+    """
+    (batch, records, embeddings) for each batch of import records, where
+    `records` are the ones to write: all of them, or only the new and changed
+    ones with `changes` (an importing.UnchangedFilter). Records carrying an
+    "embedding" (checked against the collection's dimension, see
+    _collection_dimension) keep it and are never embedded again; the rest
+    are embedded up to IMPORT_PIPELINE_DEPTH batches ahead on a background
+    thread (see importing.embed_ahead), so embedding the next batch overlaps
+    writing this one. With 0 each batch is embedded just before its upsert.
+    """
+    depth = int(os.getenv("IMPORT_PIPELINE_DEPTH", "2"))
+    embed = pyEmbedFunction if pyEmbedFunction.state != "disabled" else None
+    select = changes.select if changes is not None else None
+    dimension = _collection_dimension(pycollection)
+    if depth > 0 and embed is not None:
+        return embed_ahead(batches, embed, depth, dimension, select)
+
+    def in_order():
+        for batch in batches:
+            records = select(batch) if select is not None else batch
+            yield batch, records, (embed_batch(records, embed, dimension) if records else [])
+
+    return in_order()
+
+
+def _upsert_import_batch(pycollection, batch, embeddings=None):
+    """Upsert one batch of import records ({id, document, metadata}); raises on failure."""
+    # Extract document ids and texts
+    document_ids = [record.get('id') for record in batch]
+    document_texts = [record.get('document') for record in batch]
+    # Precomputed upstream or by the pipeline, or left to the collection's embedding function
+    vectors = {'embeddings': embeddings} if embeddings is not None else {}
+
+    # Check if metadata is available
+    document_metadatas = [record.get('metadata', {}) for record in batch]
+
+    # If metadata is empty (default is empty dict), we won't include it in the upsert
+    if all(not metadata for metadata in document_metadatas):
+        print(f"Upserting batch of size {len(batch)} without metadata...")
+        _upsert_in_parts(
+            pycollection.upsert,
+            documents=document_texts,
+            ids=document_ids,
+            **vectors
+        )
+    else:
+        # When metadata is available, proceed with upserting it as well
+        print(f"Upserting batch of size {len(batch)} with metadata...")
+        _upsert_in_parts(
+            pycollection.upsert,
+            documents=document_texts,
+            metadatas=document_metadatas,
+            ids=document_ids,
+            **vectors
+        )
+    print(f"Upsert for batch successful!")
+
+
+def _import_batches(pycollection, batches, changes=None):
+    """
+    Upsert each batch of import records into `pycollection` as it arrives
+    (embedded ahead, see _embedded_batches; only new or changed records with
+    `changes`). Returns (records imported, None), or (records imported so
+    far, error response) at the first failed batch.
+    """
+    pairs = _embedded_batches(pycollection, batches, changes)
+    imported = 0
+    while True:
+        try:
+            batch, records, embeddings = next(pairs)
+        except StopIteration:
+            break
+        except ImportFormatError as e:
+            print(f"Invalid import body after {imported} records: {e}")
+            return imported, (jsonify({'error': str(e), 'imported': imported}), 400)
+        except Exception as e:
+            print(f"Error embedding batch: {str(e)}")
+            return imported, (jsonify({'error': f'Failed to embed documents: {str(e)}', 'imported': imported}), 500)
+
+        try:
+            if records:
+                _upsert_import_batch(pycollection, records, embeddings)
+        except Exception as e:
+            print(f"Error during upsert: {str(e)}")
+            if all(not record.get('metadata', {}) for record in records):
+                return imported, (jsonify({'error': f'Failed to upsert documents without metadata: {str(e)}', 'imported': imported}), 500)
+            # Check if the exception message contains "exceeds maximum batch size"
+            if "exceeds maximum batch size" in str(e):
+                return imported, (jsonify({'error': str(e), 'imported': imported}), 566)
+            return imported, (jsonify({'error': f'Failed to upsert documents: {str(e)}', 'imported': imported}), 500)
+        if changes is not None:
+            changes.commit()
+        imported += len(batch)
+    return imported, None
+
+
+def _run_import_job(job, batches, checkpoint):
+    """ImportJobs importer: upsert each batch, then record it as committed."""
+    pycollection = persistentChromaClient.get_collection(job.collection, embedding_function=pyEmbedFunction)
+    changes = UnchangedFilter(pycollection) if job.skip_unchanged else None
+    for batch, records, embeddings in _embedded_batches(pycollection, batches, changes):
+        if records:
+            _upsert_import_batch(pycollection, records, embeddings)
+        if changes is not None:
+            for name, count in changes.commit().items():
+                setattr(job, f"records_{name}", getattr(job, f"records_{name}") + count)
+        checkpoint(batch)
+
+
+# Background imports (see /import-jobs), kept in the Chroma data folder so they outlive the process.
+# Jobs left unfinished by a crash resume from their checkpoint at startup.
+import_jobs = ImportJobs(
+    os.getenv("IMPORT_JOBS_DIR") or os.path.join(CHROMA_DATA_PATH, "import-jobs"),
+    _run_import_job,
+    max_running=int(os.getenv("IMPORT_JOBS_MAX_RUNNING", "1")),
+)
+for _job_id in import_jobs.resume_pending():
+    print(f"Resuming import job {_job_id}")
+
+
+def _import_upload():
+    """
+    (records stream, sidecar embeddings stream or None) of a raw import body,
+    or of a multipart upload with a "records" file and an optional
+    "embeddings" .npy file.
+    """
+    if request.mimetype != 'multipart/form-data':
+        return request.stream, None
+    if 'records' not in request.files:
+        raise ImportFormatError('A multipart import needs a "records" file.')
+    sidecar = request.files.get('embeddings')
+    return request.files['records'].stream, (sidecar.stream if sidecar is not None else None)
+
+
+def _import_upload_records():
+    """Records of an /import-data-stream upload, with sidecar embeddings attached."""
+    source, sidecar = _import_upload()
+    records = iter_records(source)
+    if sidecar is not None:
+        records = with_embeddings(records, NpyRows(sidecar))
+    return records
+
+
+@app.route('/import-data-stream', methods=['POST'])
+def import_data_stream():
+    """
+    Import a raw upload body without buffering it: a JSON array of records or
+    NDJSON (one record per line), each {"id", "document", "metadata"} as for
+    /import-data-file. The collection and batch size are query parameters:
+
+        curl -X POST --data-binary @records.ndjson \
+            "http://127.0.0.1:5000/import-data-stream?collection_name=docs&batch_limit=500"
+
+    Records are parsed as the body arrives and upserted batch by batch, so
+    memory use is bounded by a batch rather than by the file size.
+
+    With skip_unchanged=true only new or changed records are written (see
+    importing.UnchangedFilter) and the response counts inserted, updated and
+    skipped records.
+
+    Records may carry a precomputed "embedding". Embeddings can also come as a
+    sidecar .npy (one row per record, in order) in a multipart upload:
+
+        curl -F records=@records.ndjson -F embeddings=@vectors.npy \
+            "http://127.0.0.1:5000/import-data-stream?collection_name=docs"
+    """
+    print(f"=====================================")
+    print(f"Received Request: /import-data-stream")
+    print(f"=====================================")
+
+    if persistentChromaClient is None:
+        print(f"   FROM: /import-data-stream   ChromaDB server is unavailable")
+        return jsonify({'error': 'ChromaDB server is unavailable'}), 500
+
+    passed_collection_name = request.args.get('collection_name')
+    try:
+        batch_limit = _import_batch_limit(request.args.get('batch_limit'))
+    except ValueError:
+        return jsonify({'error': 'batch_limit must be a positive integer.'}), 400
+
+    print(f"Collection: {passed_collection_name}")
+    print(f"Batch Limit: {batch_limit}")
+
+    try:
+        pycollection = persistentChromaClient.get_collection(
+            passed_collection_name, embedding_function=pyEmbedFunction
+        )
+        print(f"Collection {passed_collection_name} retrieved.")
+    except Exception as e:
+        print(f"Collection {passed_collection_name} not found.")
+        return jsonify({'error': 'Collection not found. Create the collection first.'}), 500
+
+    try:
+        records = _import_upload_records()
+    except ImportFormatError as e:
+        return jsonify({'error': str(e)}), 400
+
+    changes = UnchangedFilter(pycollection) if _import_flag(request.args.get('skip_unchanged')) else None
+    imported, error = _import_batches(pycollection, batched(records, batch_limit), changes)
+    if error is not None:
+        return error
+
+    print(f"Number of Records: {imported}")
+    return jsonify({
+        "message": "Data received and imported successfully!", "imported": imported, **(changes.counts if changes else {})
+    }), 200
+
+
+@app.route('/import-jobs', methods=['POST'])
+def create_import_job():
+    """
+    Start a background import and return its job id at once (202). Either the
+    /import-data-stream form (raw JSON array or NDJSON body, collection_name
+    and batch_limit in the query, optionally multipart with a sidecar
+    embeddings .npy) or the /import-data-file JSON payload.
+    The upload is spooled to disk first, so the job can resume from its last
+    committed batch after a failure, a crash or /restart.
+    """
+    if persistentChromaClient is None:
+        return jsonify({'error': 'ChromaDB server is unavailable'}), 500
+
+    if 'collection_name' in request.args:
+        passed_collection_name = request.args.get('collection_name')
+        batch_limit = request.args.get('batch_limit')
+        skip_unchanged = _import_flag(request.args.get('skip_unchanged'))
+        try:
+            source, sidecar = _import_upload()
+        except ImportFormatError as e:
+            return jsonify({'error': str(e)}), 400
+    else:
+        data = request.get_json(silent=True) or {}
+        passed_collection_name = data.get('collection_name')
+        batch_limit = data.get('batch_limit')
+        source = data.get('records', [])
+        sidecar = None
+        skip_unchanged = _import_flag(data.get('skip_unchanged'))
+    try:
+        batch_limit = _import_batch_limit(batch_limit)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'batch_limit must be a positive integer.'}), 400
+
+    try:
+        persistentChromaClient.get_collection(passed_collection_name, embedding_function=pyEmbedFunction)
+    except Exception:
+        return jsonify({'error': 'Collection not found. Create the collection first.'}), 500
+
+    try:
+        job = import_jobs.create(passed_collection_name, batch_limit, source, embeddings=sidecar, skip_unchanged=skip_unchanged)
+    except ImportFormatError as e:
+        return jsonify({'error': str(e)}), 400
+    print(f"Import job {job.id} created for collection {passed_collection_name}")
+    return jsonify(job.to_dict()), 202
+
+
+@app.route('/import-jobs', methods=['GET'])
+def list_import_jobs():
+    return jsonify({'jobs': [job.to_dict() for job in import_jobs.list()]})
+
+
+@app.route('/import-jobs/<job_id>', methods=['GET'])
+def import_job_status(job_id):
+    job = import_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown import job {job_id}'}), 404
+    return jsonify(job.to_dict())
+
+
+@app.route('/import-jobs/<job_id>/resume', methods=['POST'])
+def resume_import_job(job_id):
+    job = import_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown import job {job_id}'}), 404
+    if not import_jobs.start(job_id):
+        return jsonify({'error': f'Import job {job_id} is {job.status} and cannot be resumed.', **job.to_dict()}), 409
+    return jsonify(job.to_dict()), 202
+
+
+@app.route('/import-jobs/<job_id>/cancel', methods=['POST'])
+def cancel_import_job(job_id):
+    job = import_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown import job {job_id}'}), 404
+    # Stops after the batch in flight; the job can still be resumed later
+    import_jobs.stop(job_id, "cancelled", timeout=0)
+    return jsonify(job.to_dict()), 202
+
 
 @app.route('/gather-export-data', methods=['POST'])
 def gather_export_data():
@@ -2251,7 +2656,7 @@ def update_document():
 def visualize_my_collection():
     """
     Safer, env-aware visualizer:
-    - Uses CHROMAVIZ_HOST/CHROMAVIZ_PORT computed at startup (no local overrides)
+    - Uses CHROMAVIZ_HOST and the port the visualizer actually listens on
     - Works regardless of current working directory (paths resolved relative to this file)
     - Robust regex patches http/https endpoints
     - Atomic file writes + clear JSON errors
@@ -2282,35 +2687,39 @@ def visualize_my_collection():
         from pathlib import Path
         base_dir = Path(__file__).resolve().parent
         chromaviz_dir = base_dir / "chromaviz"
-        js_path = chromaviz_dir / "index-351494fc.js"
         html_path = chromaviz_dir / "index.html"
+        # The bundle name changes with every vite build; index.html's script tag names the current one
+        bundle = re.search(r'src="\./assets/(index-[^"]+\.js)"', html_path.read_text(encoding="utf-8")) if html_path.exists() else None
+        js_path = chromaviz_dir / bundle.group(1) if bundle else None
 
-        if not js_path.exists() or not html_path.exists():
+        if js_path is None or not js_path.exists():
             return jsonify({
                 "error": "ChromaViz assets not found",
-                "expected_paths": {"js": str(js_path), "html": str(html_path)}
+                "expected_paths": {"js": str(js_path or chromaviz_dir / "index-*.js"), "html": str(html_path)}
             }), 500
     except Exception as e:
         return jsonify({"error": f"Failed to resolve ChromaViz asset paths: {e}"}), 500
 
-    # 4) Build target URLs using globals set during startup
-    target_data_url = f'fetch("http://{CHROMAVIZ_HOST}:{CHROMAVIZ_PORT}/data")'
+    # 4) Build target URLs using globals set during startup. The visualizer binds its port once,
+    # so a chromaviz_port changed by /restart only applies after the app is started again.
+    viz_port = visualizer_port() or CHROMAVIZ_PORT
+    # Relative, and passing on the page's ?collection=, so each viewer tab loads its own collection
+    target_data_url = 'fetch("data"+window.location.search)'
     back_link = f'<a href="http://{CHROMAVIZ_HOST}:{CHROMAVIZ_PORT - 1}" target="_self">'
 
-    # 5) Patch the JS fetch endpoint (atomic write)
+    # 5) Patch the JS fetch endpoint (atomic write). Bundles built from vite/src already use
+    # relative API URLs, so only older bundles with a hard-coded /data URL are rewritten.
     try:
-        import re, tempfile, shutil
+        import tempfile, shutil
         pattern = r'fetch\("http[s]?://[^"]+/data"\)'
         text = js_path.read_text(encoding="utf-8")
         new_text, n = re.subn(pattern, target_data_url, text)
-        if n == 0:
-            # Pattern not found; keep file intact but add a warning comment
-            new_text = text + f'\n/* WARN: fetch pattern not found; expected to replace with {target_data_url} */\n'
-        with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8") as tmp:
-            tmp.write(new_text)
-            tmp_path = tmp.name
-        shutil.move(tmp_path, js_path)
-        print(f"Patched JS endpoint in: {js_path}")
+        if n:
+            with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8") as tmp:
+                tmp.write(new_text)
+                tmp_path = tmp.name
+            shutil.move(tmp_path, js_path)
+            print(f"Patched JS endpoint in: {js_path}")
     except Exception as e:
         return jsonify({"error": f"Failed to patch JS endpoint: {e}"}), 500
 
@@ -2329,13 +2738,16 @@ def visualize_my_collection():
     except Exception as e:
         return jsonify({"error": f"Failed to patch index.html backlink: {e}"}), 500
 
-    # 7) Launch visualizer
+    # 7) (Re)load the collection into the running visualizer; projection is a background job
     try:
-        visualize_collection(pycollection, CHROMAVIZ_PORT)
+        visualize_collection(pycollection, viz_port, background=True)
     except Exception as e:
         return jsonify({"error": f"Failed to start visualizer: {e}"}), 500
 
-    return jsonify({"message": "Visual Data is Generating... Please Wait..."}), 200
+    return jsonify({
+        "message": "Visual Data is Generating... Please Wait...",
+        "url": f"http://{CHROMAVIZ_HOST}:{viz_port}/?collection={quote(passed_collection_name)}",
+    }), 200
 
 
 @app.route('/clear-console')
@@ -1,2 +1,2 @@
-from .visualize import visualize_collection
+from .visualize import start_visualizer, visualize_collection, visualizer_port
 # here so it's a package
\ No newline at end of file
@@ -0,0 +1,143 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def collection_fingerprint(ids, embeddings) -> str:
+    """
+    Content fingerprint for a collection snapshot: the record count plus a
+    hash over the ids and the float32 bytes of every embedding row.
+    Any insert, delete or re-embed changes the fingerprint.
+    """
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    h = hashlib.blake2b(digest_size=16)
+    for doc_id in ids:
+        h.update(str(doc_id).encode("utf-8"))
+        h.update(b"\0")
+    # Hash the array's own buffer; tobytes() would copy the whole matrix first
+    h.update(memoryview(matrix))
+    return f"{len(ids)}-{h.hexdigest()}"
+
+
+class ProjectionCache:
+    """
+    LRU cache of projection results (dicts of NumPy arrays) bounded by a
+    memory budget in bytes. When `cache_dir` is set, entries are also written
+    as .npz files so a restart can reuse layouts that were already computed;
+    the folder is kept under `max_disk_bytes` by deleting the least recently
+    used files first.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, cache_dir: str = None,
+                 max_disk_bytes: int = 2 * 1024 * 1024 * 1024):
+        self.max_bytes = int(max_bytes)
+        self.max_disk_bytes = int(max_disk_bytes)
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._prune_disk()
+
+    @staticmethod
+    def key(collection_name: str, fingerprint: str) -> str:
+        return f"{collection_name}:{fingerprint}"
+
+    def _path(self, key: str) -> str:
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.npz")
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                entry = {name: npz[name] for name in npz.files}
+            # The modification time orders disk eviction, so a read counts as a use
+            os.utime(path)
+        except Exception as e:
+            print(f"[chromaviz] ignoring unreadable cache file {path}: {e}")
+            return None
+        self._store(key, entry)
+        return entry
+
+    def put(self, key: str, entry: dict):
+        entry = {name: np.asarray(value) for name, value in entry.items()}
+        self._store(key, entry)
+        if self.cache_dir:
+            path = self._path(key)
+            tmp_path = path + ".tmp.npz"
+            try:
+                np.savez(tmp_path, **entry)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                print(f"[chromaviz] failed to persist cache entry to {path}: {e}")
+            self._prune_disk(keep=path)
+        return entry
+
+    def _prune_disk(self, keep: str = None):
+        """Delete the least recently used .npz files until the folder fits in max_disk_bytes."""
+        with self._disk_lock:
+            files = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".npz") or ".tmp." in name:
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_disk_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f"[chromaviz] failed to evict cache file {path}: {e}")
+                    continue
+                total -= size
+
+    def _store(self, key: str, entry: dict):
+        size = sum(value.nbytes for value in entry.values())
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._sizes.pop(key)
+                del self._entries[key]
+            if size > self.max_bytes:
+                # Too large to keep in memory; the disk copy (if any) still serves it
+                return
+            self._entries[key] = entry
+            self._sizes[key] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(old_key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "cache_dir": self.cache_dir,
+                "max_disk_bytes": self.max_disk_bytes,
+            }
@@ -0,0 +1,61 @@
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.metrics import silhouette_score
+
+# Cluster counts tried when k is chosen automatically
+AUTO_K_CANDIDATES = (4, 6, 8, 12, 16, 24, 32, 48)
+
+
+def _kmeans(k: int, seed: int, batch_size: int):
+    return MiniBatchKMeans(n_clusters=k, random_state=seed, n_init=3, batch_size=batch_size)
+
+
+def choose_k(features, candidates=AUTO_K_CANDIDATES, sample_size: int = 10000, seed: int = 0, batch_size: int = 4096) -> int:
+    """
+    Pick the candidate k with the best silhouette score on a random sample of
+    `features`, so the cost stays bounded however large the collection is.
+    """
+    n = features.shape[0]
+    rng = np.random.default_rng(seed)
+    sample = features[rng.choice(n, size=min(n, sample_size), replace=False)]
+    candidates = [k for k in candidates if 2 <= k < sample.shape[0]]
+    if not candidates:
+        return max(1, min(2, n))
+
+    best_k, best_score = candidates[0], -np.inf
+    for k in candidates:
+        labels = _kmeans(k, seed, batch_size).fit_predict(sample)
+        if np.unique(labels).size < 2:
+            continue
+        score = silhouette_score(sample, labels, sample_size=min(sample.shape[0], 5000), random_state=seed)
+        print(f'[chromaviz] k={k}: silhouette {score:.4f}')
+        if score > best_score:
+            best_k, best_score = k, score
+    return best_k
+
+
+def cluster_embeddings(embeddings, k=None, seed: int = 0, batch_size: int = 4096) -> dict:
+    """
+    Mini-batch k-means over the embedding matrix. `k=None` chooses k with
+    `choose_k`. Returns a dict of arrays suitable for ProjectionCache:
+    `labels` (int32 per row), `centers` (k x dim float32) and `sizes`.
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    n = matrix.shape[0]
+    if n == 0:
+        return {
+            "labels": np.empty(0, dtype=np.int32),
+            "centers": np.empty((0, matrix.shape[1] if matrix.ndim == 2 else 0), dtype=np.float32),
+            "sizes": np.empty(0, dtype=np.int64),
+        }
+    if k is None:
+        k = choose_k(matrix, seed=seed, batch_size=batch_size)
+    k = max(1, min(int(k), n))
+
+    kmeans = _kmeans(k, seed, batch_size)
+    labels = kmeans.fit_predict(matrix)
+    return {
+        "labels": labels.astype(np.int32),
+        "centers": kmeans.cluster_centers_.astype(np.float32),
+        "sizes": np.bincount(labels, minlength=k).astype(np.int64),
+    }
@@ -3532,7 +3532,7 @@ No matching component was found for:
 * @copyright ReactTooltip Team
 * @license MIT
 */const pz="react-tooltip-core-styles",mz="react-tooltip-base-styles",uE={core:!1,base:!1};function cE({css:n,id:e=mz,type:t="base",ref:r}){var i,s;if(!n||typeof document>"u"||uE[t]||t==="core"&&typeof process<"u"&&(!((i=process==null?void 0:process.env)===null||i===void 0)&&i.REACT_TOOLTIP_DISABLE_CORE_STYLES)||t!=="base"&&typeof process<"u"&&(!((s=process==null?void 0:process.env)===null||s===void 0)&&s.REACT_TOOLTIP_DISABLE_BASE_STYLES))return;t==="core"&&(e=pz),r||(r={});const{insertAt:o}=r;if(document.getElementById(e))return void console.warn(`[react-tooltip] Element with id '${e}' already exists. Call \`removeStyle()\` first`);const a=document.head||document.getElementsByTagName("head")[0],c=document.createElement("style");c.id=e,c.type="text/css",o==="top"&&a.firstChild?a.insertBefore(c,a.firstChild):a.appendChild(c),c.styleSheet?c.styleSheet.cssText=n:c.appendChild(document.createTextNode(n)),uE[t]=!0}const gz={anchorRefs:new Set,activeAnchor:{current:null},attach:()=>{},detach:()=>{},setActiveAnchor:()=>{}};Re.createContext({getTooltipData:()=>gz});typeof window<"u"&&window.addEventListener("react-tooltip-inject-styles",n=>{n.detail.disableCore||cE({css:":root{--rt-color-white:#fff;--rt-color-dark:#222;--rt-color-success:#8dc572;--rt-color-error:#be6464;--rt-color-warning:#f0ad4e;--rt-color-info:#337ab7;--rt-opacity:0.9}.core-styles-module_tooltip__3vRRp{visibility:hidden;position:absolute;top:0;left:0;pointer-events:none;opacity:0;transition:opacity 0.3s ease-out;will-change:opacity,visibility}.core-styles-module_fixed__pcSol{position:fixed}.core-styles-module_arrow__cvMwQ{position:absolute;background:inherit}.core-styles-module_noArrow__xock6{display:none}.core-styles-module_clickable__ZuTTB{pointer-events:auto}.core-styles-module_show__Nt9eE{visibility:visible;opacity:var(--rt-opacity)}",type:"core"}),n.detail.disableBase||cE({css:`
-.styles-module_tooltip__mnnfp{padding:8px 16px;border-radius:3px;font-size:90%;width:max-content}.styles-module_arrow__K0L3T{width:8px;height:8px}[class*='react-tooltip__place-top']>.styles-module_arrow__K0L3T{transform:rotate(45deg)}[class*='react-tooltip__place-right']>.styles-module_arrow__K0L3T{transform:rotate(135deg)}[class*='react-tooltip__place-bottom']>.styles-module_arrow__K0L3T{transform:rotate(225deg)}[class*='react-tooltip__place-left']>.styles-module_arrow__K0L3T{transform:rotate(315deg)}.styles-module_dark__xNqje{background:var(--rt-color-dark);color:var(--rt-color-white)}.styles-module_light__Z6W-X{background-color:var(--rt-color-white);color:var(--rt-color-dark)}.styles-module_success__A2AKt{background-color:var(--rt-color-success);color:var(--rt-color-white)}.styles-module_warning__SCK0X{background-color:var(--rt-color-warning);color:var(--rt-color-white)}.styles-module_error__JvumD{background-color:var(--rt-color-error);color:var(--rt-color-white)}.styles-module_info__BWdHW{background-color:var(--rt-color-info);color:var(--rt-color-white)}`,type:"base"})});const vz=({tip:n,settings:e})=>{const t=r=>typeof r=="object"&&r!==null?ft.jsx("ul",{style:{padding:0,margin:0},children:Object.entries(r).map(([i,s])=>ft.jsxs("li",{children:[ft.jsxs("strong",{children:[i,":"]})," ",t(s)]},i))}):ft.jsx("span",{children:r});return ft.jsxs("div",{style:{pointerEvents:"none",width:"25vw",padding:"5px",margin:0,listStyleType:"none",backgroundColor:"grey",borderRadius:"5px",wordWrap:"break-word"},children:[ft.jsx(ft.Fragment,{children:ft.jsx("span",{children:ft.jsx("strong",{children:"id: "})})}),t(n.id),e[0].showDocuments&&ft.jsxs(ft.Fragment,{children:[ft.jsx("br",{}),ft.jsx("span",{children:ft.jsx("strong",{children:"document:"})})]}),e[0].showDocuments&&t(n.document.substr(0,50)),e[0].showMetadata&&ft.jsxs(ft.Fragment,{children:[ft.jsx("br",{}),ft.jsx("span",{children:ft.jsx("strong",{children:"metadata:"})})]}),e[0].showMetadata&&ft.jsx("div",{style:{marginLeft:"1em"},children:t(n.metadata)})]})};function yz({datum:n,colorArray:e,highlightedGroup:t,setHighlightedGroup:r,settings:i}){const[s,o]=Re.useState(!1),a=()=>{o(!0),r(n.group)},c=()=>{o(!1),r(-1)},[f,h]=Re.useState(Math.random()*(.05-.025)+.02);return ft.jsxs("mesh",{position:n.position,onPointerOver:a,onPointerOut:c,children:[ft.jsx("sphereGeometry",{attach:"geometry",args:[f]}),ft.jsx("meshBasicMaterial",{attach:"material",color:t<0||t==n.group?e[n.group].hex():"gray"}),s&&ft.jsx(lz,{style:{pointerEvents:"none"},children:ft.jsx(vz,{tip:n,settings:i})})]})}const _z=({data:n,palette:e,highlightedGroup:t,setHighlightedGroup:r,settings:i})=>{if(n.points)return n.points.map((s,o)=>ft.jsx(yz,{settings:i,datum:s,colorArray:e,highlightedGroup:t,setHighlightedGroup:r},o))},Hg=0,xz=1,Sz=new F,fE=new BA,Iy=new Mo,hE=new F,xg=new Kr;class Mz{constructor(){this.tolerance=-1,this.faces=[],this.newFaces=[],this.assigned=new dE,this.unassigned=new dE,this.vertices=[]}setFromPoints(e){if(e.length>=4){this.makeEmpty();for(let t=0,r=e.length;t<r;t++)this.vertices.push(new wz(e[t]));this.compute()}return this}setFromObject(e){const t=[];return e.updateMatrixWorld(!0),e.traverse(function(r){const i=r.geometry;if(i!==void 0){const s=i.attributes.position;if(s!==void 0)for(let o=0,a=s.count;o<a;o++){const c=new F;c.fromBufferAttribute(s,o).applyMatrix4(r.matrixWorld),t.push(c)}}}),this.setFromPoints(t)}containsPoint(e){const t=this.faces;for(let r=0,i=t.length;r<i;r++)if(t[r].distanceToPoint(e)>this.tolerance)return!1;return!0}intersectRay(e,t){const r=this.faces;let i=-1/0,s=1/0;for(let o=0,a=r.length;o<a;o++){const c=r[o],f=c.distanceToPoint(e.origin),h=c.normal.dot(e.direction);if(f>0&&h>=0)return null;const d=h!==0?-f/h:0;if(!(d<=0)&&(h>0?s=Math.min(d,s):i=Math.max(d,i),i>s))return null}return i!==-1/0?e.at(i,t):e.at(s,t),t}intersectsRay(e){return this.intersectRay(e,Sz)!==null}makeEmpty(){return this.faces=[],this.vertices=[],this}addVertexToFace(e,t){return e.face=t,t.outside===null?this.assigned.append(e):this.assigned.insertBefore(t.outside,e),t.outside=e,this}removeVertexFromFace(e,t){return e===t.outside&&(e.next!==null&&e.next.face===t?t.outside=e.next:t.outside=null),this.assigned.remove(e),this}removeAllVerticesFromFace(e){if(e.outside!==null){const t=e.outside;let r=e.outside;for(;r.next!==null&&r.next.face===e;)r=r.next;return this.assigned.removeSubList(t,r),t.prev=r.next=null,e.outside=null,t}}deleteFaceVertices(e,t){const r=this.removeAllVerticesFromFace(e);if(r!==void 0)if(t===void 0)this.unassigned.appendChain(r);else{let i=r;do{const s=i.next;t.distanceToPoint(i.point)>this.tolerance?this.addVertexToFace(i,t):this.unassigned.append(i),i=s}while(i!==null)}return this}resolveUnassignedPoints(e){if(this.unassigned.isEmpty()===!1){let t=this.unassigned.first();do{const r=t.next;let i=this.tolerance,s=null;for(let o=0;o<e.length;o++){const a=e[o];if(a.mark===Hg){const c=a.distanceToPoint(t.point);if(c>i&&(i=c,s=a),i>1e3*this.tolerance)break}}s!==null&&this.addVertexToFace(t,s),t=r}while(t!==null)}return this}computeExtremes(){const e=new F,t=new F,r=[],i=[];for(let s=0;s<3;s++)r[s]=i[s]=this.vertices[0];e.copy(this.vertices[0].point),t.copy(this.vertices[0].point);for(let s=0,o=this.vertices.length;s<o;s++){const a=this.vertices[s],c=a.point;for(let f=0;f<3;f++)c.getComponent(f)<e.getComponent(f)&&(e.setComponent(f,c.getComponent(f)),r[f]=a);for(let f=0;f<3;f++)c.getComponent(f)>t.getComponent(f)&&(t.setComponent(f,c.getComponent(f)),i[f]=a)}return this.tolerance=3*Number.EPSILON*(Math.max(Math.abs(e.x),Math.abs(t.x))+Math.max(Math.abs(e.y),Math.abs(t.y))+Math.max(Math.abs(e.z),Math.abs(t.z))),{min:r,max:i}}computeInitialHull(){const e=this.vertices,t=this.computeExtremes(),r=t.min,i=t.max;let s=0,o=0;for(let m=0;m<3;m++){const v=i[m].point.getComponent(m)-r[m].point.getComponent(m);v>s&&(s=v,o=m)}const a=r[o],c=i[o];let f,h;s=0,fE.set(a.point,c.point);for(let m=0,v=this.vertices.length;m<v;m++){const _=e[m];if(_!==a&&_!==c){fE.closestPointToPoint(_.point,!0,hE);const S=hE.distanceToSquared(_.point);S>s&&(s=S,f=_)}}s=-1,Iy.setFromCoplanarPoints(a.point,c.point,f.point);for(let m=0,v=this.vertices.length;m<v;m++){const _=e[m];if(_!==a&&_!==c&&_!==f){const S=Math.abs(Iy.distanceToPoint(_.point));S>s&&(s=S,h=_)}}const d=[];if(Iy.distanceToPoint(h.point)<0){d.push(Ss.create(a,c,f),Ss.create(h,c,a),Ss.create(h,f,c),Ss.create(h,a,f));for(let m=0;m<3;m++){const v=(m+1)%3;d[m+1].getEdge(2).setTwin(d[0].getEdge(v)),d[m+1].getEdge(1).setTwin(d[v+1].getEdge(0))}}else{d.push(Ss.create(a,f,c),Ss.create(h,a,c),Ss.create(h,c,f),Ss.create(h,f,a));for(let m=0;m<3;m++){const v=(m+1)%3;d[m+1].getEdge(2).setTwin(d[0].getEdge((3-m)%3)),d[m+1].getEdge(0).setTwin(d[v+1].getEdge(1))}}for(let m=0;m<4;m++)this.faces.push(d[m]);for(let m=0,v=e.length;m<v;m++){const _=e[m];if(_!==a&&_!==c&&_!==f&&_!==h){s=this.tolerance;let S=null;for(let w=0;w<4;w++){const g=this.faces[w].distanceToPoint(_.point);g>s&&(s=g,S=this.faces[w])}S!==null&&this.addVertexToFace(_,S)}}return this}reindexFaces(){const e=[];for(let t=0;t<this.faces.length;t++){const r=this.faces[t];r.mark===Hg&&e.push(r)}return this.faces=e,this}nextVertexToAdd(){if(this.assigned.isEmpty()===!1){let e,t=0;const r=this.assigned.first().face;let i=r.outside;do{const s=r.distanceToPoint(i.point);s>t&&(t=s,e=i),i=i.next}while(i!==null&&i.face===r);return e}}computeHorizon(e,t,r,i){this.deleteFaceVertices(r),r.mark=xz;let s;t===null?s=t=r.getEdge(0):s=t.next;do{const o=s.twin,a=o.face;a.mark===Hg&&(a.distanceToPoint(e)>this.tolerance?this.computeHorizon(e,o,a,i):i.push(s)),s=s.next}while(s!==t);return this}addAdjoiningFace(e,t){const r=Ss.create(e,t.tail(),t.head());return this.faces.push(r),r.getEdge(-1).setTwin(t.twin),r.getEdge(0)}addNewFaces(e,t){this.newFaces=[];let r=null,i=null;for(let s=0;s<t.length;s++){const o=t[s],a=this.addAdjoiningFace(e,o);r===null?r=a:a.next.setTwin(i),this.newFaces.push(a.face),i=a}return r.next.setTwin(i),this}addVertexToHull(e){const t=[];return this.unassigned.clear(),this.removeVertexFromFace(e,e.face),this.computeHorizon(e.point,null,e.face,t),this.addNewFaces(e,t),this.resolveUnassignedPoints(this.newFaces),this}cleanup(){return this.assigned.clear(),this.unassigned.clear(),this.newFaces=[],this}compute(){let e;for(this.computeInitialHull();(e=this.nextVertexToAdd())!==void 0;)this.addVertexToHull(e);return this.reindexFaces(),this.cleanup(),this}}class Ss{constructor(){this.normal=new F,this.midpoint=new F,this.area=0,this.constant=0,this.outside=null,this.mark=Hg,this.edge=null}static create(e,t,r){const i=new Ss,s=new Ny(e,i),o=new Ny(t,i),a=new Ny(r,i);return s.next=a.prev=o,o.next=s.prev=a,a.next=o.prev=s,i.edge=s,i.compute()}getEdge(e){let t=this.edge;for(;e>0;)t=t.next,e--;for(;e<0;)t=t.prev,e++;return t}compute(){const e=this.edge.tail(),t=this.edge.head(),r=this.edge.next.head();return xg.set(e.point,t.point,r.point),xg.getNormal(this.normal),xg.getMidpoint(this.midpoint),this.area=xg.getArea(),this.constant=this.normal.dot(this.midpoint),this}distanceToPoint(e){return this.normal.dot(e)-this.constant}}class Ny{constructor(e,t){this.vertex=e,this.prev=null,this.next=null,this.twin=null,this.face=t}head(){return this.vertex}tail(){return this.prev?this.prev.vertex:null}length(){const e=this.head(),t=this.tail();return t!==null?t.point.distanceTo(e.point):-1}lengthSquared(){const e=this.head(),t=this.tail();return t!==null?t.point.distanceToSquared(e.point):-1}setTwin(e){return this.twin=e,e.twin=this,this}}class wz{constructor(e){this.point=e,this.prev=null,this.next=null,this.face=null}}class dE{constructor(){this.head=null,this.tail=null}first(){return this.head}last(){return this.tail}clear(){return this.head=this.tail=null,this}insertBefore(e,t){return t.prev=e.prev,t.next=e,t.prev===null?this.head=t:t.prev.next=t,e.prev=t,this}insertAfter(e,t){return t.prev=e,t.next=e.next,t.next===null?this.tail=t:t.next.prev=t,e.next=t,this}append(e){return this.head===null?this.head=e:this.tail.next=e,e.prev=this.tail,e.next=null,this.tail=e,this}appendChain(e){for(this.head===null?this.head=e:this.tail.next=e,e.prev=this.tail;e.next!==null;)e=e.next;return this.tail=e,this}remove(e){return e.prev===null?this.head=e.next:e.prev.next=e.next,e.next===null?this.tail=e.prev:e.next.prev=e.prev,this}removeSubList(e,t){return e.prev===null?this.head=t.next:e.prev.next=t.next,t.next===null?this.tail=e.prev:t.next.prev=e.prev,this}isEmpty(){return this.head===null}}class Ez extends zt{constructor(e=[]){super();const t=[],r=[],s=new Mz().setFromPoints(e).faces;for(let o=0;o<s.length;o++){const a=s[o];let c=a.edge;do{const f=c.head().point;t.push(f.x,f.y,f.z),r.push(a.normal.x,a.normal.y,a.normal.z),c=c.next}while(c!==a.edge)}this.setAttribute("position",new ut(t,3)),this.setAttribute("normal",new ut(r,3))}}function Tz({start:n,end:e,color:t}){const r=Re.useRef();return Re.useLayoutEffect(()=>{r.current.geometry.setFromPoints([n,e].map(i=>new F(...i)))},[n,e]),ft.jsxs("line",{ref:r,children:[ft.jsx("bufferGeometry",{}),ft.jsx("lineBasicMaterial",{color:t})]})}const bz=({data:n,palette:e,highlightedGroup:t})=>{function r(a){const c=new Map;for(const h of a){const{group:d}=h;c.has(d)||c.set(d,[]),c.get(d).push(h)}return Array.from(c.values())}function i(a){const c=[],f=a[0].group;a.forEach(_=>{c.push(new F(_.position[0],_.position[1],_.position[2]))});const h=new Ez(c),d=h.getAttribute("position"),m=h.getAttribute("position").count,v=[[]];for(let _=0;_<m;_+=3){const S=new F().fromBufferAttribute(d,_),w=new F().fromBufferAttribute(d,_+1),g=new F().fromBufferAttribute(d,_+2);v.push([[S.x,S.y,S.z],[w.x,w.y,w.z],f]),v.push([[w.x,w.y,w.z],[g.x,g.y,g.z],f]),v.push([[g.x,g.y,g.z],[S.x,S.y,S.z],f])}return v}var[s,o]=Re.useState([]);return Re.useEffect(()=>{if(n.points){o([]);const c=r(n.points);var a=[];c.forEach(f=>{f.length>5&&(a=a.concat(i(f)))});for(let f=0;f<a.length;f++){const h=a[f];h.length>2&&o(d=>[...d,ft.jsx(Tz,{start:h[0],end:h[1],color:t<0||t==h[2]?e[h[2]].hex():"gray"},f)])}}},[n.points,t]),s};var cC={},fC={};(function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.default=void 0;var e={sum:function(i){return i.reduce(function(s,o){return s+o})}},t=e;n.default=t})(fC);function Az(n){return Object.prototype.toString.call(n).slice(8,-1)}var tS=Az;function Cz(n){return!!n&&typeof n=="object"&&n.constructor===Object}var hC=Cz;function Rz(n,e){return Object.prototype.hasOwnProperty.call(n,e)}var nS=Rz,Pz=nS,y0,dC;function Lz(){dC=["toString","toLocaleString","valueOf","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","constructor"],y0=!0;for(var n in{toString:null})y0=!1}function Iz(n,e,t){var r,i=0;y0==null&&Lz();for(r in n)if(pE(e,n,r,t)===!1)break;if(y0)for(var s=n.constructor,o=!!s&&n===s.prototype;(r=dC[i++])&&!((r!=="constructor"||!o&&Pz(n,r))&&n[r]!==Object.prototype[r]&&pE(e,n,r,t)===!1););}function pE(n,e,t,r){return n.call(r,e[t],t,e)}var Nz=Iz,Dz=nS,Uz=Nz;function kz(n,e,t){Uz(n,function(r,i){if(Dz(n,i))return e.call(t,n[i],i,n)})}var J0=kz,Oz=J0;function Fz(n,e){for(var t=0,r=arguments.length,i;++t<r;)i=arguments[t],i!=null&&Oz(i,zz,n);return n}function zz(n,e){this[e]=n}var Bz=Fz,Hz=tS,Vz=hC,Gz=Bz;function Wz(n){switch(Hz(n)){case"Object":return Xz(n);case"Array":return $z(n);case"RegExp":return jz(n);case"Date":return Yz(n);default:return n}}function Xz(n){return Vz(n)?Gz({},n):n}function jz(n){var e="";return e+=n.multiline?"m":"",e+=n.global?"g":"",e+=n.ignoreCase?"i":"",new RegExp(n.source,e)}function Yz(n){return new Date(+n)}function $z(n){return n.slice()}var qz=Wz,Zz=qz,Kz=J0,Jz=tS,Qz=hC;function rS(n,e){switch(Jz(n)){case"Object":return e4(n,e);case"Array":return t4(n,e);default:return Zz(n)}}function e4(n,e){if(Qz(n)){var t={};return Kz(n,function(r,i){this[i]=rS(r,e)},t),t}else return e?e(n):n}function t4(n,e){for(var t=[],r=-1,i=n.length;++r<i;)t[r]=rS(n[r],e);return t}var n4=rS;function r4(n,e){return n===e?n!==0||1/n===1/e:n!==n&&e!==e}var iS=r4,i4=tS;function s4(n,e){return i4(n)===e}var pC=s4,o4=pC;function a4(n){return o4(n,"Object")}var mC=a4,l4=pC,u4=Array.isArray||function(n){return l4(n,"Array")},sS=u4;function c4(n){return n}var f4=c4;function h4(n){return function(e){return e[n]}}var d4=h4,p4=J0,mE=sS;function m4(n,e){for(var t=-1,r=n.length;++t<r;)if(oS(n[t],e))return!0;return!1}function g4(n,e){for(var t=-1,r=e.length;++t<r;)if(!m4(n,e[t]))return!1;return!0}function v4(n,e){var t=!0;return p4(e,function(r,i){if(!oS(n[i],r))return t=!1}),t}function oS(n,e){return n&&typeof n=="object"&&e&&typeof e=="object"?mE(n)&&mE(e)?g4(n,e):v4(n,e):n===e}var y4=oS,_4=f4,x4=d4,S4=y4;function M4(n,e){if(n==null)return _4;switch(typeof n){case"function":return typeof e<"u"?function(t,r,i){return n.call(e,t,r,i)}:n;case"object":return function(t){return S4(t,n)};case"string":case"number":return x4(n)}}var gC=M4,w4=J0,E4=gC;function T4(n,e,t){e=E4(e,t);var r=!0;return w4(n,function(i,s){if(!e(i,s,n))return r=!1,!1}),r}var b4=T4,vC=nS,gE=b4,vE=mC,A4=iS;function C4(n){return function(e,t){return vC(this,t)&&n(e,this[t])}}function R4(n,e){return vC(this,e)}function P4(n,e,t){return t=t||A4,!vE(n)||!vE(e)?t(n,e):gE(n,C4(t),e)&&gE(e,R4,n)}var L4=P4,I4=gC;function N4(n,e,t){e=I4(e,t);var r=!0;if(n==null)return r;for(var i=-1,s=n.length;++i<s;)if(!e(n[i],i,n)){r=!1;break}return r}var D4=N4,U4=iS,yE=sS,k4=D4;function O4(n,e,t){return t=t||U4,!yE(n)||!yE(e)?t(n,e):n.length!==e.length?!1:k4(n,F4(t),e)}function F4(n){return function(e,t){return t in this&&n(e,this[t])}}var z4=O4,B4=iS,_E=mC,xE=sS,H4=L4,V4=z4;function yC(n,e,t){t=t||B4;var r=_E(n)&&_E(e),i=!r&&xE(n)&&xE(e);if(!r&&!i)return t(n,e);function s(a,c){return yC(a,c,t)}var o=r?H4:V4;return o(n,e,s)}var G4=yC,_C={exports:{}};/**
+.styles-module_tooltip__mnnfp{padding:8px 16px;border-radius:3px;font-size:90%;width:max-content}.styles-module_arrow__K0L3T{width:8px;height:8px}[class*='react-tooltip__place-top']>.styles-module_arrow__K0L3T{transform:rotate(45deg)}[class*='react-tooltip__place-right']>.styles-module_arrow__K0L3T{transform:rotate(135deg)}[class*='react-tooltip__place-bottom']>.styles-module_arrow__K0L3T{transform:rotate(225deg)}[class*='react-tooltip__place-left']>.styles-module_arrow__K0L3T{transform:rotate(315deg)}.styles-module_dark__xNqje{background:var(--rt-color-dark);color:var(--rt-color-white)}.styles-module_light__Z6W-X{background-color:var(--rt-color-white);color:var(--rt-color-dark)}.styles-module_success__A2AKt{background-color:var(--rt-color-success);color:var(--rt-color-white)}.styles-module_warning__SCK0X{background-color:var(--rt-color-warning);color:var(--rt-color-white)}.styles-module_error__JvumD{background-color:var(--rt-color-error);color:var(--rt-color-white)}.styles-module_info__BWdHW{background-color:var(--rt-color-info);color:var(--rt-color-white)}`,type:"base"})});const Hg=0,xz=1,Sz=new F,fE=new BA,Iy=new Mo,hE=new F,xg=new Kr;class Mz{constructor(){this.tolerance=-1,this.faces=[],this.newFaces=[],this.assigned=new dE,this.unassigned=new dE,this.vertices=[]}setFromPoints(e){if(e.length>=4){this.makeEmpty();for(let t=0,r=e.length;t<r;t++)this.vertices.push(new wz(e[t]));this.compute()}return this}setFromObject(e){const t=[];return e.updateMatrixWorld(!0),e.traverse(function(r){const i=r.geometry;if(i!==void 0){const s=i.attributes.position;if(s!==void 0)for(let o=0,a=s.count;o<a;o++){const c=new F;c.fromBufferAttribute(s,o).applyMatrix4(r.matrixWorld),t.push(c)}}}),this.setFromPoints(t)}containsPoint(e){const t=this.faces;for(let r=0,i=t.length;r<i;r++)if(t[r].distanceToPoint(e)>this.tolerance)return!1;return!0}intersectRay(e,t){const r=this.faces;let i=-1/0,s=1/0;for(let o=0,a=r.length;o<a;o++){const c=r[o],f=c.distanceToPoint(e.origin),h=c.normal.dot(e.direction);if(f>0&&h>=0)return null;const d=h!==0?-f/h:0;if(!(d<=0)&&(h>0?s=Math.min(d,s):i=Math.max(d,i),i>s))return null}return i!==-1/0?e.at(i,t):e.at(s,t),t}intersectsRay(e){return this.intersectRay(e,Sz)!==null}makeEmpty(){return this.faces=[],this.vertices=[],this}addVertexToFace(e,t){return e.face=t,t.outside===null?this.assigned.append(e):this.assigned.insertBefore(t.outside,e),t.outside=e,this}removeVertexFromFace(e,t){return e===t.outside&&(e.next!==null&&e.next.face===t?t.outside=e.next:t.outside=null),this.assigned.remove(e),this}removeAllVerticesFromFace(e){if(e.outside!==null){const t=e.outside;let r=e.outside;for(;r.next!==null&&r.next.face===e;)r=r.next;return this.assigned.removeSubList(t,r),t.prev=r.next=null,e.outside=null,t}}deleteFaceVertices(e,t){const r=this.removeAllVerticesFromFace(e);if(r!==void 0)if(t===void 0)this.unassigned.appendChain(r);else{let i=r;do{const s=i.next;t.distanceToPoint(i.point)>this.tolerance?this.addVertexToFace(i,t):this.unassigned.append(i),i=s}while(i!==null)}return this}resolveUnassignedPoints(e){if(this.unassigned.isEmpty()===!1){let t=this.unassigned.first();do{const r=t.next;let i=this.tolerance,s=null;for(let o=0;o<e.length;o++){const a=e[o];if(a.mark===Hg){const c=a.distanceToPoint(t.point);if(c>i&&(i=c,s=a),i>1e3*this.tolerance)break}}s!==null&&this.addVertexToFace(t,s),t=r}while(t!==null)}return this}computeExtremes(){const e=new F,t=new F,r=[],i=[];for(let s=0;s<3;s++)r[s]=i[s]=this.vertices[0];e.copy(this.vertices[0].point),t.copy(this.vertices[0].point);for(let s=0,o=this.vertices.length;s<o;s++){const a=this.vertices[s],c=a.point;for(let f=0;f<3;f++)c.getComponent(f)<e.getComponent(f)&&(e.setComponent(f,c.getComponent(f)),r[f]=a);for(let f=0;f<3;f++)c.getComponent(f)>t.getComponent(f)&&(t.setComponent(f,c.getComponent(f)),i[f]=a)}return this.tolerance=3*Number.EPSILON*(Math.max(Math.abs(e.x),Math.abs(t.x))+Math.max(Math.abs(e.y),Math.abs(t.y))+Math.max(Math.abs(e.z),Math.abs(t.z))),{min:r,max:i}}computeInitialHull(){const e=this.vertices,t=this.computeExtremes(),r=t.min,i=t.max;let s=0,o=0;for(let m=0;m<3;m++){const v=i[m].point.getComponent(m)-r[m].point.getComponent(m);v>s&&(s=v,o=m)}const a=r[o],c=i[o];let f,h;s=0,fE.set(a.point,c.point);for(let m=0,v=this.vertices.length;m<v;m++){const _=e[m];if(_!==a&&_!==c){fE.closestPointToPoint(_.point,!0,hE);const S=hE.distanceToSquared(_.point);S>s&&(s=S,f=_)}}s=-1,Iy.setFromCoplanarPoints(a.point,c.point,f.point);for(let m=0,v=this.vertices.length;m<v;m++){const _=e[m];if(_!==a&&_!==c&&_!==f){const S=Math.abs(Iy.distanceToPoint(_.point));S>s&&(s=S,h=_)}}const d=[];if(Iy.distanceToPoint(h.point)<0){d.push(Ss.create(a,c,f),Ss.create(h,c,a),Ss.create(h,f,c),Ss.create(h,a,f));for(let m=0;m<3;m++){const v=(m+1)%3;d[m+1].getEdge(2).setTwin(d[0].getEdge(v)),d[m+1].getEdge(1).setTwin(d[v+1].getEdge(0))}}else{d.push(Ss.create(a,f,c),Ss.create(h,a,c),Ss.create(h,c,f),Ss.create(h,f,a));for(let m=0;m<3;m++){const v=(m+1)%3;d[m+1].getEdge(2).setTwin(d[0].getEdge((3-m)%3)),d[m+1].getEdge(0).setTwin(d[v+1].getEdge(1))}}for(let m=0;m<4;m++)this.faces.push(d[m]);for(let m=0,v=e.length;m<v;m++){const _=e[m];if(_!==a&&_!==c&&_!==f&&_!==h){s=this.tolerance;let S=null;for(let w=0;w<4;w++){const g=this.faces[w].distanceToPoint(_.point);g>s&&(s=g,S=this.faces[w])}S!==null&&this.addVertexToFace(_,S)}}return this}reindexFaces(){const e=[];for(let t=0;t<this.faces.length;t++){const r=this.faces[t];r.mark===Hg&&e.push(r)}return this.faces=e,this}nextVertexToAdd(){if(this.assigned.isEmpty()===!1){let e,t=0;const r=this.assigned.first().face;let i=r.outside;do{const s=r.distanceToPoint(i.point);s>t&&(t=s,e=i),i=i.next}while(i!==null&&i.face===r);return e}}computeHorizon(e,t,r,i){this.deleteFaceVertices(r),r.mark=xz;let s;t===null?s=t=r.getEdge(0):s=t.next;do{const o=s.twin,a=o.face;a.mark===Hg&&(a.distanceToPoint(e)>this.tolerance?this.computeHorizon(e,o,a,i):i.push(s)),s=s.next}while(s!==t);return this}addAdjoiningFace(e,t){const r=Ss.create(e,t.tail(),t.head());return this.faces.push(r),r.getEdge(-1).setTwin(t.twin),r.getEdge(0)}addNewFaces(e,t){this.newFaces=[];let r=null,i=null;for(let s=0;s<t.length;s++){const o=t[s],a=this.addAdjoiningFace(e,o);r===null?r=a:a.next.setTwin(i),this.newFaces.push(a.face),i=a}return r.next.setTwin(i),this}addVertexToHull(e){const t=[];return this.unassigned.clear(),this.removeVertexFromFace(e,e.face),this.computeHorizon(e.point,null,e.face,t),this.addNewFaces(e,t),this.resolveUnassignedPoints(this.newFaces),this}cleanup(){return this.assigned.clear(),this.unassigned.clear(),this.newFaces=[],this}compute(){let e;for(this.computeInitialHull();(e=this.nextVertexToAdd())!==void 0;)this.addVertexToHull(e);return this.reindexFaces(),this.cleanup(),this}}class Ss{constructor(){this.normal=new F,this.midpoint=new F,this.area=0,this.constant=0,this.outside=null,this.mark=Hg,this.edge=null}static create(e,t,r){const i=new Ss,s=new Ny(e,i),o=new Ny(t,i),a=new Ny(r,i);return s.next=a.prev=o,o.next=s.prev=a,a.next=o.prev=s,i.edge=s,i.compute()}getEdge(e){let t=this.edge;for(;e>0;)t=t.next,e--;for(;e<0;)t=t.prev,e++;return t}compute(){const e=this.edge.tail(),t=this.edge.head(),r=this.edge.next.head();return xg.set(e.point,t.point,r.point),xg.getNormal(this.normal),xg.getMidpoint(this.midpoint),this.area=xg.getArea(),this.constant=this.normal.dot(this.midpoint),this}distanceToPoint(e){return this.normal.dot(e)-this.constant}}class Ny{constructor(e,t){this.vertex=e,this.prev=null,this.next=null,this.twin=null,this.face=t}head(){return this.vertex}tail(){return this.prev?this.prev.vertex:null}length(){const e=this.head(),t=this.tail();return t!==null?t.point.distanceTo(e.point):-1}lengthSquared(){const e=this.head(),t=this.tail();return t!==null?t.point.distanceToSquared(e.point):-1}setTwin(e){return this.twin=e,e.twin=this,this}}class wz{constructor(e){this.point=e,this.prev=null,this.next=null,this.face=null}}class dE{constructor(){this.head=null,this.tail=null}first(){return this.head}last(){return this.tail}clear(){return this.head=this.tail=null,this}insertBefore(e,t){return t.prev=e.prev,t.next=e,t.prev===null?this.head=t:t.prev.next=t,e.prev=t,this}insertAfter(e,t){return t.prev=e,t.next=e.next,t.next===null?this.tail=t:t.next.prev=t,e.next=t,this}append(e){return this.head===null?this.head=e:this.tail.next=e,e.prev=this.tail,e.next=null,this.tail=e,this}appendChain(e){for(this.head===null?this.head=e:this.tail.next=e,e.prev=this.tail;e.next!==null;)e=e.next;return this.tail=e,this}remove(e){return e.prev===null?this.head=e.next:e.prev.next=e.next,e.next===null?this.tail=e.prev:e.next.prev=e.prev,this}removeSubList(e,t){return e.prev===null?this.head=t.next:e.prev.next=t.next,t.next===null?this.tail=e.prev:t.next.prev=e.prev,this}isEmpty(){return this.head===null}}class Ez extends zt{constructor(e=[]){super();const t=[],r=[],s=new Mz().setFromPoints(e).faces;for(let o=0;o<s.length;o++){const a=s[o];let c=a.edge;do{const f=c.head().point;t.push(f.x,f.y,f.z),r.push(a.normal.x,a.normal.y,a.normal.z),c=c.next}while(c!==a.edge)}this.setAttribute("position",new ut(t,3)),this.setAttribute("normal",new ut(r,3))}}var cC={},fC={};(function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.default=void 0;var e={sum:function(i){return i.reduce(function(s,o){return s+o})}},t=e;n.default=t})(fC);function Az(n){return Object.prototype.toString.call(n).slice(8,-1)}var tS=Az;function Cz(n){return!!n&&typeof n=="object"&&n.constructor===Object}var hC=Cz;function Rz(n,e){return Object.prototype.hasOwnProperty.call(n,e)}var nS=Rz,Pz=nS,y0,dC;function Lz(){dC=["toString","toLocaleString","valueOf","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","constructor"],y0=!0;for(var n in{toString:null})y0=!1}function Iz(n,e,t){var r,i=0;y0==null&&Lz();for(r in n)if(pE(e,n,r,t)===!1)break;if(y0)for(var s=n.constructor,o=!!s&&n===s.prototype;(r=dC[i++])&&!((r!=="constructor"||!o&&Pz(n,r))&&n[r]!==Object.prototype[r]&&pE(e,n,r,t)===!1););}function pE(n,e,t,r){return n.call(r,e[t],t,e)}var Nz=Iz,Dz=nS,Uz=Nz;function kz(n,e,t){Uz(n,function(r,i){if(Dz(n,i))return e.call(t,n[i],i,n)})}var J0=kz,Oz=J0;function Fz(n,e){for(var t=0,r=arguments.length,i;++t<r;)i=arguments[t],i!=null&&Oz(i,zz,n);return n}function zz(n,e){this[e]=n}var Bz=Fz,Hz=tS,Vz=hC,Gz=Bz;function Wz(n){switch(Hz(n)){case"Object":return Xz(n);case"Array":return $z(n);case"RegExp":return jz(n);case"Date":return Yz(n);default:return n}}function Xz(n){return Vz(n)?Gz({},n):n}function jz(n){var e="";return e+=n.multiline?"m":"",e+=n.global?"g":"",e+=n.ignoreCase?"i":"",new RegExp(n.source,e)}function Yz(n){return new Date(+n)}function $z(n){return n.slice()}var qz=Wz,Zz=qz,Kz=J0,Jz=tS,Qz=hC;function rS(n,e){switch(Jz(n)){case"Object":return e4(n,e);case"Array":return t4(n,e);default:return Zz(n)}}function e4(n,e){if(Qz(n)){var t={};return Kz(n,function(r,i){this[i]=rS(r,e)},t),t}else return e?e(n):n}function t4(n,e){for(var t=[],r=-1,i=n.length;++r<i;)t[r]=rS(n[r],e);return t}var n4=rS;function r4(n,e){return n===e?n!==0||1/n===1/e:n!==n&&e!==e}var iS=r4,i4=tS;function s4(n,e){return i4(n)===e}var pC=s4,o4=pC;function a4(n){return o4(n,"Object")}var mC=a4,l4=pC,u4=Array.isArray||function(n){return l4(n,"Array")},sS=u4;function c4(n){return n}var f4=c4;function h4(n){return function(e){return e[n]}}var d4=h4,p4=J0,mE=sS;function m4(n,e){for(var t=-1,r=n.length;++t<r;)if(oS(n[t],e))return!0;return!1}function g4(n,e){for(var t=-1,r=e.length;++t<r;)if(!m4(n,e[t]))return!1;return!0}function v4(n,e){var t=!0;return p4(e,function(r,i){if(!oS(n[i],r))return t=!1}),t}function oS(n,e){return n&&typeof n=="object"&&e&&typeof e=="object"?mE(n)&&mE(e)?g4(n,e):v4(n,e):n===e}var y4=oS,_4=f4,x4=d4,S4=y4;function M4(n,e){if(n==null)return _4;switch(typeof n){case"function":return typeof e<"u"?function(t,r,i){return n.call(e,t,r,i)}:n;case"object":return function(t){return S4(t,n)};case"string":case"number":return x4(n)}}var gC=M4,w4=J0,E4=gC;function T4(n,e,t){e=E4(e,t);var r=!0;return w4(n,function(i,s){if(!e(i,s,n))return r=!1,!1}),r}var b4=T4,vC=nS,gE=b4,vE=mC,A4=iS;function C4(n){return function(e,t){return vC(this,t)&&n(e,this[t])}}function R4(n,e){return vC(this,e)}function P4(n,e,t){return t=t||A4,!vE(n)||!vE(e)?t(n,e):gE(n,C4(t),e)&&gE(e,R4,n)}var L4=P4,I4=gC;function N4(n,e,t){e=I4(e,t);var r=!0;if(n==null)return r;for(var i=-1,s=n.length;++i<s;)if(!e(n[i],i,n)){r=!1;break}return r}var D4=N4,U4=iS,yE=sS,k4=D4;function O4(n,e,t){return t=t||U4,!yE(n)||!yE(e)?t(n,e):n.length!==e.length?!1:k4(n,F4(t),e)}function F4(n){return function(e,t){return t in this&&n(e,this[t])}}var z4=O4,B4=iS,_E=mC,xE=sS,H4=L4,V4=z4;function yC(n,e,t){t=t||B4;var r=_E(n)&&_E(e),i=!r&&xE(n)&&xE(e);if(!r&&!i)return t(n,e);function s(a,c){return yC(a,c,t)}var o=r?H4:V4;return o(n,e,s)}var G4=yC,_C={exports:{}};/**
  * chroma.js - JavaScript library for color conversions
  *
  * Copyright (c) 2011-2019, Gregor Aisch
@@ -3588,4 +3588,413 @@ No matching component was found for:
  *
  * @preserve
  */(function(n,e){(function(t,r){n.exports=r()})(Ls,function(){for(var t=function(T,A,I){return A===void 0&&(A=0),I===void 0&&(I=1),T<A?A:T>I?I:T},r=t,i=function(T){T._clipped=!1,T._unclipped=T.slice(0);for(var A=0;A<=3;A++)A<3?((T[A]<0||T[A]>255)&&(T._clipped=!0),T[A]=r(T[A],0,255)):A===3&&(T[A]=r(T[A],0,1));return T},s={},o=0,a=["Boolean","Number","String","Function","Array","Date","RegExp","Undefined","Null"];o<a.length;o+=1){var c=a[o];s["[object "+c+"]"]=c.toLowerCase()}var f=function(T){return s[Object.prototype.toString.call(T)]||"object"},h=f,d=function(T,A){return A===void 0&&(A=null),T.length>=3?Array.prototype.slice.call(T):h(T[0])=="object"&&A?A.split("").filter(function(I){return T[0][I]!==void 0}).map(function(I){return T[0][I]}):T[0]},m=f,v=function(T){if(T.length<2)return null;var A=T.length-1;return m(T[A])=="string"?T[A].toLowerCase():null},_=Math.PI,S={clip_rgb:i,limit:t,type:f,unpack:d,last:v,PI:_,TWOPI:_*2,PITHIRD:_/3,DEG2RAD:_/180,RAD2DEG:180/_},w={format:{},autodetect:[]},g=S.last,x=S.clip_rgb,M=S.type,b=w,C=function(){for(var A=[],I=arguments.length;I--;)A[I]=arguments[I];var z=this;if(M(A[0])==="object"&&A[0].constructor&&A[0].constructor===this.constructor)return A[0];var $=g(A),K=!1;if(!$){K=!0,b.sorted||(b.autodetect=b.autodetect.sort(function(Ue,$e){return $e.p-Ue.p}),b.sorted=!0);for(var j=0,ae=b.autodetect;j<ae.length;j+=1){var ie=ae[j];if($=ie.test.apply(ie,A),$)break}}if(b.format[$]){var we=b.format[$].apply(null,K?A:A.slice(0,-1));z._rgb=x(we)}else throw new Error("unknown format: "+A);z._rgb.length===3&&z._rgb.push(1)};C.prototype.toString=function(){return M(this.hex)=="function"?this.hex():"["+this._rgb.join(",")+"]"};var P=C,N=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(N.Color,[null].concat(T)))};N.Color=P,N.version="2.4.2";var D=N,L=S.unpack,U=Math.max,X=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=L(T,"rgb"),z=I[0],$=I[1],K=I[2];z=z/255,$=$/255,K=K/255;var j=1-U(z,U($,K)),ae=j<1?1/(1-j):0,ie=(1-z-j)*ae,we=(1-$-j)*ae,Ue=(1-K-j)*ae;return[ie,we,Ue,j]},ee=X,Z=S.unpack,re=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];T=Z(T,"cmyk");var I=T[0],z=T[1],$=T[2],K=T[3],j=T.length>4?T[4]:1;return K===1?[0,0,0,j]:[I>=1?0:255*(1-I)*(1-K),z>=1?0:255*(1-z)*(1-K),$>=1?0:255*(1-$)*(1-K),j]},se=re,ge=D,ce=P,k=w,W=S.unpack,G=S.type,fe=ee;ce.prototype.cmyk=function(){return fe(this._rgb)},ge.cmyk=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(ce,[null].concat(T,["cmyk"])))},k.format.cmyk=se,k.autodetect.push({p:2,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T=W(T,"cmyk"),G(T)==="array"&&T.length===4)return"cmyk"}});var te=S.unpack,oe=S.last,ue=function(T){return Math.round(T*100)/100},Ne=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=te(T,"hsla"),z=oe(T)||"lsa";return I[0]=ue(I[0]||0),I[1]=ue(I[1]*100)+"%",I[2]=ue(I[2]*100)+"%",z==="hsla"||I.length>3&&I[3]<1?(I[3]=I.length>3?I[3]:1,z="hsla"):I.length=3,z+"("+I.join(",")+")"},Le=Ne,Y=S.unpack,ot=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];T=Y(T,"rgba");var I=T[0],z=T[1],$=T[2];I/=255,z/=255,$/=255;var K=Math.min(I,z,$),j=Math.max(I,z,$),ae=(j+K)/2,ie,we;return j===K?(ie=0,we=Number.NaN):ie=ae<.5?(j-K)/(j+K):(j-K)/(2-j-K),I==j?we=(z-$)/(j-K):z==j?we=2+($-I)/(j-K):$==j&&(we=4+(I-z)/(j-K)),we*=60,we<0&&(we+=360),T.length>3&&T[3]!==void 0?[we,ie,ae,T[3]]:[we,ie,ae]},lt=ot,Pe=S.unpack,Oe=S.last,Ee=Le,de=lt,be=Math.round,je=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=Pe(T,"rgba"),z=Oe(T)||"rgb";return z.substr(0,3)=="hsl"?Ee(de(I),z):(I[0]=be(I[0]),I[1]=be(I[1]),I[2]=be(I[2]),(z==="rgba"||I.length>3&&I[3]<1)&&(I[3]=I.length>3?I[3]:1,z="rgba"),z+"("+I.slice(0,z==="rgb"?3:4).join(",")+")")},We=je,nt=S.unpack,at=Math.round,Je=function(){for(var T,A=[],I=arguments.length;I--;)A[I]=arguments[I];A=nt(A,"hsl");var z=A[0],$=A[1],K=A[2],j,ae,ie;if($===0)j=ae=ie=K*255;else{var we=[0,0,0],Ue=[0,0,0],$e=K<.5?K*(1+$):K+$-K*$,ke=2*K-$e,et=z/360;we[0]=et+1/3,we[1]=et,we[2]=et-1/3;for(var Qe=0;Qe<3;Qe++)we[Qe]<0&&(we[Qe]+=1),we[Qe]>1&&(we[Qe]-=1),6*we[Qe]<1?Ue[Qe]=ke+($e-ke)*6*we[Qe]:2*we[Qe]<1?Ue[Qe]=$e:3*we[Qe]<2?Ue[Qe]=ke+($e-ke)*(2/3-we[Qe])*6:Ue[Qe]=ke;T=[at(Ue[0]*255),at(Ue[1]*255),at(Ue[2]*255)],j=T[0],ae=T[1],ie=T[2]}return A.length>3?[j,ae,ie,A[3]]:[j,ae,ie,1]},gt=Je,Nt=gt,V=w,O=/^rgb\(\s*(-?\d+),\s*(-?\d+)\s*,\s*(-?\d+)\s*\)$/,me=/^rgba\(\s*(-?\d+),\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*([01]|[01]?\.\d+)\)$/,De=/^rgb\(\s*(-?\d+(?:\.\d+)?)%,\s*(-?\d+(?:\.\d+)?)%\s*,\s*(-?\d+(?:\.\d+)?)%\s*\)$/,ze=/^rgba\(\s*(-?\d+(?:\.\d+)?)%,\s*(-?\d+(?:\.\d+)?)%\s*,\s*(-?\d+(?:\.\d+)?)%\s*,\s*([01]|[01]?\.\d+)\)$/,Ve=/^hsl\(\s*(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?)%\s*,\s*(-?\d+(?:\.\d+)?)%\s*\)$/,vt=/^hsla\(\s*(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?)%\s*,\s*(-?\d+(?:\.\d+)?)%\s*,\s*([01]|[01]?\.\d+)\)$/,qe=Math.round,Se=function(T){T=T.toLowerCase().trim();var A;if(V.format.named)try{return V.format.named(T)}catch{}if(A=T.match(O)){for(var I=A.slice(1,4),z=0;z<3;z++)I[z]=+I[z];return I[3]=1,I}if(A=T.match(me)){for(var $=A.slice(1,5),K=0;K<4;K++)$[K]=+$[K];return $}if(A=T.match(De)){for(var j=A.slice(1,4),ae=0;ae<3;ae++)j[ae]=qe(j[ae]*2.55);return j[3]=1,j}if(A=T.match(ze)){for(var ie=A.slice(1,5),we=0;we<3;we++)ie[we]=qe(ie[we]*2.55);return ie[3]=+ie[3],ie}if(A=T.match(Ve)){var Ue=A.slice(1,4);Ue[1]*=.01,Ue[2]*=.01;var $e=Nt(Ue);return $e[3]=1,$e}if(A=T.match(vt)){var ke=A.slice(1,4);ke[1]*=.01,ke[2]*=.01;var et=Nt(ke);return et[3]=+A[4],et}};Se.test=function(T){return O.test(T)||me.test(T)||De.test(T)||ze.test(T)||Ve.test(T)||vt.test(T)};var rt=Se,q=D,_e=P,Ce=w,He=S.type,pt=We,Et=rt;_e.prototype.css=function(T){return pt(this._rgb,T)},q.css=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(_e,[null].concat(T,["css"])))},Ce.format.css=Et,Ce.autodetect.push({p:5,test:function(T){for(var A=[],I=arguments.length-1;I-- >0;)A[I]=arguments[I+1];if(!A.length&&He(T)==="string"&&Et.test(T))return"css"}});var cn=P,J=D,ve=w,Ie=S.unpack;ve.format.gl=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=Ie(T,"rgba");return I[0]*=255,I[1]*=255,I[2]*=255,I},J.gl=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(cn,[null].concat(T,["gl"])))},cn.prototype.gl=function(){var T=this._rgb;return[T[0]/255,T[1]/255,T[2]/255,T[3]]};var Ke=S.unpack,ct=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=Ke(T,"rgb"),z=I[0],$=I[1],K=I[2],j=Math.min(z,$,K),ae=Math.max(z,$,K),ie=ae-j,we=ie*100/255,Ue=j/(255-ie)*100,$e;return ie===0?$e=Number.NaN:(z===ae&&($e=($-K)/ie),$===ae&&($e=2+(K-z)/ie),K===ae&&($e=4+(z-$)/ie),$e*=60,$e<0&&($e+=360)),[$e,we,Ue]},rn=ct,sn=S.unpack,er=Math.floor,gi=function(){for(var T,A,I,z,$,K,j=[],ae=arguments.length;ae--;)j[ae]=arguments[ae];j=sn(j,"hcg");var ie=j[0],we=j[1],Ue=j[2],$e,ke,et;Ue=Ue*255;var Qe=we*255;if(we===0)$e=ke=et=Ue;else{ie===360&&(ie=0),ie>360&&(ie-=360),ie<0&&(ie+=360),ie/=60;var bt=er(ie),Lt=ie-bt,Yt=Ue*(1-we),Jt=Yt+Qe*(1-Lt),nr=Yt+Qe*Lt,qn=Yt+Qe;switch(bt){case 0:T=[qn,nr,Yt],$e=T[0],ke=T[1],et=T[2];break;case 1:A=[Jt,qn,Yt],$e=A[0],ke=A[1],et=A[2];break;case 2:I=[Yt,qn,nr],$e=I[0],ke=I[1],et=I[2];break;case 3:z=[Yt,Jt,qn],$e=z[0],ke=z[1],et=z[2];break;case 4:$=[nr,Yt,qn],$e=$[0],ke=$[1],et=$[2];break;case 5:K=[qn,Yt,Jt],$e=K[0],ke=K[1],et=K[2];break}}return[$e,ke,et,j.length>3?j[3]:1]},xn=gi,_r=S.unpack,ri=S.type,Fo=D,Wa=P,Xa=w,ja=rn;Wa.prototype.hcg=function(){return ja(this._rgb)},Fo.hcg=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(Wa,[null].concat(T,["hcg"])))},Xa.format.hcg=xn,Xa.autodetect.push({p:1,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T=_r(T,"hcg"),ri(T)==="array"&&T.length===3)return"hcg"}});var Tf=S.unpack,B=S.last,he=Math.round,Me=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=Tf(T,"rgba"),z=I[0],$=I[1],K=I[2],j=I[3],ae=B(T)||"auto";j===void 0&&(j=1),ae==="auto"&&(ae=j<1?"rgba":"rgb"),z=he(z),$=he($),K=he(K);var ie=z<<16|$<<8|K,we="000000"+ie.toString(16);we=we.substr(we.length-6);var Ue="0"+he(j*255).toString(16);switch(Ue=Ue.substr(Ue.length-2),ae.toLowerCase()){case"rgba":return"#"+we+Ue;case"argb":return"#"+Ue+we;default:return"#"+we}},le=Me,Te=/^#?([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$/,mt=/^#?([A-Fa-f0-9]{8}|[A-Fa-f0-9]{4})$/,_t=function(T){if(T.match(Te)){(T.length===4||T.length===7)&&(T=T.substr(1)),T.length===3&&(T=T.split(""),T=T[0]+T[0]+T[1]+T[1]+T[2]+T[2]);var A=parseInt(T,16),I=A>>16,z=A>>8&255,$=A&255;return[I,z,$,1]}if(T.match(mt)){(T.length===5||T.length===9)&&(T=T.substr(1)),T.length===4&&(T=T.split(""),T=T[0]+T[0]+T[1]+T[1]+T[2]+T[2]+T[3]+T[3]);var K=parseInt(T,16),j=K>>24&255,ae=K>>16&255,ie=K>>8&255,we=Math.round((K&255)/255*100)/100;return[j,ae,ie,we]}throw new Error("unknown hex color: "+T)},Mt=_t,Tt=D,Pt=P,Dt=S.type,Ut=w,on=le;Pt.prototype.hex=function(T){return on(this._rgb,T)},Tt.hex=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(Pt,[null].concat(T,["hex"])))},Ut.format.hex=Mt,Ut.autodetect.push({p:4,test:function(T){for(var A=[],I=arguments.length-1;I-- >0;)A[I]=arguments[I+1];if(!A.length&&Dt(T)==="string"&&[3,4,5,6,7,8,9].indexOf(T.length)>=0)return"hex"}});var or=S.unpack,Pr=S.TWOPI,vi=Math.min,gn=Math.sqrt,Bt=Math.acos,ro=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=or(T,"rgb"),z=I[0],$=I[1],K=I[2];z/=255,$/=255,K/=255;var j,ae=vi(z,$,K),ie=(z+$+K)/3,we=ie>0?1-ae/ie:0;return we===0?j=NaN:(j=(z-$+(z-K))/2,j/=gn((z-$)*(z-$)+(z-K)*($-K)),j=Bt(j),K>$&&(j=Pr-j),j/=Pr),[j*360,we,ie]},zn=ro,yi=S.unpack,_i=S.limit,Yn=S.TWOPI,Kt=S.PITHIRD,wt=Math.cos,fr=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];T=yi(T,"hsi");var I=T[0],z=T[1],$=T[2],K,j,ae;return isNaN(I)&&(I=0),isNaN(z)&&(z=0),I>360&&(I-=360),I<0&&(I+=360),I/=360,I<1/3?(ae=(1-z)/3,K=(1+z*wt(Yn*I)/wt(Kt-Yn*I))/3,j=1-(ae+K)):I<2/3?(I-=1/3,K=(1-z)/3,j=(1+z*wt(Yn*I)/wt(Kt-Yn*I))/3,ae=1-(K+j)):(I-=2/3,j=(1-z)/3,ae=(1+z*wt(Yn*I)/wt(Kt-Yn*I))/3,K=1-(j+ae)),K=_i($*K*3),j=_i($*j*3),ae=_i($*ae*3),[K*255,j*255,ae*255,T.length>3?T[3]:1]},Bn=fr,hn=S.unpack,xi=S.type,Os=D,tr=P,Ya=w,fp=zn;tr.prototype.hsi=function(){return fp(this._rgb)},Os.hsi=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(tr,[null].concat(T,["hsi"])))},Ya.format.hsi=Bn,Ya.autodetect.push({p:2,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T=hn(T,"hsi"),xi(T)==="array"&&T.length===3)return"hsi"}});var hp=S.unpack,fu=S.type,dp=D,ii=P,pp=w,Q0=lt;ii.prototype.hsl=function(){return Q0(this._rgb)},dp.hsl=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(ii,[null].concat(T,["hsl"])))},pp.format.hsl=gt,pp.autodetect.push({p:2,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T=hp(T,"hsl"),fu(T)==="array"&&T.length===3)return"hsl"}});var ev=S.unpack,hu=Math.min,du=Math.max,$a=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];T=ev(T,"rgb");var I=T[0],z=T[1],$=T[2],K=hu(I,z,$),j=du(I,z,$),ae=j-K,ie,we,Ue;return Ue=j/255,j===0?(ie=Number.NaN,we=0):(we=ae/j,I===j&&(ie=(z-$)/ae),z===j&&(ie=2+($-I)/ae),$===j&&(ie=4+(I-z)/ae),ie*=60,ie<0&&(ie+=360)),[ie,we,Ue]},pu=$a,tv=S.unpack,nv=Math.floor,bf=function(){for(var T,A,I,z,$,K,j=[],ae=arguments.length;ae--;)j[ae]=arguments[ae];j=tv(j,"hsv");var ie=j[0],we=j[1],Ue=j[2],$e,ke,et;if(Ue*=255,we===0)$e=ke=et=Ue;else{ie===360&&(ie=0),ie>360&&(ie-=360),ie<0&&(ie+=360),ie/=60;var Qe=nv(ie),bt=ie-Qe,Lt=Ue*(1-we),Yt=Ue*(1-we*bt),Jt=Ue*(1-we*(1-bt));switch(Qe){case 0:T=[Ue,Jt,Lt],$e=T[0],ke=T[1],et=T[2];break;case 1:A=[Yt,Ue,Lt],$e=A[0],ke=A[1],et=A[2];break;case 2:I=[Lt,Ue,Jt],$e=I[0],ke=I[1],et=I[2];break;case 3:z=[Lt,Yt,Ue],$e=z[0],ke=z[1],et=z[2];break;case 4:$=[Jt,Lt,Ue],$e=$[0],ke=$[1],et=$[2];break;case 5:K=[Ue,Lt,Yt],$e=K[0],ke=K[1],et=K[2];break}}return[$e,ke,et,j.length>3?j[3]:1]},Af=bf,qa=S.unpack,rv=S.type,Cf=D,Zt=P,Rf=w,Pf=pu;Zt.prototype.hsv=function(){return Pf(this._rgb)},Cf.hsv=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(Zt,[null].concat(T,["hsv"])))},Rf.format.hsv=Af,Rf.autodetect.push({p:2,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T=qa(T,"hsv"),rv(T)==="array"&&T.length===3)return"hsv"}});var Za={Kn:18,Xn:.95047,Yn:1,Zn:1.08883,t0:.137931034,t1:.206896552,t2:.12841855,t3:.008856452},zo=Za,iv=S.unpack,$n=Math.pow,Lf=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=iv(T,"rgb"),z=I[0],$=I[1],K=I[2],j=sv(z,$,K),ae=j[0],ie=j[1],we=j[2],Ue=116*ie-16;return[Ue<0?0:Ue,500*(ae-ie),200*(ie-we)]},If=function(T){return(T/=255)<=.04045?T/12.92:$n((T+.055)/1.055,2.4)},Ka=function(T){return T>zo.t3?$n(T,1/3):T/zo.t2+zo.t0},sv=function(T,A,I){T=If(T),A=If(A),I=If(I);var z=Ka((.4124564*T+.3575761*A+.1804375*I)/zo.Xn),$=Ka((.2126729*T+.7151522*A+.072175*I)/zo.Yn),K=Ka((.0193339*T+.119192*A+.9503041*I)/zo.Zn);return[z,$,K]},Ja=Lf,xr=Za,ov=S.unpack,av=Math.pow,Oi=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];T=ov(T,"lab");var I=T[0],z=T[1],$=T[2],K,j,ae,ie,we,Ue;return j=(I+16)/116,K=isNaN(z)?j:j+z/500,ae=isNaN($)?j:j-$/200,j=xr.Yn*Bo(j),K=xr.Xn*Bo(K),ae=xr.Zn*Bo(ae),ie=Si(3.2404542*K-1.5371385*j-.4985314*ae),we=Si(-.969266*K+1.8760108*j+.041556*ae),Ue=Si(.0556434*K-.2040259*j+1.0572252*ae),[ie,we,Ue,T.length>3?T[3]:1]},Si=function(T){return 255*(T<=.00304?12.92*T:1.055*av(T,1/2.4)-.055)},Bo=function(T){return T>xr.t1?T*T*T:xr.t2*(T-xr.t0)},mu=Oi,mp=S.unpack,lv=S.type,Fi=D,gp=P,Qa=w,uv=Ja;gp.prototype.lab=function(){return uv(this._rgb)},Fi.lab=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(gp,[null].concat(T,["lab"])))},Qa.format.lab=mu,Qa.autodetect.push({p:2,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T=mp(T,"lab"),lv(T)==="array"&&T.length===3)return"lab"}});var Mi=S.unpack,gu=S.RAD2DEG,vu=Math.sqrt,Ho=Math.atan2,Nf=Math.round,Df=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=Mi(T,"lab"),z=I[0],$=I[1],K=I[2],j=vu($*$+K*K),ae=(Ho(K,$)*gu+360)%360;return Nf(j*1e4)===0&&(ae=Number.NaN),[z,j,ae]},Uf=Df,kf=S.unpack,Of=Ja,Vo=Uf,si=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=kf(T,"rgb"),z=I[0],$=I[1],K=I[2],j=Of(z,$,K),ae=j[0],ie=j[1],we=j[2];return Vo(ae,ie,we)},zi=si,Fs=S.unpack,Ff=S.DEG2RAD,vp=Math.sin,os=Math.cos,zs=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=Fs(T,"lch"),z=I[0],$=I[1],K=I[2];return isNaN(K)&&(K=0),K=K*Ff,[z,os(K)*$,vp(K)*$]},el=zs,yp=S.unpack,yu=el,_p=mu,xp=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];T=yp(T,"lch");var I=T[0],z=T[1],$=T[2],K=yu(I,z,$),j=K[0],ae=K[1],ie=K[2],we=_p(j,ae,ie),Ue=we[0],$e=we[1],ke=we[2];return[Ue,$e,ke,T.length>3?T[3]:1]},_u=xp,xu=S.unpack,Sp=_u,Mp=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=xu(T,"hcl").reverse();return Sp.apply(void 0,I)},wp=Mp,zf=S.unpack,Go=S.type,io=D,so=P,Wo=w,Vr=zi;so.prototype.lch=function(){return Vr(this._rgb)},so.prototype.hcl=function(){return Vr(this._rgb).reverse()},io.lch=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(so,[null].concat(T,["lch"])))},io.hcl=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(so,[null].concat(T,["hcl"])))},Wo.format.lch=_u,Wo.format.hcl=wp,["lch","hcl"].forEach(function(T){return Wo.autodetect.push({p:2,test:function(){for(var A=[],I=arguments.length;I--;)A[I]=arguments[I];if(A=zf(A,T),Go(A)==="array"&&A.length===3)return T}})});var oi={aliceblue:"#f0f8ff",antiquewhite:"#faebd7",aqua:"#00ffff",aquamarine:"#7fffd4",azure:"#f0ffff",beige:"#f5f5dc",bisque:"#ffe4c4",black:"#000000",blanchedalmond:"#ffebcd",blue:"#0000ff",blueviolet:"#8a2be2",brown:"#a52a2a",burlywood:"#deb887",cadetblue:"#5f9ea0",chartreuse:"#7fff00",chocolate:"#d2691e",coral:"#ff7f50",cornflower:"#6495ed",cornflowerblue:"#6495ed",cornsilk:"#fff8dc",crimson:"#dc143c",cyan:"#00ffff",darkblue:"#00008b",darkcyan:"#008b8b",darkgoldenrod:"#b8860b",darkgray:"#a9a9a9",darkgreen:"#006400",darkgrey:"#a9a9a9",darkkhaki:"#bdb76b",darkmagenta:"#8b008b",darkolivegreen:"#556b2f",darkorange:"#ff8c00",darkorchid:"#9932cc",darkred:"#8b0000",darksalmon:"#e9967a",darkseagreen:"#8fbc8f",darkslateblue:"#483d8b",darkslategray:"#2f4f4f",darkslategrey:"#2f4f4f",darkturquoise:"#00ced1",darkviolet:"#9400d3",deeppink:"#ff1493",deepskyblue:"#00bfff",dimgray:"#696969",dimgrey:"#696969",dodgerblue:"#1e90ff",firebrick:"#b22222",floralwhite:"#fffaf0",forestgreen:"#228b22",fuchsia:"#ff00ff",gainsboro:"#dcdcdc",ghostwhite:"#f8f8ff",gold:"#ffd700",goldenrod:"#daa520",gray:"#808080",green:"#008000",greenyellow:"#adff2f",grey:"#808080",honeydew:"#f0fff0",hotpink:"#ff69b4",indianred:"#cd5c5c",indigo:"#4b0082",ivory:"#fffff0",khaki:"#f0e68c",laserlemon:"#ffff54",lavender:"#e6e6fa",lavenderblush:"#fff0f5",lawngreen:"#7cfc00",lemonchiffon:"#fffacd",lightblue:"#add8e6",lightcoral:"#f08080",lightcyan:"#e0ffff",lightgoldenrod:"#fafad2",lightgoldenrodyellow:"#fafad2",lightgray:"#d3d3d3",lightgreen:"#90ee90",lightgrey:"#d3d3d3",lightpink:"#ffb6c1",lightsalmon:"#ffa07a",lightseagreen:"#20b2aa",lightskyblue:"#87cefa",lightslategray:"#778899",lightslategrey:"#778899",lightsteelblue:"#b0c4de",lightyellow:"#ffffe0",lime:"#00ff00",limegreen:"#32cd32",linen:"#faf0e6",magenta:"#ff00ff",maroon:"#800000",maroon2:"#7f0000",maroon3:"#b03060",mediumaquamarine:"#66cdaa",mediumblue:"#0000cd",mediumorchid:"#ba55d3",mediumpurple:"#9370db",mediumseagreen:"#3cb371",mediumslateblue:"#7b68ee",mediumspringgreen:"#00fa9a",mediumturquoise:"#48d1cc",mediumvioletred:"#c71585",midnightblue:"#191970",mintcream:"#f5fffa",mistyrose:"#ffe4e1",moccasin:"#ffe4b5",navajowhite:"#ffdead",navy:"#000080",oldlace:"#fdf5e6",olive:"#808000",olivedrab:"#6b8e23",orange:"#ffa500",orangered:"#ff4500",orchid:"#da70d6",palegoldenrod:"#eee8aa",palegreen:"#98fb98",paleturquoise:"#afeeee",palevioletred:"#db7093",papayawhip:"#ffefd5",peachpuff:"#ffdab9",peru:"#cd853f",pink:"#ffc0cb",plum:"#dda0dd",powderblue:"#b0e0e6",purple:"#800080",purple2:"#7f007f",purple3:"#a020f0",rebeccapurple:"#663399",red:"#ff0000",rosybrown:"#bc8f8f",royalblue:"#4169e1",saddlebrown:"#8b4513",salmon:"#fa8072",sandybrown:"#f4a460",seagreen:"#2e8b57",seashell:"#fff5ee",sienna:"#a0522d",silver:"#c0c0c0",skyblue:"#87ceeb",slateblue:"#6a5acd",slategray:"#708090",slategrey:"#708090",snow:"#fffafa",springgreen:"#00ff7f",steelblue:"#4682b4",tan:"#d2b48c",teal:"#008080",thistle:"#d8bfd8",tomato:"#ff6347",turquoise:"#40e0d0",violet:"#ee82ee",wheat:"#f5deb3",white:"#ffffff",whitesmoke:"#f5f5f5",yellow:"#ffff00",yellowgreen:"#9acd32"},Bs=oi,as=P,Bi=w,oo=S.type,Xo=Bs,Bf=Mt,Hf=le;as.prototype.name=function(){for(var T=Hf(this._rgb,"rgb"),A=0,I=Object.keys(Xo);A<I.length;A+=1){var z=I[A];if(Xo[z]===T)return z.toLowerCase()}return T},Bi.format.named=function(T){if(T=T.toLowerCase(),Xo[T])return Bf(Xo[T]);throw new Error("unknown color name: "+T)},Bi.autodetect.push({p:5,test:function(T){for(var A=[],I=arguments.length-1;I-- >0;)A[I]=arguments[I+1];if(!A.length&&oo(T)==="string"&&Xo[T.toLowerCase()])return"named"}});var Gr=S.unpack,Wr=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=Gr(T,"rgb"),z=I[0],$=I[1],K=I[2];return(z<<16)+($<<8)+K},Sn=Wr,tl=S.type,wi=function(T){if(tl(T)=="number"&&T>=0&&T<=16777215){var A=T>>16,I=T>>8&255,z=T&255;return[A,I,z,1]}throw new Error("unknown num color: "+T)},Ep=wi,Tp=D,Su=P,Mu=w,bp=S.type,nl=Sn;Su.prototype.num=function(){return nl(this._rgb)},Tp.num=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(Su,[null].concat(T,["num"])))},Mu.format.num=Ep,Mu.autodetect.push({p:5,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T.length===1&&bp(T[0])==="number"&&T[0]>=0&&T[0]<=16777215)return"num"}});var jo=D,rl=P,Yo=w,il=S.unpack,Vf=S.type,Gf=Math.round;rl.prototype.rgb=function(T){return T===void 0&&(T=!0),T===!1?this._rgb.slice(0,3):this._rgb.slice(0,3).map(Gf)},rl.prototype.rgba=function(T){return T===void 0&&(T=!0),this._rgb.slice(0,4).map(function(A,I){return I<3?T===!1?A:Gf(A):A})},jo.rgb=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(rl,[null].concat(T,["rgb"])))},Yo.format.rgb=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=il(T,"rgba");return I[3]===void 0&&(I[3]=1),I},Yo.autodetect.push({p:3,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T=il(T,"rgba"),Vf(T)==="array"&&(T.length===3||T.length===4&&Vf(T[3])=="number"&&T[3]>=0&&T[3]<=1))return"rgb"}});var ls=Math.log,Ap=function(T){var A=T/100,I,z,$;return A<66?(I=255,z=A<6?0:-155.25485562709179-.44596950469579133*(z=A-2)+104.49216199393888*ls(z),$=A<20?0:-254.76935184120902+.8274096064007395*($=A-10)+115.67994401066147*ls($)):(I=351.97690566805693+.114206453784165*(I=A-55)-40.25366309332127*ls(I),z=325.4494125711974+.07943456536662342*(z=A-50)-28.0852963507957*ls(z),$=255),[I,z,$,1]},$o=Ap,ai=$o,sl=S.unpack,qo=Math.round,Hi=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];for(var I=sl(T,"rgb"),z=I[0],$=I[2],K=1e3,j=4e4,ae=.4,ie;j-K>ae;){ie=(j+K)*.5;var we=ai(ie);we[2]/we[0]>=$/z?j=ie:K=ie}return qo(ie)},Wf=Hi,Hs=D,ol=P,al=w,Tn=Wf;ol.prototype.temp=ol.prototype.kelvin=ol.prototype.temperature=function(){return Tn(this._rgb)},Hs.temp=Hs.kelvin=Hs.temperature=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(ol,[null].concat(T,["temp"])))},al.format.temp=al.format.kelvin=al.format.temperature=$o;var wu=S.unpack,ll=Math.cbrt,Xf=Math.pow,Eu=Math.sign,li=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=wu(T,"rgb"),z=I[0],$=I[1],K=I[2],j=[Mn(z/255),Mn($/255),Mn(K/255)],ae=j[0],ie=j[1],we=j[2],Ue=ll(.4122214708*ae+.5363325363*ie+.0514459929*we),$e=ll(.2119034982*ae+.6806995451*ie+.1073969566*we),ke=ll(.0883024619*ae+.2817188376*ie+.6299787005*we);return[.2104542553*Ue+.793617785*$e-.0040720468*ke,1.9779984951*Ue-2.428592205*$e+.4505937099*ke,.0259040371*Ue+.7827717662*$e-.808675766*ke]},ao=li;function Mn(T){var A=Math.abs(T);return A<.04045?T/12.92:(Eu(T)||1)*Xf((A+.055)/1.055,2.4)}var hr=S.unpack,In=Math.pow,Tu=Math.sign,ul=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];T=hr(T,"lab");var I=T[0],z=T[1],$=T[2],K=In(I+.3963377774*z+.2158037573*$,3),j=In(I-.1055613458*z-.0638541728*$,3),ae=In(I-.0894841775*z-1.291485548*$,3);return[255*jf(4.0767416621*K-3.3077115913*j+.2309699292*ae),255*jf(-1.2684380046*K+2.6097574011*j-.3413193965*ae),255*jf(-.0041960863*K-.7034186147*j+1.707614701*ae),T.length>3?T[3]:1]},Zo=ul;function jf(T){var A=Math.abs(T);return A>.0031308?(Tu(T)||1)*(1.055*In(A,1/2.4)-.055):T*12.92}var dr=S.unpack,Yf=S.type,$f=D,bu=P,Vi=w,Gi=ao;bu.prototype.oklab=function(){return Gi(this._rgb)},$f.oklab=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(bu,[null].concat(T,["oklab"])))},Vi.format.oklab=Zo,Vi.autodetect.push({p:3,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T=dr(T,"oklab"),Yf(T)==="array"&&T.length===3)return"oklab"}});var lo=S.unpack,Au=ao,Cu=Uf,Cp=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];var I=lo(T,"rgb"),z=I[0],$=I[1],K=I[2],j=Au(z,$,K),ae=j[0],ie=j[1],we=j[2];return Cu(ae,ie,we)},Rp=Cp,Pp=S.unpack,Lp=el,Ip=Zo,Np=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];T=Pp(T,"lch");var I=T[0],z=T[1],$=T[2],K=Lp(I,z,$),j=K[0],ae=K[1],ie=K[2],we=Ip(j,ae,ie),Ue=we[0],$e=we[1],ke=we[2];return[Ue,$e,ke,T.length>3?T[3]:1]},qf=Np,cl=S.unpack,Dp=S.type,Ru=D,fl=P,Pu=w,hl=Rp;fl.prototype.oklch=function(){return hl(this._rgb)},Ru.oklch=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];return new(Function.prototype.bind.apply(fl,[null].concat(T,["oklch"])))},Pu.format.oklch=qf,Pu.autodetect.push({p:3,test:function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];if(T=cl(T,"oklch"),Dp(T)==="array"&&T.length===3)return"oklch"}});var Zf=P,Up=S.type;Zf.prototype.alpha=function(T,A){return A===void 0&&(A=!1),T!==void 0&&Up(T)==="number"?A?(this._rgb[3]=T,this):new Zf([this._rgb[0],this._rgb[1],this._rgb[2],T],"rgb"):this._rgb[3]};var kp=P;kp.prototype.clipped=function(){return this._rgb._clipped||!1};var Vs=P,Kf=Za;Vs.prototype.darken=function(T){T===void 0&&(T=1);var A=this,I=A.lab();return I[0]-=Kf.Kn*T,new Vs(I,"lab").alpha(A.alpha(),!0)},Vs.prototype.brighten=function(T){return T===void 0&&(T=1),this.darken(-T)},Vs.prototype.darker=Vs.prototype.darken,Vs.prototype.brighter=Vs.prototype.brighten;var Op=P;Op.prototype.get=function(T){var A=T.split("."),I=A[0],z=A[1],$=this[I]();if(z){var K=I.indexOf(z)-(I.substr(0,2)==="ok"?2:0);if(K>-1)return $[K];throw new Error("unknown channel "+z+" in mode "+I)}else return $};var uo=P,cv=S.type,Fp=Math.pow,fv=1e-7,hv=20;uo.prototype.luminance=function(T){if(T!==void 0&&cv(T)==="number"){if(T===0)return new uo([0,0,0,this._rgb[3]],"rgb");if(T===1)return new uo([255,255,255,this._rgb[3]],"rgb");var A=this.luminance(),I="rgb",z=hv,$=function(j,ae){var ie=j.interpolate(ae,.5,I),we=ie.luminance();return Math.abs(T-we)<fv||!z--?ie:we>T?$(j,ie):$(ie,ae)},K=(A>T?$(new uo([0,0,0]),this):$(this,new uo([255,255,255]))).rgb();return new uo(K.concat([this._rgb[3]]))}return zp.apply(void 0,this._rgb.slice(0,3))};var zp=function(T,A,I){return T=Lu(T),A=Lu(A),I=Lu(I),.2126*T+.7152*A+.0722*I},Lu=function(T){return T/=255,T<=.03928?T/12.92:Fp((T+.055)/1.055,2.4)},Lr={},Jf=P,dl=S.type,Iu=Lr,Bp=function(T,A,I){I===void 0&&(I=.5);for(var z=[],$=arguments.length-3;$-- >0;)z[$]=arguments[$+3];var K=z[0]||"lrgb";if(!Iu[K]&&!z.length&&(K=Object.keys(Iu)[0]),!Iu[K])throw new Error("interpolation mode "+K+" is not defined");return dl(T)!=="object"&&(T=new Jf(T)),dl(A)!=="object"&&(A=new Jf(A)),Iu[K](T,A,I).alpha(T.alpha()+I*(A.alpha()-T.alpha()))},Hp=P,Qf=Bp;Hp.prototype.mix=Hp.prototype.interpolate=function(T,A){A===void 0&&(A=.5);for(var I=[],z=arguments.length-2;z-- >0;)I[z]=arguments[z+2];return Qf.apply(void 0,[this,T,A].concat(I))};var Nu=P;Nu.prototype.premultiply=function(T){T===void 0&&(T=!1);var A=this._rgb,I=A[3];return T?(this._rgb=[A[0]*I,A[1]*I,A[2]*I,I],this):new Nu([A[0]*I,A[1]*I,A[2]*I,I],"rgb")};var eh=P,Vp=Za;eh.prototype.saturate=function(T){T===void 0&&(T=1);var A=this,I=A.lch();return I[1]+=Vp.Kn*T,I[1]<0&&(I[1]=0),new eh(I,"lch").alpha(A.alpha(),!0)},eh.prototype.desaturate=function(T){return T===void 0&&(T=1),this.saturate(-T)};var th=P,nh=S.type;th.prototype.set=function(T,A,I){I===void 0&&(I=!1);var z=T.split("."),$=z[0],K=z[1],j=this[$]();if(K){var ae=$.indexOf(K)-($.substr(0,2)==="ok"?2:0);if(ae>-1){if(nh(A)=="string")switch(A.charAt(0)){case"+":j[ae]+=+A;break;case"-":j[ae]+=+A;break;case"*":j[ae]*=+A.substr(1);break;case"/":j[ae]/=+A.substr(1);break;default:j[ae]=+A}else if(nh(A)==="number")j[ae]=A;else throw new Error("unsupported value for Color.set");var ie=new th(j,$);return I?(this._rgb=ie._rgb,this):ie}throw new Error("unknown channel "+K+" in mode "+$)}else return j};var Gp=P,Wp=function(T,A,I){var z=T._rgb,$=A._rgb;return new Gp(z[0]+I*($[0]-z[0]),z[1]+I*($[1]-z[1]),z[2]+I*($[2]-z[2]),"rgb")};Lr.rgb=Wp;var Wi=P,Du=Math.sqrt,Xi=Math.pow,pl=function(T,A,I){var z=T._rgb,$=z[0],K=z[1],j=z[2],ae=A._rgb,ie=ae[0],we=ae[1],Ue=ae[2];return new Wi(Du(Xi($,2)*(1-I)+Xi(ie,2)*I),Du(Xi(K,2)*(1-I)+Xi(we,2)*I),Du(Xi(j,2)*(1-I)+Xi(Ue,2)*I),"rgb")};Lr.lrgb=pl;var Uu=P,ku=function(T,A,I){var z=T.lab(),$=A.lab();return new Uu(z[0]+I*($[0]-z[0]),z[1]+I*($[1]-z[1]),z[2]+I*($[2]-z[2]),"lab")};Lr.lab=ku;var rh=P,ji=function(T,A,I,z){var $,K,j,ae;z==="hsl"?(j=T.hsl(),ae=A.hsl()):z==="hsv"?(j=T.hsv(),ae=A.hsv()):z==="hcg"?(j=T.hcg(),ae=A.hcg()):z==="hsi"?(j=T.hsi(),ae=A.hsi()):z==="lch"||z==="hcl"?(z="hcl",j=T.hcl(),ae=A.hcl()):z==="oklch"&&(j=T.oklch().reverse(),ae=A.oklch().reverse());var ie,we,Ue,$e,ke,et;(z.substr(0,1)==="h"||z==="oklch")&&($=j,ie=$[0],Ue=$[1],ke=$[2],K=ae,we=K[0],$e=K[1],et=K[2]);var Qe,bt,Lt,Yt;return!isNaN(ie)&&!isNaN(we)?(we>ie&&we-ie>180?Yt=we-(ie+360):we<ie&&ie-we>180?Yt=we+360-ie:Yt=we-ie,bt=ie+I*Yt):isNaN(ie)?isNaN(we)?bt=Number.NaN:(bt=we,(ke==1||ke==0)&&z!="hsv"&&(Qe=$e)):(bt=ie,(et==1||et==0)&&z!="hsv"&&(Qe=Ue)),Qe===void 0&&(Qe=Ue+I*($e-Ue)),Lt=ke+I*(et-ke),z==="oklch"?new rh([Lt,Qe,bt],z):new rh([bt,Qe,Lt],z)},pr=ji,Xp=function(T,A,I){return pr(T,A,I,"lch")};Lr.lch=Xp,Lr.hcl=Xp;var dv=P,Xr=function(T,A,I){var z=T.num(),$=A.num();return new dv(z+I*($-z),"num")};Lr.num=Xr;var Sr=ji,jp=function(T,A,I){return Sr(T,A,I,"hcg")};Lr.hcg=jp;var Yp=ji,$p=function(T,A,I){return Yp(T,A,I,"hsi")};Lr.hsi=$p;var qp=ji,Zp=function(T,A,I){return qp(T,A,I,"hsl")};Lr.hsl=Zp;var ih=ji,Kp=function(T,A,I){return ih(T,A,I,"hsv")};Lr.hsv=Kp;var sh=P,Jp=function(T,A,I){var z=T.oklab(),$=A.oklab();return new sh(z[0]+I*($[0]-z[0]),z[1]+I*($[1]-z[1]),z[2]+I*($[2]-z[2]),"oklab")};Lr.oklab=Jp;var Qp=ji,Ou=function(T,A,I){return Qp(T,A,I,"oklch")};Lr.oklch=Ou;var Ko=P,em=S.clip_rgb,ml=Math.pow,Fu=Math.sqrt,zu=Math.PI,gl=Math.cos,oh=Math.sin,ah=Math.atan2,tm=function(T,A,I){A===void 0&&(A="lrgb"),I===void 0&&(I=null);var z=T.length;I||(I=Array.from(new Array(z)).map(function(){return 1}));var $=z/I.reduce(function(bt,Lt){return bt+Lt});if(I.forEach(function(bt,Lt){I[Lt]*=$}),T=T.map(function(bt){return new Ko(bt)}),A==="lrgb")return us(T,I);for(var K=T.shift(),j=K.get(A),ae=[],ie=0,we=0,Ue=0;Ue<j.length;Ue++)if(j[Ue]=(j[Ue]||0)*I[0],ae.push(isNaN(j[Ue])?0:I[0]),A.charAt(Ue)==="h"&&!isNaN(j[Ue])){var $e=j[Ue]/180*zu;ie+=gl($e)*I[0],we+=oh($e)*I[0]}var ke=K.alpha()*I[0];T.forEach(function(bt,Lt){var Yt=bt.get(A);ke+=bt.alpha()*I[Lt+1];for(var Jt=0;Jt<j.length;Jt++)if(!isNaN(Yt[Jt]))if(ae[Jt]+=I[Lt+1],A.charAt(Jt)==="h"){var nr=Yt[Jt]/180*zu;ie+=gl(nr)*I[Lt+1],we+=oh(nr)*I[Lt+1]}else j[Jt]+=Yt[Jt]*I[Lt+1]});for(var et=0;et<j.length;et++)if(A.charAt(et)==="h"){for(var Qe=ah(we/ae[et],ie/ae[et])/zu*180;Qe<0;)Qe+=360;for(;Qe>=360;)Qe-=360;j[et]=Qe}else j[et]=j[et]/ae[et];return ke/=z,new Ko(j,A).alpha(ke>.99999?1:ke,!0)},us=function(T,A){for(var I=T.length,z=[0,0,0,0],$=0;$<T.length;$++){var K=T[$],j=A[$]/I,ae=K._rgb;z[0]+=ml(ae[0],2)*j,z[1]+=ml(ae[1],2)*j,z[2]+=ml(ae[2],2)*j,z[3]+=ae[3]*j}return z[0]=Fu(z[0]),z[1]=Fu(z[1]),z[2]=Fu(z[2]),z[3]>.9999999&&(z[3]=1),new Ko(em(z))},Ei=D,Jo=S.type,Bu=Math.pow,cs=function(T){var A="rgb",I=Ei("#ccc"),z=0,$=[0,1],K=[],j=[0,0],ae=!1,ie=[],we=!1,Ue=0,$e=1,ke=!1,et={},Qe=!0,bt=1,Lt=function(Fe){if(Fe=Fe||["#fff","#000"],Fe&&Jo(Fe)==="string"&&Ei.brewer&&Ei.brewer[Fe.toLowerCase()]&&(Fe=Ei.brewer[Fe.toLowerCase()]),Jo(Fe)==="array"){Fe.length===1&&(Fe=[Fe[0],Fe[0]]),Fe=Fe.slice(0);for(var yt=0;yt<Fe.length;yt++)Fe[yt]=Ei(Fe[yt]);K.length=0;for(var xt=0;xt<Fe.length;xt++)K.push(xt/(Fe.length-1))}return Vn(),ie=Fe},Yt=function(Fe){if(ae!=null){for(var yt=ae.length-1,xt=0;xt<yt&&Fe>=ae[xt];)xt++;return xt-1}return 0},Jt=function(Fe){return Fe},nr=function(Fe){return Fe},qn=function(Fe,yt){var xt,Ot;if(yt==null&&(yt=!1),isNaN(Fe)||Fe===null)return I;if(yt)Ot=Fe;else if(ae&&ae.length>2){var rr=Yt(Fe);Ot=rr/(ae.length-2)}else $e!==Ue?Ot=(Fe-Ue)/($e-Ue):Ot=1;Ot=nr(Ot),yt||(Ot=Jt(Ot)),bt!==1&&(Ot=Bu(Ot,bt)),Ot=j[0]+Ot*(1-j[0]-j[1]),Ot=Math.min(1,Math.max(0,Ot));var vn=Math.floor(Ot*1e4);if(Qe&&et[vn])xt=et[vn];else{if(Jo(ie)==="array")for(var $t=0;$t<K.length;$t++){var Qt=K[$t];if(Ot<=Qt){xt=ie[$t];break}if(Ot>=Qt&&$t===K.length-1){xt=ie[$t];break}if(Ot>Qt&&Ot<K[$t+1]){Ot=(Ot-Qt)/(K[$t+1]-Qt),xt=Ei.interpolate(ie[$t],ie[$t+1],Ot,A);break}}else Jo(ie)==="function"&&(xt=ie(Ot));Qe&&(et[vn]=xt)}return xt},Vn=function(){return et={}};Lt(T);var Xt=function(Fe){var yt=Ei(qn(Fe));return we&&yt[we]?yt[we]():yt};return Xt.classes=function(Fe){if(Fe!=null){if(Jo(Fe)==="array")ae=Fe,$=[Fe[0],Fe[Fe.length-1]];else{var yt=Ei.analyze($);Fe===0?ae=[yt.min,yt.max]:ae=Ei.limits(yt,"e",Fe)}return Xt}return ae},Xt.domain=function(Fe){if(!arguments.length)return $;Ue=Fe[0],$e=Fe[Fe.length-1],K=[];var yt=ie.length;if(Fe.length===yt&&Ue!==$e)for(var xt=0,Ot=Array.from(Fe);xt<Ot.length;xt+=1){var rr=Ot[xt];K.push((rr-Ue)/($e-Ue))}else{for(var vn=0;vn<yt;vn++)K.push(vn/(yt-1));if(Fe.length>2){var $t=Fe.map(function(en,fn){return fn/(Fe.length-1)}),Qt=Fe.map(function(en){return(en-Ue)/($e-Ue)});Qt.every(function(en,fn){return $t[fn]===en})||(nr=function(en){if(en<=0||en>=1)return en;for(var fn=0;en>=Qt[fn+1];)fn++;var Rn=(en-Qt[fn])/(Qt[fn+1]-Qt[fn]),$i=$t[fn]+Rn*($t[fn+1]-$t[fn]);return $i})}}return $=[Ue,$e],Xt},Xt.mode=function(Fe){return arguments.length?(A=Fe,Vn(),Xt):A},Xt.range=function(Fe,yt){return Lt(Fe),Xt},Xt.out=function(Fe){return we=Fe,Xt},Xt.spread=function(Fe){return arguments.length?(z=Fe,Xt):z},Xt.correctLightness=function(Fe){return Fe==null&&(Fe=!0),ke=Fe,Vn(),ke?Jt=function(yt){for(var xt=qn(0,!0).lab()[0],Ot=qn(1,!0).lab()[0],rr=xt>Ot,vn=qn(yt,!0).lab()[0],$t=xt+(Ot-xt)*yt,Qt=vn-$t,en=0,fn=1,Rn=20;Math.abs(Qt)>.01&&Rn-- >0;)(function(){return rr&&(Qt*=-1),Qt<0?(en=yt,yt+=(fn-yt)*.5):(fn=yt,yt+=(en-yt)*.5),vn=qn(yt,!0).lab()[0],Qt=vn-$t})();return yt}:Jt=function(yt){return yt},Xt},Xt.padding=function(Fe){return Fe!=null?(Jo(Fe)==="number"&&(Fe=[Fe,Fe]),j=Fe,Xt):j},Xt.colors=function(Fe,yt){arguments.length<2&&(yt="hex");var xt=[];if(arguments.length===0)xt=ie.slice(0);else if(Fe===1)xt=[Xt(.5)];else if(Fe>1){var Ot=$[0],rr=$[1]-Ot;xt=pv(0,Fe,!1).map(function(fn){return Xt(Ot+fn/(Fe-1)*rr)})}else{T=[];var vn=[];if(ae&&ae.length>2)for(var $t=1,Qt=ae.length,en=1<=Qt;en?$t<Qt:$t>Qt;en?$t++:$t--)vn.push((ae[$t-1]+ae[$t])*.5);else vn=$;xt=vn.map(function(fn){return Xt(fn)})}return Ei[yt]&&(xt=xt.map(function(fn){return fn[yt]()})),xt},Xt.cache=function(Fe){return Fe!=null?(Qe=Fe,Xt):Qe},Xt.gamma=function(Fe){return Fe!=null?(bt=Fe,Xt):bt},Xt.nodata=function(Fe){return Fe!=null?(I=Ei(Fe),Xt):I},Xt};function pv(T,A,I){for(var z=[],$=T<A,K=I?$?A+1:A-1:A,j=T;$?j<K:j>K;$?j++:j--)z.push(j);return z}var Xe=P,Hu=cs,lh=function(T){for(var A=[1,1],I=1;I<T;I++){for(var z=[1],$=1;$<=A.length;$++)z[$]=(A[$]||0)+A[$-1];A=z}return A},nm=function(T){var A,I,z,$,K,j,ae;if(T=T.map(function(ke){return new Xe(ke)}),T.length===2)A=T.map(function(ke){return ke.lab()}),K=A[0],j=A[1],$=function(ke){var et=[0,1,2].map(function(Qe){return K[Qe]+ke*(j[Qe]-K[Qe])});return new Xe(et,"lab")};else if(T.length===3)I=T.map(function(ke){return ke.lab()}),K=I[0],j=I[1],ae=I[2],$=function(ke){var et=[0,1,2].map(function(Qe){return(1-ke)*(1-ke)*K[Qe]+2*(1-ke)*ke*j[Qe]+ke*ke*ae[Qe]});return new Xe(et,"lab")};else if(T.length===4){var ie;z=T.map(function(ke){return ke.lab()}),K=z[0],j=z[1],ae=z[2],ie=z[3],$=function(ke){var et=[0,1,2].map(function(Qe){return(1-ke)*(1-ke)*(1-ke)*K[Qe]+3*(1-ke)*(1-ke)*ke*j[Qe]+3*(1-ke)*ke*ke*ae[Qe]+ke*ke*ke*ie[Qe]});return new Xe(et,"lab")}}else if(T.length>=5){var we,Ue,$e;we=T.map(function(ke){return ke.lab()}),$e=T.length-1,Ue=lh($e),$=function(ke){var et=1-ke,Qe=[0,1,2].map(function(bt){return we.reduce(function(Lt,Yt,Jt){return Lt+Ue[Jt]*Math.pow(et,$e-Jt)*Math.pow(ke,Jt)*Yt[bt]},0)});return new Xe(Qe,"lab")}}else throw new RangeError("No point in running bezier with only one color.");return $},mv=function(T){var A=nm(T);return A.scale=function(){return Hu(A)},A},fs=D,Mr=function(T,A,I){if(!Mr[I])throw new Error("unknown blend mode "+I);return Mr[I](T,A)},Yi=function(T){return function(A,I){var z=fs(I).rgb(),$=fs(A).rgb();return fs.rgb(T(z,$))}},hs=function(T){return function(A,I){var z=[];return z[0]=T(A[0],I[0]),z[1]=T(A[1],I[1]),z[2]=T(A[2],I[2]),z}},rm=function(T){return T},im=function(T,A){return T*A/255},sm=function(T,A){return T>A?A:T},om=function(T,A){return T>A?T:A},am=function(T,A){return 255*(1-(1-T/255)*(1-A/255))},uh=function(T,A){return A<128?2*T*A/255:255*(1-2*(1-T/255)*(1-A/255))},ch=function(T,A){return 255*(1-(1-A/255)/(T/255))},lm=function(T,A){return T===255?255:(T=255*(A/255)/(1-T/255),T>255?255:T)};Mr.normal=Yi(hs(rm)),Mr.multiply=Yi(hs(im)),Mr.screen=Yi(hs(am)),Mr.overlay=Yi(hs(uh)),Mr.darken=Yi(hs(sm)),Mr.lighten=Yi(hs(om)),Mr.dodge=Yi(hs(lm)),Mr.burn=Yi(hs(ch));for(var fh=Mr,Qo=S.type,gv=S.clip_rgb,vv=S.TWOPI,um=Math.pow,cm=Math.sin,fm=Math.cos,hh=D,Vu=function(T,A,I,z,$){T===void 0&&(T=300),A===void 0&&(A=-1.5),I===void 0&&(I=1),z===void 0&&(z=1),$===void 0&&($=[0,1]);var K=0,j;Qo($)==="array"?j=$[1]-$[0]:(j=0,$=[$,$]);var ae=function(ie){var we=vv*((T+120)/360+A*ie),Ue=um($[0]+j*ie,z),$e=K!==0?I[0]+ie*K:I,ke=$e*Ue*(1-Ue)/2,et=fm(we),Qe=cm(we),bt=Ue+ke*(-.14861*et+1.78277*Qe),Lt=Ue+ke*(-.29227*et-.90649*Qe),Yt=Ue+ke*(1.97294*et);return hh(gv([bt*255,Lt*255,Yt*255,1]))};return ae.start=function(ie){return ie==null?T:(T=ie,ae)},ae.rotations=function(ie){return ie==null?A:(A=ie,ae)},ae.gamma=function(ie){return ie==null?z:(z=ie,ae)},ae.hue=function(ie){return ie==null?I:(I=ie,Qo(I)==="array"?(K=I[1]-I[0],K===0&&(I=I[1])):K=0,ae)},ae.lightness=function(ie){return ie==null?$:(Qo(ie)==="array"?($=ie,j=ie[1]-ie[0]):($=[ie,ie],j=0),ae)},ae.scale=function(){return hh.scale(ae)},ae.hue(I),ae},Gu=P,Wu="0123456789abcdef",Xu=Math.floor,ju=Math.random,vl=function(){for(var T="#",A=0;A<6;A++)T+=Wu.charAt(Xu(ju()*16));return new Gu(T,"hex")},yl=f,Yu=Math.log,dh=Math.pow,hm=Math.floor,ph=Math.abs,dm=function(T,A){A===void 0&&(A=null);var I={min:Number.MAX_VALUE,max:Number.MAX_VALUE*-1,sum:0,values:[],count:0};return yl(T)==="object"&&(T=Object.values(T)),T.forEach(function(z){A&&yl(z)==="object"&&(z=z[A]),z!=null&&!isNaN(z)&&(I.values.push(z),I.sum+=z,z<I.min&&(I.min=z),z>I.max&&(I.max=z),I.count+=1)}),I.domain=[I.min,I.max],I.limits=function(z,$){return _l(I,z,$)},I},_l=function(T,A,I){A===void 0&&(A="equal"),I===void 0&&(I=7),yl(T)=="array"&&(T=dm(T));var z=T.min,$=T.max,K=T.values.sort(function(vh,tc){return vh-tc});if(I===1)return[z,$];var j=[];if(A.substr(0,1)==="c"&&(j.push(z),j.push($)),A.substr(0,1)==="e"){j.push(z);for(var ae=1;ae<I;ae++)j.push(z+ae/I*($-z));j.push($)}else if(A.substr(0,1)==="l"){if(z<=0)throw new Error("Logarithmic scales are only possible for values > 0");var ie=Math.LOG10E*Yu(z),we=Math.LOG10E*Yu($);j.push(z);for(var Ue=1;Ue<I;Ue++)j.push(dh(10,ie+Ue/I*(we-ie)));j.push($)}else if(A.substr(0,1)==="q"){j.push(z);for(var $e=1;$e<I;$e++){var ke=(K.length-1)*$e/I,et=hm(ke);if(et===ke)j.push(K[et]);else{var Qe=ke-et;j.push(K[et]*(1-Qe)+K[et+1]*Qe)}}j.push($)}else if(A.substr(0,1)==="k"){var bt,Lt=K.length,Yt=new Array(Lt),Jt=new Array(I),nr=!0,qn=0,Vn=null;Vn=[],Vn.push(z);for(var Xt=1;Xt<I;Xt++)Vn.push(z+Xt/I*($-z));for(Vn.push($);nr;){for(var Fe=0;Fe<I;Fe++)Jt[Fe]=0;for(var yt=0;yt<Lt;yt++)for(var xt=K[yt],Ot=Number.MAX_VALUE,rr=void 0,vn=0;vn<I;vn++){var $t=ph(Vn[vn]-xt);$t<Ot&&(Ot=$t,rr=vn),Jt[rr]++,Yt[yt]=rr}for(var Qt=new Array(I),en=0;en<I;en++)Qt[en]=null;for(var fn=0;fn<Lt;fn++)bt=Yt[fn],Qt[bt]===null?Qt[bt]=K[fn]:Qt[bt]+=K[fn];for(var Rn=0;Rn<I;Rn++)Qt[Rn]*=1/Jt[Rn];nr=!1;for(var $i=0;$i<I;$i++)if(Qt[$i]!==Vn[$i]){nr=!0;break}Vn=Qt,qn++,qn>200&&(nr=!1)}for(var Gs={},Yr=0;Yr<I;Yr++)Gs[Yr]=[];for(var ms=0;ms<Lt;ms++)bt=Yt[ms],Gs[bt].push(K[ms]);for(var Er=[],qi=0;qi<I;qi++)Er.push(Gs[qi][0]),Er.push(Gs[qi][Gs[qi].length-1]);Er=Er.sort(function(vh,tc){return vh-tc}),j.push(Er[0]);for(var co=1;co<Er.length;co+=2){var gs=Er[co];!isNaN(gs)&&j.indexOf(gs)===-1&&j.push(gs)}}return j},$u={analyze:dm,limits:_l},Cn=P,kt=function(T,A){T=new Cn(T),A=new Cn(A);var I=T.luminance(),z=A.luminance();return I>z?(I+.05)/(z+.05):(z+.05)/(I+.05)},Nn=P,dn=Math.sqrt,Wt=Math.pow,jr=Math.min,ea=Math.max,Hn=Math.atan2,ta=Math.abs,ds=Math.cos,xl=Math.sin,mh=Math.exp,na=Math.PI,Ir=function(T,A,I,z,$){I===void 0&&(I=1),z===void 0&&(z=1),$===void 0&&($=1);var K=function(gs){return 360*gs/(2*na)},j=function(gs){return 2*na*gs/360};T=new Nn(T),A=new Nn(A);var ae=Array.from(T.lab()),ie=ae[0],we=ae[1],Ue=ae[2],$e=Array.from(A.lab()),ke=$e[0],et=$e[1],Qe=$e[2],bt=(ie+ke)/2,Lt=dn(Wt(we,2)+Wt(Ue,2)),Yt=dn(Wt(et,2)+Wt(Qe,2)),Jt=(Lt+Yt)/2,nr=.5*(1-dn(Wt(Jt,7)/(Wt(Jt,7)+Wt(25,7)))),qn=we*(1+nr),Vn=et*(1+nr),Xt=dn(Wt(qn,2)+Wt(Ue,2)),Fe=dn(Wt(Vn,2)+Wt(Qe,2)),yt=(Xt+Fe)/2,xt=K(Hn(Ue,qn)),Ot=K(Hn(Qe,Vn)),rr=xt>=0?xt:xt+360,vn=Ot>=0?Ot:Ot+360,$t=ta(rr-vn)>180?(rr+vn+360)/2:(rr+vn)/2,Qt=1-.17*ds(j($t-30))+.24*ds(j(2*$t))+.32*ds(j(3*$t+6))-.2*ds(j(4*$t-63)),en=vn-rr;en=ta(en)<=180?en:vn<=rr?en+360:en-360,en=2*dn(Xt*Fe)*xl(j(en)/2);var fn=ke-ie,Rn=Fe-Xt,$i=1+.015*Wt(bt-50,2)/dn(20+Wt(bt-50,2)),Gs=1+.045*yt,Yr=1+.015*yt*Qt,ms=30*mh(-Wt(($t-275)/25,2)),Er=2*dn(Wt(yt,7)/(Wt(yt,7)+Wt(25,7))),qi=-Er*xl(2*j(ms)),co=dn(Wt(fn/(I*$i),2)+Wt(Rn/(z*Gs),2)+Wt(en/($*Yr),2)+qi*(Rn/(z*Gs))*(en/($*Yr)));return ea(0,jr(100,co))},qu=P,gh=function(T,A,I){I===void 0&&(I="lab"),T=new qu(T),A=new qu(A);var z=T.get(I),$=A.get(I),K=0;for(var j in z){var ae=(z[j]||0)-($[j]||0);K+=ae*ae}return Math.sqrt(K)},ra=P,Zu=function(){for(var T=[],A=arguments.length;A--;)T[A]=arguments[A];try{return new(Function.prototype.bind.apply(ra,[null].concat(T))),!0}catch{return!1}},Ku=D,ps=cs,Ju={cool:function(){return ps([Ku.hsl(180,1,.9),Ku.hsl(250,.7,.4)])},hot:function(){return ps(["#000","#f00","#ff0","#fff"]).mode("rgb")}},Ti={OrRd:["#fff7ec","#fee8c8","#fdd49e","#fdbb84","#fc8d59","#ef6548","#d7301f","#b30000","#7f0000"],PuBu:["#fff7fb","#ece7f2","#d0d1e6","#a6bddb","#74a9cf","#3690c0","#0570b0","#045a8d","#023858"],BuPu:["#f7fcfd","#e0ecf4","#bfd3e6","#9ebcda","#8c96c6","#8c6bb1","#88419d","#810f7c","#4d004b"],Oranges:["#fff5eb","#fee6ce","#fdd0a2","#fdae6b","#fd8d3c","#f16913","#d94801","#a63603","#7f2704"],BuGn:["#f7fcfd","#e5f5f9","#ccece6","#99d8c9","#66c2a4","#41ae76","#238b45","#006d2c","#00441b"],YlOrBr:["#ffffe5","#fff7bc","#fee391","#fec44f","#fe9929","#ec7014","#cc4c02","#993404","#662506"],YlGn:["#ffffe5","#f7fcb9","#d9f0a3","#addd8e","#78c679","#41ab5d","#238443","#006837","#004529"],Reds:["#fff5f0","#fee0d2","#fcbba1","#fc9272","#fb6a4a","#ef3b2c","#cb181d","#a50f15","#67000d"],RdPu:["#fff7f3","#fde0dd","#fcc5c0","#fa9fb5","#f768a1","#dd3497","#ae017e","#7a0177","#49006a"],Greens:["#f7fcf5","#e5f5e0","#c7e9c0","#a1d99b","#74c476","#41ab5d","#238b45","#006d2c","#00441b"],YlGnBu:["#ffffd9","#edf8b1","#c7e9b4","#7fcdbb","#41b6c4","#1d91c0","#225ea8","#253494","#081d58"],Purples:["#fcfbfd","#efedf5","#dadaeb","#bcbddc","#9e9ac8","#807dba","#6a51a3","#54278f","#3f007d"],GnBu:["#f7fcf0","#e0f3db","#ccebc5","#a8ddb5","#7bccc4","#4eb3d3","#2b8cbe","#0868ac","#084081"],Greys:["#ffffff","#f0f0f0","#d9d9d9","#bdbdbd","#969696","#737373","#525252","#252525","#000000"],YlOrRd:["#ffffcc","#ffeda0","#fed976","#feb24c","#fd8d3c","#fc4e2a","#e31a1c","#bd0026","#800026"],PuRd:["#f7f4f9","#e7e1ef","#d4b9da","#c994c7","#df65b0","#e7298a","#ce1256","#980043","#67001f"],Blues:["#f7fbff","#deebf7","#c6dbef","#9ecae1","#6baed6","#4292c6","#2171b5","#08519c","#08306b"],PuBuGn:["#fff7fb","#ece2f0","#d0d1e6","#a6bddb","#67a9cf","#3690c0","#02818a","#016c59","#014636"],Viridis:["#440154","#482777","#3f4a8a","#31678e","#26838f","#1f9d8a","#6cce5a","#b6de2b","#fee825"],Spectral:["#9e0142","#d53e4f","#f46d43","#fdae61","#fee08b","#ffffbf","#e6f598","#abdda4","#66c2a5","#3288bd","#5e4fa2"],RdYlGn:["#a50026","#d73027","#f46d43","#fdae61","#fee08b","#ffffbf","#d9ef8b","#a6d96a","#66bd63","#1a9850","#006837"],RdBu:["#67001f","#b2182b","#d6604d","#f4a582","#fddbc7","#f7f7f7","#d1e5f0","#92c5de","#4393c3","#2166ac","#053061"],PiYG:["#8e0152","#c51b7d","#de77ae","#f1b6da","#fde0ef","#f7f7f7","#e6f5d0","#b8e186","#7fbc41","#4d9221","#276419"],PRGn:["#40004b","#762a83","#9970ab","#c2a5cf","#e7d4e8","#f7f7f7","#d9f0d3","#a6dba0","#5aae61","#1b7837","#00441b"],RdYlBu:["#a50026","#d73027","#f46d43","#fdae61","#fee090","#ffffbf","#e0f3f8","#abd9e9","#74add1","#4575b4","#313695"],BrBG:["#543005","#8c510a","#bf812d","#dfc27d","#f6e8c3","#f5f5f5","#c7eae5","#80cdc1","#35978f","#01665e","#003c30"],RdGy:["#67001f","#b2182b","#d6604d","#f4a582","#fddbc7","#ffffff","#e0e0e0","#bababa","#878787","#4d4d4d","#1a1a1a"],PuOr:["#7f3b08","#b35806","#e08214","#fdb863","#fee0b6","#f7f7f7","#d8daeb","#b2abd2","#8073ac","#542788","#2d004b"],Set2:["#66c2a5","#fc8d62","#8da0cb","#e78ac3","#a6d854","#ffd92f","#e5c494","#b3b3b3"],Accent:["#7fc97f","#beaed4","#fdc086","#ffff99","#386cb0","#f0027f","#bf5b17","#666666"],Set1:["#e41a1c","#377eb8","#4daf4a","#984ea3","#ff7f00","#ffff33","#a65628","#f781bf","#999999"],Set3:["#8dd3c7","#ffffb3","#bebada","#fb8072","#80b1d3","#fdb462","#b3de69","#fccde5","#d9d9d9","#bc80bd","#ccebc5","#ffed6f"],Dark2:["#1b9e77","#d95f02","#7570b3","#e7298a","#66a61e","#e6ab02","#a6761d","#666666"],Paired:["#a6cee3","#1f78b4","#b2df8a","#33a02c","#fb9a99","#e31a1c","#fdbf6f","#ff7f00","#cab2d6","#6a3d9a","#ffff99","#b15928"],Pastel2:["#b3e2cd","#fdcdac","#cbd5e8","#f4cae4","#e6f5c9","#fff2ae","#f1e2cc","#cccccc"],Pastel1:["#fbb4ae","#b3cde3","#ccebc5","#decbe4","#fed9a6","#ffffcc","#e5d8bd","#fddaec","#f2f2f2"]},ia=0,sa=Object.keys(Ti);ia<sa.length;ia+=1){var Qu=sa[ia];Ti[Qu.toLowerCase()]=Ti[Qu]}var ec=Ti,Dn=D;Dn.average=tm,Dn.bezier=mv,Dn.blend=fh,Dn.cubehelix=Vu,Dn.mix=Dn.interpolate=Bp,Dn.random=vl,Dn.scale=cs,Dn.analyze=$u.analyze,Dn.contrast=kt,Dn.deltaE=Ir,Dn.distance=gh,Dn.limits=$u.limits,Dn.valid=Zu,Dn.scales=Ju,Dn.colors=Bs,Dn.brewer=ec;var wr=Dn;return wr})})(_C);var W4=_C.exports;(function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.default=void 0;var e=s(fC),t=s(n4),r=s(G4),i=s(W4);function s(x){return x&&x.__esModule?x:{default:x}}function o(x){if(typeof Symbol>"u"||x[Symbol.iterator]==null){if(Array.isArray(x)||(x=a(x))){var M=0,b=function(){};return{s:b,n:function(){return M>=x.length?{done:!0}:{done:!1,value:x[M++]}},e:function(U){throw U},f:b}}throw new TypeError(`Invalid attempt to iterate non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var C,P=!0,N=!1,D;return{s:function(){C=x[Symbol.iterator]()},n:function(){var U=C.next();return P=U.done,U},e:function(U){N=!0,D=U},f:function(){try{!P&&C.return!=null&&C.return()}finally{if(N)throw D}}}}function a(x,M){if(x){if(typeof x=="string")return c(x,M);var b=Object.prototype.toString.call(x).slice(8,-1);if(b==="Object"&&x.constructor&&(b=x.constructor.name),b==="Map"||b==="Set")return Array.from(b);if(b==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(b))return c(x,M)}}function c(x,M){(M==null||M>x.length)&&(M=x.length);for(var b=0,C=new Array(M);b<M;b++)C[b]=x[b];return C}function f(x,M){var b=Object.keys(x);if(Object.getOwnPropertySymbols){var C=Object.getOwnPropertySymbols(x);M&&(C=C.filter(function(P){return Object.getOwnPropertyDescriptor(x,P).enumerable})),b.push.apply(b,C)}return b}function h(x){for(var M=1;M<arguments.length;M++){var b=arguments[M]!=null?arguments[M]:{};M%2?f(Object(b),!0).forEach(function(C){d(x,C,b[C])}):Object.getOwnPropertyDescriptors?Object.defineProperties(x,Object.getOwnPropertyDescriptors(b)):f(Object(b)).forEach(function(C){Object.defineProperty(x,C,Object.getOwnPropertyDescriptor(b,C))})}return x}function d(x,M,b){return M in x?Object.defineProperty(x,M,{value:b,enumerable:!0,configurable:!0,writable:!0}):x[M]=b,x}var m={count:5,hueMin:0,hueMax:360,chromaMin:0,chromaMax:100,lightMin:0,lightMax:100,quality:50,samples:800},v=function(M,b){for(var C=Number.MAX_SAFE_INTEGER,P=0,N=0;N<M.length;N+=1){var D=M[N],L=Math.sqrt(Math.pow(Math.abs(D[0]-b[0]),2)+Math.pow(Math.abs(D[1]-b[1]),2)+Math.pow(Math.abs(D[2]-b[2]),2));L<C&&(C=L,P=N)}return P},_=function(M,b){var C=i.default.lab(M),P=C.hcl(),N=C.rgb(),D=i.default.rgb(N).lab(),L=2;return P[0]>=b.hueMin&&P[0]<=b.hueMax&&P[1]>=b.chromaMin&&P[1]<=b.chromaMax&&P[2]>=b.lightMin&&P[2]<=b.lightMax&&D[0]>=M[0]-L&&D[0]<=M[0]+L&&D[1]>=M[1]-L&&D[1]<=M[1]+L&&D[2]>=M[2]-L&&D[2]<=M[2]+L},S=function(M){for(var b=M.slice(0),C=[b.shift()];b.length>0;){for(var P=C[C.length-1],N=0,D=Number.MIN_SAFE_INTEGER,L=0;L<b.length;L+=1){var U=Math.sqrt(Math.pow(Math.abs(P[0]-b[L][0]),2)+Math.pow(Math.abs(P[1]-b[L][1]),2)+Math.pow(Math.abs(P[2]-b[L][2]),2));U>D&&(D=U,N=L)}C.push(b.splice(N,1)[0])}return C},w=function(){var M=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},b=h({},m,{},M);if(b.count<=0)return[];b.samples<b.count*3&&(b.samples=Math.ceil(b.count*3));var C=[],P=[],N=new Set,D=Math.ceil(Math.cbrt(b.samples)),L=(b.hueMax-b.hueMin)/D,U=(b.chromaMax-b.chromaMin)/D,X=(b.lightMax-b.lightMin)/D;if(L<=0)throw new Error("hueMax must be greater than hueMin!");if(U<=0)throw new Error("chromaMax must be greater than chromaMin!");if(X<=0)throw new Error("lightMax must be greater than lightMin!");for(var ee=b.hueMin+L/2;ee<=b.hueMax;ee+=L)for(var Z=b.chromaMin+U/2;Z<=b.chromaMax;Z+=U)for(var re=b.lightMin+X/2;re<=b.lightMax;re+=X){var se=i.default.hcl(ee,Z,re).lab();_(se,b)&&N.add(se.toString())}if(N=Array.from(N),N=N.map(function(Je){return Je.split(",").map(function(gt){return parseFloat(gt)})}),N.length<b.count)throw new Error("Not enough samples to generate palette, increase sample count.");for(var ge=Math.floor(N.length/b.count),ce=0;ce<N.length&&(C.push(N[ce]),P.push([]),!(C.length>=b.count));ce+=ge);for(var k=1;k<=b.quality;k+=1){for(var W=(0,t.default)(P),G=(0,t.default)(N),fe=0;fe<C.length;fe+=1){var te=v(G,C[fe]);W[fe].push(G[te]),G.splice(te,1)}for(var oe=0;oe<G.length;oe+=1){var ue=N[oe],Ne=v(C,ue);W[Ne].push(N[oe])}for(var Le=(0,t.default)(C),Y=0;Y<W.length;Y+=1){var ot=W[Y],lt=ot.length,Pe=[],Oe=[],Ee=[],de=o(ot),be;try{for(de.s();!(be=de.n()).done;){var je=be.value;Pe.push(je[0]),Oe.push(je[1]),Ee.push(je[2])}}catch(Je){de.e(Je)}finally{de.f()}var We=e.default.sum(Pe)/lt,nt=e.default.sum(Oe)/lt,at=e.default.sum(Ee)/lt;C[Y]=[We,nt,at]}if((0,r.default)(Le,C))break}return C=S(C),C.map(function(Je){return i.default.lab(Je)})},g=w;n.default=g})(cC);const X4=yx(cC);function Dy({start:n,end:e}){const t=Re.useRef();return Re.useLayoutEffect(()=>{t.current.geometry.setFromPoints([n,e].map(r=>new F(...r)))},[n,e]),ft.jsxs("line",{ref:t,children:[ft.jsx("bufferGeometry",{}),ft.jsx("lineBasicMaterial",{color:"black"})]})}const j4=({data:n,settings:e})=>{const t=X4({count:50,lightMin:50,lightMax:80,chromaMin:70}),[r,i]=Re.useState(-1);return ft.jsxs(JF,{camera:{position:[0,0,-5]},children:[ft.jsx(hz,{target:[0,0,0]}),ft.jsx("ambientLight",{color:"#ffffff",intensity:.1}),ft.jsx("hemisphereLight",{color:"#ffffff",skyColor:"#ffffbb",groundColor:"#080820",intensity:1}),ft.jsx(_z,{data:n,palette:t,highlightedGroup:r,setHighlightedGroup:i,settings:e}),e[0].showLines&&ft.jsx(bz,{data:n,palette:t,highlightedGroup:r}),ft.jsx(Dy,{start:[-1,0,0],end:[1,0,0]}),ft.jsx(Dy,{start:[0,-1,0],end:[0,1,0]}),ft.jsx(Dy,{start:[0,0,-1],end:[0,0,1]})]})};const Y4=n=>{const e=()=>{n.settings[1]({showDocuments:!n.settings[0].showDocuments,showMetadata:n.settings[0].showMetadata,showLines:n.settings[0].showLines})},t=()=>{n.settings[1]({showDocuments:n.settings[0].showDocuments,showMetadata:!n.settings[0].showMetadata,showLines:n.settings[0].showLines})},r=()=>{n.settings[1]({showDocuments:n.settings[0].showDocuments,showMetadata:n.settings[0].showMetadata,showLines:!n.settings[0].showLines})};return ft.jsxs("div",{className:"button-group",children:[ft.jsx("button",{className:`btn ${n.settings[0].showDocuments?"active":""}`,onClick:e,children:"docs"}),ft.jsx("button",{className:`btn ${n.settings[0].showMetadata?"active":""}`,onClick:t,children:"metadata"}),ft.jsx("button",{className:`btn ${n.settings[0].showLines?"active":""}`,onClick:r,children:"lines"})]})},$4=({settings:n})=>ft.jsxs("div",{className:"footer",children:[ft.jsx(Y4,{settings:n}),ft.jsx("h4",{children:"chroma visualizer 0.0.2"})]});function q4(){const[n,e]=Re.useState([[]]),[t,r]=Re.useState(!0),[i,s]=Re.useState(null),[o,a]=Re.useState({showDocuments:!0,showMetadata:!0,showLines:!0});return Re.useEffect(()=>{r(!0),e({}),fetch("http://127.0.0.1:5001/data").then(c=>c.json()).then(c=>{r(!1),e(c)},c=>{r(!1),s(c)})},[]),ft.jsxs(ft.Fragment,{children:[t&&ft.jsx("div",{style:{position:"absolute",left:"50%",top:"50%",transform:"translate(-50%, -50%)"},children:ft.jsx(s3,{size:150,"aria-label":"Loading Spinner","data-testid":"loader"})}),!t&&ft.jsxs(ft.Fragment,{children:[ft.jsx("div",{className:"vis-container",children:ft.jsx(j4,{data:n,settings:[o,a]})}),ft.jsx($4,{settings:[o,a]})]})]})}Uy.createRoot(document.getElementById("root")).render(ft.jsx(q4,{}));
+In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var C,P=!0,N=!1,D;return{s:function(){C=x[Symbol.iterator]()},n:function(){var U=C.next();return P=U.done,U},e:function(U){N=!0,D=U},f:function(){try{!P&&C.return!=null&&C.return()}finally{if(N)throw D}}}}function a(x,M){if(x){if(typeof x=="string")return c(x,M);var b=Object.prototype.toString.call(x).slice(8,-1);if(b==="Object"&&x.constructor&&(b=x.constructor.name),b==="Map"||b==="Set")return Array.from(b);if(b==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(b))return c(x,M)}}function c(x,M){(M==null||M>x.length)&&(M=x.length);for(var b=0,C=new Array(M);b<M;b++)C[b]=x[b];return C}function f(x,M){var b=Object.keys(x);if(Object.getOwnPropertySymbols){var C=Object.getOwnPropertySymbols(x);M&&(C=C.filter(function(P){return Object.getOwnPropertyDescriptor(x,P).enumerable})),b.push.apply(b,C)}return b}function h(x){for(var M=1;M<arguments.length;M++){var b=arguments[M]!=null?arguments[M]:{};M%2?f(Object(b),!0).forEach(function(C){d(x,C,b[C])}):Object.getOwnPropertyDescriptors?Object.defineProperties(x,Object.getOwnPropertyDescriptors(b)):f(Object(b)).forEach(function(C){Object.defineProperty(x,C,Object.getOwnPropertyDescriptor(b,C))})}return x}function d(x,M,b){return M in x?Object.defineProperty(x,M,{value:b,enumerable:!0,configurable:!0,writable:!0}):x[M]=b,x}var m={count:5,hueMin:0,hueMax:360,chromaMin:0,chromaMax:100,lightMin:0,lightMax:100,quality:50,samples:800},v=function(M,b){for(var C=Number.MAX_SAFE_INTEGER,P=0,N=0;N<M.length;N+=1){var D=M[N],L=Math.sqrt(Math.pow(Math.abs(D[0]-b[0]),2)+Math.pow(Math.abs(D[1]-b[1]),2)+Math.pow(Math.abs(D[2]-b[2]),2));L<C&&(C=L,P=N)}return P},_=function(M,b){var C=i.default.lab(M),P=C.hcl(),N=C.rgb(),D=i.default.rgb(N).lab(),L=2;return P[0]>=b.hueMin&&P[0]<=b.hueMax&&P[1]>=b.chromaMin&&P[1]<=b.chromaMax&&P[2]>=b.lightMin&&P[2]<=b.lightMax&&D[0]>=M[0]-L&&D[0]<=M[0]+L&&D[1]>=M[1]-L&&D[1]<=M[1]+L&&D[2]>=M[2]-L&&D[2]<=M[2]+L},S=function(M){for(var b=M.slice(0),C=[b.shift()];b.length>0;){for(var P=C[C.length-1],N=0,D=Number.MIN_SAFE_INTEGER,L=0;L<b.length;L+=1){var U=Math.sqrt(Math.pow(Math.abs(P[0]-b[L][0]),2)+Math.pow(Math.abs(P[1]-b[L][1]),2)+Math.pow(Math.abs(P[2]-b[L][2]),2));U>D&&(D=U,N=L)}C.push(b.splice(N,1)[0])}return C},w=function(){var M=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},b=h({},m,{},M);if(b.count<=0)return[];b.samples<b.count*3&&(b.samples=Math.ceil(b.count*3));var C=[],P=[],N=new Set,D=Math.ceil(Math.cbrt(b.samples)),L=(b.hueMax-b.hueMin)/D,U=(b.chromaMax-b.chromaMin)/D,X=(b.lightMax-b.lightMin)/D;if(L<=0)throw new Error("hueMax must be greater than hueMin!");if(U<=0)throw new Error("chromaMax must be greater than chromaMin!");if(X<=0)throw new Error("lightMax must be greater than lightMin!");for(var ee=b.hueMin+L/2;ee<=b.hueMax;ee+=L)for(var Z=b.chromaMin+U/2;Z<=b.chromaMax;Z+=U)for(var re=b.lightMin+X/2;re<=b.lightMax;re+=X){var se=i.default.hcl(ee,Z,re).lab();_(se,b)&&N.add(se.toString())}if(N=Array.from(N),N=N.map(function(Je){return Je.split(",").map(function(gt){return parseFloat(gt)})}),N.length<b.count)throw new Error("Not enough samples to generate palette, increase sample count.");for(var ge=Math.floor(N.length/b.count),ce=0;ce<N.length&&(C.push(N[ce]),P.push([]),!(C.length>=b.count));ce+=ge);for(var k=1;k<=b.quality;k+=1){for(var W=(0,t.default)(P),G=(0,t.default)(N),fe=0;fe<C.length;fe+=1){var te=v(G,C[fe]);W[fe].push(G[te]),G.splice(te,1)}for(var oe=0;oe<G.length;oe+=1){var ue=N[oe],Ne=v(C,ue);W[Ne].push(N[oe])}for(var Le=(0,t.default)(C),Y=0;Y<W.length;Y+=1){var ot=W[Y],lt=ot.length,Pe=[],Oe=[],Ee=[],de=o(ot),be;try{for(de.s();!(be=de.n()).done;){var je=be.value;Pe.push(je[0]),Oe.push(je[1]),Ee.push(je[2])}}catch(Je){de.e(Je)}finally{de.f()}var We=e.default.sum(Pe)/lt,nt=e.default.sum(Oe)/lt,at=e.default.sum(Ee)/lt;C[Y]=[We,nt,at]}if((0,r.default)(Le,C))break}return C=S(C),C.map(function(Je){return i.default.lab(Je)})},g=w;n.default=g})(cC);const X4=yx(cC);const React = Re;
+const $api = (() => {
+const collection = new URLSearchParams(window.location.search).get("collection");
+function apiUrl(path, params = {}) {
+  const query = new URLSearchParams();
+  if (collection !== null)
+    query.set("collection", collection);
+  for (const [key, value] of Object.entries(params)) {
+    if (value !== null && value !== void 0)
+      query.set(key, value);
+  }
+  const qs = query.toString();
+  return qs ? `${path}?${qs}` : path;
+}
+return { apiUrl: apiUrl };
+})();
+const $pointPayload = (() => {
+const TYPED_ARRAYS = {
+  float32: Float32Array,
+  uint16: Uint16Array,
+  uint32: Uint32Array
+};
+function parsePayload(buffer) {
+  const headerLength = new DataView(buffer).getUint32(0, true);
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength)));
+  const out = { ...header };
+  for (const [name, value] of Object.entries(header)) {
+    if (value && typeof value === "object" && value.dtype in TYPED_ARRAYS) {
+      const length = value.shape.reduce((a, b) => a * b, 1);
+      out[name] = new TYPED_ARRAYS[value.dtype](buffer, value.offset, length);
+    }
+  }
+  return out;
+}
+function parsePointPayload(buffer) {
+  return parsePayload(buffer);
+}
+function pointPosition(data, index) {
+  return [data.positions[index * 3], data.positions[index * 3 + 1], data.positions[index * 3 + 2]];
+}
+return { parsePayload: parsePayload, parsePointPayload: parsePointPayload, pointPosition: pointPosition };
+})();
+const $octree = (() => {
+const THREE = aF;
+const LEAF_SIZE = 32;
+const MAX_DEPTH = 12;
+class PointOctree {
+  constructor(positions, count, radii, maxRadius) {
+    this.positions = positions;
+    this.radii = radii;
+    this.maxRadius = maxRadius;
+    const indices = new Uint32Array(count);
+    const box = new THREE.Box3();
+    const point = new THREE.Vector3();
+    for (let i = 0; i < count; i++) {
+      indices[i] = i;
+      box.expandByPoint(point.fromArray(positions, i * 3));
+    }
+    this.root = count ? this.build(indices, box, 0) : null;
+  }
+  build(indices, box, depth) {
+    const bounds = box.clone().expandByScalar(this.maxRadius);
+    if (indices.length <= LEAF_SIZE || depth >= MAX_DEPTH) {
+      return { bounds, indices };
+    }
+    const center = box.getCenter(new THREE.Vector3());
+    const buckets = Array.from({ length: 8 }, () => []);
+    for (const i of indices) {
+      const octant = (this.positions[i * 3] > center.x ? 1 : 0) | (this.positions[i * 3 + 1] > center.y ? 2 : 0) | (this.positions[i * 3 + 2] > center.z ? 4 : 0);
+      buckets[octant].push(i);
+    }
+    const children = [];
+    buckets.forEach((bucket, octant) => {
+      if (!bucket.length)
+        return;
+      const min = new THREE.Vector3(
+        octant & 1 ? center.x : box.min.x,
+        octant & 2 ? center.y : box.min.y,
+        octant & 4 ? center.z : box.min.z
+      );
+      const max = new THREE.Vector3(
+        octant & 1 ? box.max.x : center.x,
+        octant & 2 ? box.max.y : center.y,
+        octant & 4 ? box.max.z : center.z
+      );
+      children.push(this.build(Uint32Array.from(bucket), new THREE.Box3(min, max), depth + 1));
+    });
+    return { bounds, children };
+  }
+  // Index of the nearest point whose sphere the ray passes through, or -1
+  raycast(ray) {
+    let best = -1;
+    let bestDistance = Infinity;
+    const point = new THREE.Vector3();
+    const closest = new THREE.Vector3();
+    const stack = this.root ? [this.root] : [];
+    while (stack.length) {
+      const node = stack.pop();
+      if (!ray.intersectsBox(node.bounds))
+        continue;
+      if (node.children) {
+        stack.push(...node.children);
+        continue;
+      }
+      for (const i of node.indices) {
+        point.fromArray(this.positions, i * 3);
+        const radius = this.radii[i];
+        if (ray.distanceSqToPoint(point) > radius * radius)
+          continue;
+        ray.closestPointToPoint(point, closest);
+        const distance = closest.distanceTo(ray.origin);
+        if (distance < bestDistance) {
+          bestDistance = distance;
+          best = i;
+        }
+      }
+    }
+    return best;
+  }
+}
+return { PointOctree: PointOctree };
+})();
+const $Tooltip = (() => {
+const useEffect = Re.useEffect, useState = Re.useState;
+const apiUrl = $api.apiUrl;
+const Tooltip = ({ index, settings }) => {
+  const [tip, setTip] = useState(null);
+  useEffect(() => {
+    let cancelled = false;
+    fetch(apiUrl("points", { index })).then((res) => res.ok ? res.json() : null).then((result) => {
+      if (!cancelled && result && result.points.length)
+        setTip(result.points[0]);
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [index]);
+  const renderList = (data) => {
+    if (typeof data === "object" && data !== null) {
+      return /* @__PURE__ */ React.createElement("ul", { style: { padding: 0, margin: 0 } }, Object.entries(data).map(([key, value]) => /* @__PURE__ */ React.createElement("li", { key }, /* @__PURE__ */ React.createElement("strong", null, key, ":"), " ", renderList(value))));
+    } else {
+      return /* @__PURE__ */ React.createElement("span", null, data);
+    }
+  };
+  if (!tip) {
+    return null;
+  }
+  return /* @__PURE__ */ React.createElement("div", { style: { pointerEvents: "none", width: "25vw", padding: "5px", margin: 0, listStyleType: "none", backgroundColor: "grey", borderRadius: "5px", wordWrap: "break-word" } }, /* @__PURE__ */ React.createElement(React.Fragment, null, /* @__PURE__ */ React.createElement("span", null, /* @__PURE__ */ React.createElement("strong", null, "id: "))), renderList(tip.id), settings[0].showDocuments && /* @__PURE__ */ React.createElement(React.Fragment, null, /* @__PURE__ */ React.createElement("br", null), /* @__PURE__ */ React.createElement("span", null, /* @__PURE__ */ React.createElement("strong", null, "document:"))), settings[0].showDocuments && renderList((tip.document ?? "").substr(0, 50)), settings[0].showMetadata && /* @__PURE__ */ React.createElement(React.Fragment, null, /* @__PURE__ */ React.createElement("br", null), /* @__PURE__ */ React.createElement("span", null, /* @__PURE__ */ React.createElement("strong", null, "metadata:"))), settings[0].showMetadata && /* @__PURE__ */ React.createElement("div", { style: { marginLeft: "1em" } }, renderList(tip.metadata)));
+};
+return { default: Tooltip };
+})();
+const $DataPoints = (() => {
+const Html = lz;
+const useThree = _o;
+const useEffect = Re.useEffect, useLayoutEffect = Re.useLayoutEffect, useMemo = Re.useMemo, useRef = Re.useRef, useState = Re.useState;
+const THREE = aF;
+const Tooltip = $Tooltip.default;
+const pointPosition = $pointPayload.pointPosition;
+const PointOctree = $octree.PointOctree;
+const MIN_SIZE = 0.02;
+const MAX_SIZE = 0.045;
+const GRAY = new THREE.Color("gray");
+const DataPoints = ({ data, palette, highlightedGroup, setHighlightedGroup, settings }) => {
+  const meshRef = useRef();
+  const hoveredRef = useRef(-1);
+  const [hovered, setHovered] = useState(-1);
+  const { camera, gl, raycaster, pointer } = useThree();
+  const count = data.positions ? data.count : 0;
+  const sizes = useMemo(() => {
+    const out = new Float32Array(count);
+    for (let i = 0; i < count; i++) {
+      out[i] = Math.random() * (MAX_SIZE - MIN_SIZE) + MIN_SIZE;
+    }
+    return out;
+  }, [count]);
+  const octree = useMemo(() => new PointOctree(data.positions || [], count, sizes, MAX_SIZE), [data.positions, count, sizes]);
+  const colors = useMemo(() => palette.map((c) => new THREE.Color(c.hex())), [palette]);
+  useLayoutEffect(() => {
+    const mesh = meshRef.current;
+    if (!mesh)
+      return;
+    const matrix = new THREE.Matrix4();
+    for (let i = 0; i < count; i++) {
+      matrix.makeScale(sizes[i], sizes[i], sizes[i]);
+      matrix.setPosition(data.positions[i * 3], data.positions[i * 3 + 1], data.positions[i * 3 + 2]);
+      mesh.setMatrixAt(i, matrix);
+    }
+    mesh.instanceMatrix.needsUpdate = true;
+  }, [data.positions, count, sizes]);
+  useLayoutEffect(() => {
+    const mesh = meshRef.current;
+    if (!mesh || !count)
+      return;
+    for (let i = 0; i < count; i++) {
+      const group = data.groups[i];
+      const color = highlightedGroup < 0 || highlightedGroup == group ? colors[group % colors.length] : GRAY;
+      mesh.setColorAt(i, color);
+    }
+    mesh.instanceColor.needsUpdate = true;
+  }, [data.groups, count, colors, highlightedGroup]);
+  useEffect(() => {
+    hoveredRef.current = -1;
+    setHovered(-1);
+  }, [octree]);
+  useEffect(() => {
+    const handlePointerMove = () => {
+      raycaster.setFromCamera(pointer, camera);
+      const hit = octree.raycast(raycaster.ray);
+      if (hit !== hoveredRef.current) {
+        hoveredRef.current = hit;
+        setHovered(hit);
+        setHighlightedGroup(hit < 0 ? -1 : data.groups[hit]);
+      }
+    };
+    gl.domElement.addEventListener("pointermove", handlePointerMove);
+    return () => gl.domElement.removeEventListener("pointermove", handlePointerMove);
+  }, [octree, camera, gl, raycaster, pointer, data.groups, setHighlightedGroup]);
+  if (!count) {
+    return null;
+  }
+  return /* @__PURE__ */ React.createElement(React.Fragment, null, /* @__PURE__ */ React.createElement("instancedMesh", { key: count, ref: meshRef, args: [null, null, count], raycast: () => null, frustumCulled: false }, /* @__PURE__ */ React.createElement("sphereGeometry", { attach: "geometry", args: [1, 12, 8] }), /* @__PURE__ */ React.createElement("meshBasicMaterial", { attach: "material" })), hovered >= 0 && /* @__PURE__ */ React.createElement(Html, { position: pointPosition(data, hovered), style: { pointerEvents: "none" } }, /* @__PURE__ */ React.createElement(Tooltip, { index: data.indices[hovered], settings })));
+};
+return { default: DataPoints };
+})();
+const $DataLines = (() => {
+const useEffect = Re.useEffect, useLayoutEffect = Re.useLayoutEffect, useMemo = Re.useMemo, useRef = Re.useRef, useState = Re.useState;
+const THREE = aF;
+const parsePayload = $pointPayload.parsePayload;
+const apiUrl = $api.apiUrl;
+const GRAY = new THREE.Color("gray");
+const DataLines = ({ data, palette, highlightedGroup }) => {
+  const geometryRef = useRef();
+  const [hulls, setHulls] = useState(null);
+  const colors = useMemo(() => palette.map((c) => new THREE.Color(c.hex())), [palette]);
+  useEffect(() => {
+    if (!data.positions)
+      return;
+    let cancelled = false;
+    fetch(apiUrl("hulls.bin", { limit: data.count })).then((res) => res.status === 200 ? res.arrayBuffer() : null).then((buffer) => {
+      if (!cancelled && buffer)
+        setHulls(parsePayload(buffer));
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [data.positions, data.count]);
+  const colorArray = useMemo(() => hulls ? new Float32Array(hulls.count * 2 * 3) : null, [hulls]);
+  useLayoutEffect(() => {
+    const geometry = geometryRef.current;
+    if (!geometry || !hulls)
+      return;
+    for (let i = 0; i < hulls.count; i++) {
+      const group = hulls.groups[i];
+      const color = highlightedGroup < 0 || highlightedGroup == group ? colors[group % colors.length] : GRAY;
+      color.toArray(colorArray, i * 6);
+      color.toArray(colorArray, i * 6 + 3);
+    }
+    geometry.attributes.color.needsUpdate = true;
+  }, [hulls, colorArray, colors, highlightedGroup]);
+  if (!hulls || !hulls.count) {
+    return null;
+  }
+  return /* @__PURE__ */ React.createElement("lineSegments", { key: hulls.fingerprint + hulls.count, frustumCulled: false }, /* @__PURE__ */ React.createElement("bufferGeometry", { ref: geometryRef }, /* @__PURE__ */ React.createElement("bufferAttribute", { attach: "attributes-position", count: hulls.count * 2, array: hulls.segments, itemSize: 3 }), /* @__PURE__ */ React.createElement("bufferAttribute", { attach: "attributes-color", count: hulls.count * 2, array: colorArray, itemSize: 3 })), /* @__PURE__ */ React.createElement("lineBasicMaterial", { vertexColors: true }));
+};
+return { default: DataLines };
+})();
+const $ThreePointViz = (() => {
+const Canvas = JF;
+const useRef = Re.useRef, useState = Re.useState, useMemo = Re.useMemo;
+const useLayoutEffect = Re.useLayoutEffect;
+const Vector3 = aF.Vector3;
+const OrbitControls = hz;
+const DataPoints = $DataPoints.default;
+const DataLines = $DataLines.default;
+const distinctColors = X4;
+function Line({ start, end }) {
+  const ref = useRef();
+  useLayoutEffect(() => {
+    ref.current.geometry.setFromPoints([start, end].map((point) => new Vector3(...point)));
+  }, [start, end]);
+  return /* @__PURE__ */ React.createElement("line", { ref }, /* @__PURE__ */ React.createElement("bufferGeometry", null), /* @__PURE__ */ React.createElement("lineBasicMaterial", { color: "black" }));
+}
+const ThreePointVis = ({ data, settings }) => {
+  const groupCount = Math.max(1, data.group_count || 0);
+  const palette = useMemo(() => distinctColors({ count: groupCount, lightMin: 50, lightMax: 80, chromaMin: 70 }), [groupCount]);
+  const [highlightedGroup, setHighlightedGroup] = useState(-1);
+  return /* @__PURE__ */ React.createElement(Canvas, { camera: { position: [0, 0, -5] } }, /* @__PURE__ */ React.createElement(OrbitControls, { target: [0, 0, 0] }), /* @__PURE__ */ React.createElement("ambientLight", { color: "#ffffff", intensity: 0.1 }), /* @__PURE__ */ React.createElement(
+    "hemisphereLight",
+    {
+      color: "#ffffff",
+      skyColor: "#ffffbb",
+      groundColor: "#080820",
+      intensity: 1
+    }
+  ), /* @__PURE__ */ React.createElement(DataPoints, { data, palette, highlightedGroup, setHighlightedGroup, settings }), settings[0].showLines && /* @__PURE__ */ React.createElement(DataLines, { data, palette, highlightedGroup }), /* @__PURE__ */ React.createElement(Line, { start: [-1, 0, 0], end: [1, 0, 0] }), /* @__PURE__ */ React.createElement(Line, { start: [0, -1, 0], end: [0, 1, 0] }), /* @__PURE__ */ React.createElement(Line, { start: [0, 0, -1], end: [0, 0, 1] }));
+};
+return { default: ThreePointVis };
+})();
+const $ButtonGroup = (() => {
+const ButtonGroup = (settings) => {
+  const handleToggleDocuments = () => {
+    settings.settings[1]({ showDocuments: !settings.settings[0].showDocuments, showMetadata: settings.settings[0].showMetadata, showLines: settings.settings[0].showLines });
+  };
+  const handleToggleMetadata = () => {
+    settings.settings[1]({ showDocuments: settings.settings[0].showDocuments, showMetadata: !settings.settings[0].showMetadata, showLines: settings.settings[0].showLines });
+  };
+  const handleToggleLines = () => {
+    settings.settings[1]({ showDocuments: settings.settings[0].showDocuments, showMetadata: settings.settings[0].showMetadata, showLines: !settings.settings[0].showLines });
+  };
+  return /* @__PURE__ */ React.createElement("div", { className: "button-group" }, /* @__PURE__ */ React.createElement("button", { className: `btn ${settings.settings[0].showDocuments ? "active" : ""}`, onClick: handleToggleDocuments }, "docs"), /* @__PURE__ */ React.createElement("button", { className: `btn ${settings.settings[0].showMetadata ? "active" : ""}`, onClick: handleToggleMetadata }, "metadata"), /* @__PURE__ */ React.createElement("button", { className: `btn ${settings.settings[0].showLines ? "active" : ""}`, onClick: handleToggleLines }, "lines"), settings.more && /* @__PURE__ */ React.createElement("button", { className: "btn", onClick: settings.more.showMore }, "more (", settings.more.shown, "/", settings.more.total, ")"));
+};
+return { default: ButtonGroup };
+})();
+const $Footer = (() => {
+const ButtonGroup = $ButtonGroup.default;
+const Footer = ({ settings, more }) => {
+  return /* @__PURE__ */ React.createElement("div", { className: "footer" }, /* @__PURE__ */ React.createElement(ButtonGroup, { settings, more }), /* @__PURE__ */ React.createElement("h4", null, "chroma visualizer 0.0.2"));
+};
+return { default: Footer };
+})();
+const $App = (() => {
+const useEffect = Re.useEffect, useState = Re.useState;
+const BarLoader = s3;
+const ThreePointVis = $ThreePointViz.default;
+const Footer = $Footer.default;
+const parsePointPayload = $pointPayload.parsePointPayload;
+const apiUrl = $api.apiUrl;
+function App() {
+  const [data, setData] = useState([[]]);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState(null);
+  const [settings, setSettings] = useState({ showDocuments: true, showMetadata: true, showLines: true });
+  const [progress, setProgress] = useState(null);
+  const [limit, setLimit] = useState(null);
+  useEffect(() => {
+    let timer = null;
+    const poll = (job) => {
+      fetch(`jobs/${job}`).then((res) => res.json()).then(
+        (body) => {
+          if (body.status === "queued" || body.status === "running") {
+            setProgress(body);
+            timer = setTimeout(() => poll(job), 1e3);
+            return;
+          }
+          load();
+        },
+        (error2) => {
+          setLoading(false);
+          setError(error2);
+        }
+      );
+    };
+    const load = () => {
+      fetch(apiUrl("data.bin", { limit })).then((res) => res.ok && res.status !== 202 ? res.arrayBuffer().then((buffer) => ({ status: res.status, body: parsePointPayload(buffer) })) : res.json().then((body) => ({ status: res.status, body }))).then(
+        ({ status, body }) => {
+          if (status === 202) {
+            setProgress(body);
+            timer = setTimeout(() => poll(body.job), 1e3);
+            return;
+          }
+          if (status !== 200) {
+            setLoading(false);
+            setError(body.error || `HTTP ${status}`);
+            return;
+          }
+          setLoading(false);
+          setData(body);
+        },
+        // Note: it's important to handle errors here
+        // instead of a catch() block so that we don't swallow
+        // exceptions from actual bugs in components.
+        (error2) => {
+          setLoading(false);
+          setError(error2);
+        }
+      );
+    };
+    load();
+    return () => clearTimeout(timer);
+  }, [limit]);
+  const showMore = () => setLimit(Math.min(data.total, Math.max(data.count * 2, 1)));
+  return /* @__PURE__ */ React.createElement(React.Fragment, null, loading && /* @__PURE__ */ React.createElement("div", { style: {
+    position: "absolute",
+    left: "50%",
+    top: "50%",
+    transform: "translate(-50%, -50%)"
+  } }, /* @__PURE__ */ React.createElement(
+    BarLoader,
+    {
+      size: 150,
+      "aria-label": "Loading Spinner",
+      "data-testid": "loader"
+    }
+  ), progress && /* @__PURE__ */ React.createElement("p", null, progress.stage, " (", Math.round(progress.progress * 100), "%, ", progress.stage_elapsed, "s) ", progress.detail)), !loading && error && /* @__PURE__ */ React.createElement("div", { style: {
+    position: "absolute",
+    left: "50%",
+    top: "50%",
+    transform: "translate(-50%, -50%)"
+  } }, /* @__PURE__ */ React.createElement("p", null, String(error))), !loading && !error && /* @__PURE__ */ React.createElement(React.Fragment, null, /* @__PURE__ */ React.createElement("div", { className: "vis-container" }, /* @__PURE__ */ React.createElement(ThreePointVis, { data, settings: [settings, setSettings] })), /* @__PURE__ */ React.createElement(Footer, { settings: [settings, setSettings], more: data.count < data.total ? { shown: data.count, total: data.total, showMore } : null })));
+}
+return { default: App };
+})();
+const $main = (() => {
+const ReactDOM = Uy;
+const App = $App.default;
+ReactDOM.createRoot(document.getElementById("root")).render(
+  /* @__PURE__ */ React.createElement(App, null)
+);
+return {  };
+})();
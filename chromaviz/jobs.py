@@ -0,0 +1,114 @@
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ProjectionJob:
+    """
+    State of one background projection. `stage` moves through the names
+    passed to `report()` by the projection function; `progress` is 0..1.
+    """
+
+    def __init__(self, key: str):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.status = "queued"
+        self.stage = "queued"
+        self.progress = 0.0
+        self.detail = ""
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.stage_started = self.created
+        self.done = threading.Event()
+
+    def report(self, stage: str, progress: float, detail: str = ""):
+        if stage != self.stage:
+            self.stage_started = time.time()
+        self.stage = stage
+        self.progress = max(0.0, min(1.0, float(progress)))
+        self.detail = detail
+
+    def to_dict(self) -> dict:
+        now = time.time()
+        return {
+            "job": self.id,
+            "key": self.key,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": round(self.progress, 3),
+            "detail": self.detail,
+            "error": self.error,
+            "elapsed": round((self.finished or now) - (self.started or now), 3),
+            "stage_elapsed": round(now - self.stage_started, 3),
+        }
+
+
+class ProjectionJobs:
+    """
+    Runs projection functions on a small thread pool. Submitting a key that
+    already has a queued or running job returns that job instead of starting
+    a second computation.
+    """
+
+    def __init__(self, max_workers: int = 1, keep_finished: int = 32):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chromaviz-job")
+        self._jobs = {}
+        self._active = {}
+        self._last = {}
+        self._finished = []
+        self._keep_finished = keep_finished
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, fn) -> ProjectionJob:
+        """`fn(job)` does the work and reports progress through `job.report`."""
+        with self._lock:
+            job = self._active.get(key)
+            if job is not None:
+                return job
+            job = ProjectionJob(key)
+            self._jobs[job.id] = job
+            self._active[key] = job
+        self._executor.submit(self._run, job, fn)
+        return job
+
+    def _run(self, job: ProjectionJob, fn):
+        job.status = "running"
+        job.started = time.time()
+        try:
+            fn(job)
+            job.status = "done"
+            job.report("done", 1.0)
+        except Exception as e:
+            traceback.print_exc()
+            job.status = "error"
+            job.error = str(e)
+        finally:
+            job.finished = time.time()
+            with self._lock:
+                self._active.pop(job.key, None)
+                self._last[job.key] = job
+                self._finished.append(job.id)
+                while len(self._finished) > self._keep_finished:
+                    self._jobs.pop(self._finished.pop(0), None)
+            job.done.set()
+
+    def get(self, job_id: str):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active(self, key: str):
+        with self._lock:
+            return self._active.get(key)
+
+    def pop_failed(self, key: str):
+        """Return (and forget) the last job for `key` if it ended in an error."""
+        with self._lock:
+            job = self._last.get(key)
+            if job is not None and job.status == "error":
+                del self._last[key]
+                return job
+            return None
@@ -0,0 +1,45 @@
+import numpy as np
+
+
+def load_embeddings(col, page_size: int = 5000):
+    """
+    Page through `col` with limit/offset and copy each page of embeddings
+    straight into a preallocated float32 matrix. Documents and metadata are
+    not fetched; use `fetch_details` for the rows that need them.
+    Returns (ids, matrix).
+    """
+    total = col.count()
+    ids = []
+    matrix = None
+    offset = 0
+    while offset < total:
+        page = col.get(include=["embeddings"], limit=page_size, offset=offset)
+        page_ids = page["ids"]
+        if not page_ids:
+            break
+        # The collection may have grown since count(); keep only what was allocated
+        n = min(len(page_ids), total - offset)
+        embeddings = page["embeddings"]
+        if matrix is None:
+            matrix = np.empty((total, len(embeddings[0])), dtype=np.float32)
+        matrix[offset:offset + n] = np.asarray(embeddings[:n], dtype=np.float32)
+        ids.extend(page_ids[:n])
+        offset += n
+        print(f'Loaded {offset}/{total} embeddings')
+
+    if matrix is None:
+        return [], np.empty((0, 0), dtype=np.float32)
+    return ids, matrix[:offset]
+
+
+def fetch_details(col, ids, page_size: int = 5000):
+    """Documents and metadatas for `ids`, in the same order as `ids`."""
+    documents = {}
+    metadatas = {}
+    for start in range(0, len(ids), page_size):
+        chunk = list(ids[start:start + page_size])
+        page = col.get(ids=chunk, include=["documents", "metadatas"])
+        for doc_id, document, metadata in zip(page["ids"], page["documents"], page["metadatas"]):
+            documents[doc_id] = document
+            metadatas[doc_id] = metadata
+    return [documents.get(i) for i in ids], [metadatas.get(i) for i in ids]
@@ -0,0 +1,156 @@
+import time
+
+import numpy as np
+from scipy.spatial import ConvexHull, QhullError
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import PCA
+from sklearn.manifold import TSNE
+from sklearn.neighbors import NearestNeighbors
+
+
+def _no_report(stage, progress, detail=""):
+    pass
+
+
+def stratified_sample(features, sample_size: int, strata: int = 64, seed: int = 0):
+    """
+    Pick `sample_size` row indices spread across k-means strata of `features`.
+    Each stratum contributes in proportion to its size (at least one row),
+    starting with the row nearest its centroid so every cluster is seeded.
+    """
+    rng = np.random.default_rng(seed)
+    n = features.shape[0]
+    strata = max(1, min(strata, sample_size, n))
+    kmeans = MiniBatchKMeans(n_clusters=strata, random_state=seed, n_init=3, batch_size=4096)
+    labels = kmeans.fit_predict(features)
+    distances = np.linalg.norm(features - kmeans.cluster_centers_[labels], axis=1)
+
+    sizes = np.bincount(labels, minlength=strata)
+    quotas = np.maximum(1, np.floor(sizes / n * sample_size)).astype(np.int64)
+    quotas = np.minimum(quotas, sizes)
+
+    picked = []
+    for s in range(strata):
+        members = np.flatnonzero(labels == s)
+        if members.size == 0:
+            continue
+        seed_row = members[np.argmin(distances[members])]
+        rest = members[members != seed_row]
+        extra = rng.choice(rest, size=min(quotas[s] - 1, rest.size), replace=False)
+        picked.append(np.concatenate(([seed_row], extra)))
+    picked = np.concatenate(picked)
+
+    # Rounding can leave us short of the target; top up at random
+    if picked.size < sample_size:
+        remaining = np.setdiff1d(np.arange(n), picked, assume_unique=True)
+        top_up = rng.choice(remaining, size=min(sample_size - picked.size, remaining.size), replace=False)
+        picked = np.concatenate((picked, top_up))
+    return rng.permutation(picked)[:sample_size]
+
+
+def interpolate_positions(sample_features, sample_positions, features, k: int = 5, chunk: int = 65536):
+    """
+    Place rows of `features` onto an existing layout by inverse-distance
+    weighting the positions of their `k` nearest sampled neighbours.
+    """
+    k = max(1, min(k, sample_features.shape[0]))
+    nn = NearestNeighbors(n_neighbors=k).fit(sample_features)
+    out = np.empty((features.shape[0], sample_positions.shape[1]), dtype=np.float32)
+    for start in range(0, features.shape[0], chunk):
+        distances, neighbours = nn.kneighbors(features[start:start + chunk])
+        weights = 1.0 / np.maximum(distances, 1e-6)
+        weights /= weights.sum(axis=1, keepdims=True)
+        out[start:start + chunk] = np.einsum("nk,nkd->nd", weights, sample_positions[neighbours])
+    return out
+
+
+def compute_projection(embeddings, report=_no_report, sample_size: int = 0) -> dict:
+    """
+    Project embeddings to 3D: PCA down to 50 dimensions, then t-SNE to 3.
+    Returns a dict of arrays suitable for ProjectionCache. `report(stage,
+    progress, detail)` is called as each stage starts.
+
+    With `sample_size` set and more rows than that, t-SNE only runs on a
+    stratified sample and the remaining rows are interpolated onto it.
+    `order` lists the sampled rows first so clients can reveal points
+    progressively; `sampled` is the number of rows laid out by t-SNE.
+    Point groups come from chromaviz.clustering, not from this layout.
+    """
+    report("pca", 0.05, "PCA to 50 components")
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    print('Size of the embedding matrix: {}'.format(matrix.shape))
+    n = matrix.shape[0]
+    sampling = bool(sample_size) and n > sample_size
+
+    if sampling:
+        # The principal axes settle long before every row has been seen
+        pca_50 = PCA(n_components=50, svd_solver="randomized", random_state=0)
+        fit_rows = np.random.default_rng(0).choice(n, size=min(n, max(sample_size, 100000)), replace=False)
+        pca_50.fit(matrix[fit_rows])
+        pca_result_50 = pca_50.transform(matrix).astype(np.float32)
+    else:
+        pca_50 = PCA(n_components=50)
+        pca_result_50 = pca_50.fit_transform(matrix)
+
+    print('Cumulative explained variation for 50 principal components: {}'.format(np.sum(pca_50.explained_variance_ratio_)))
+
+    if sampling:
+        report("sampling", 0.15, f"stratified sample of {sample_size} of {n} points")
+        sample = stratified_sample(pca_result_50, sample_size)
+    else:
+        sample = np.arange(n)
+
+    time_start = time.time()
+
+    report("tsne", 0.2, f"t-SNE of {sample.size} points to 3 dimensions, 300 iterations")
+    tsne = TSNE(n_components=3, verbose=0, perplexity=40, n_iter=300)
+    tsne_pca_results = tsne.fit_transform(pca_result_50[sample])
+
+    print('t-SNE done! Time elapsed: {} seconds'.format(time.time()-time_start))
+    tsne_pca_results = (tsne_pca_results / 3).astype(np.float32)
+
+    if sampling:
+        report("interpolating", 0.85, f"placing {n - sample.size} points by nearest sampled neighbours")
+        rest = np.setdiff1d(np.arange(n), sample)
+        positions = np.empty((n, 3), dtype=np.float32)
+        positions[sample] = tsne_pca_results
+        positions[rest] = interpolate_positions(pca_result_50[sample], tsne_pca_results, pca_result_50[rest])
+        order = np.concatenate((sample, np.random.default_rng(0).permutation(rest)))
+    else:
+        positions = tsne_pca_results
+        order = sample
+
+    return {
+        "positions": positions,
+        "order": order.astype(np.int64),
+        "sampled": np.array(sample.size, dtype=np.int64),
+    }
+
+
+def compute_hulls(positions, groups, min_points: int = 6) -> dict:
+    """
+    Convex hull edges for every group with at least `min_points` points.
+    Returns `segments` (m x 2 x 3 float32 endpoints) and the group id of each
+    segment, with edges shared by neighbouring hull faces emitted once.
+    """
+    positions = np.asarray(positions, dtype=np.float32)
+    groups = np.asarray(groups)
+    segments = []
+    segment_groups = []
+    for group in np.unique(groups):
+        members = positions[groups == group]
+        if members.shape[0] < min_points:
+            continue
+        try:
+            hull = ConvexHull(members)
+        except QhullError:
+            # Flat or degenerate groups have no 3D hull
+            continue
+        edges = np.concatenate((hull.simplices[:, [0, 1]], hull.simplices[:, [1, 2]], hull.simplices[:, [2, 0]]))
+        edges = np.unique(np.sort(edges, axis=1), axis=0)
+        segments.append(members[edges])
+        segment_groups.append(np.full(edges.shape[0], group, dtype=np.int32))
+
+    if not segments:
+        return {"segments": np.empty((0, 2, 3), dtype=np.float32), "groups": np.empty(0, dtype=np.int32)}
+    return {"segments": np.concatenate(segments), "groups": np.concatenate(segment_groups)}
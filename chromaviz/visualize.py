@@ -1,13 +1,19 @@
 import chromadb
 from flask import Flask
 from flask_cors import CORS
+import os
+import threading
 import time
 import json
 import numpy as np
-import pandas as pd
-from sklearn.decomposition import PCA
-from sklearn.manifold import TSNE
 import webbrowser
+from collections import OrderedDict
+
+from .cache import ProjectionCache, collection_fingerprint
+from .clustering import cluster_embeddings
+from .jobs import ProjectionJobs
+from .loader import fetch_details, load_embeddings
+from .projection import compute_hulls, compute_projection
 
 import importlib.resources
         
@@ -17,9 +23,203 @@ CORS(app)
 from flask import cli
 from flask import Response
 from flask import request
+from flask import jsonify
 cli.show_server_banner = lambda *_: None
 
-data = [[]]
+# Page size for paged collection reads
+PAGE_SIZE = int(os.getenv("CHROMAVIZ_PAGE_SIZE", "5000"))
+
+# Above this many points t-SNE runs on a stratified sample and the rest are
+# interpolated onto it (0 disables sampling)
+SAMPLE_SIZE = int(os.getenv("CHROMAVIZ_SAMPLE_SIZE", "20000"))
+
+# Number of point groups (k-means clusters); "auto" picks k on a sample
+CLUSTERS = os.getenv("CHROMAVIZ_CLUSTERS", "auto").strip().lower()
+
+# Projection cache; size and on-disk location can be tuned via env
+projection_cache = ProjectionCache(
+    max_bytes=int(os.getenv("CHROMAVIZ_CACHE_MB", "512")) * 1024 * 1024,
+    cache_dir=os.getenv("CHROMAVIZ_CACHE_DIR") or None,
+    max_disk_bytes=int(os.getenv("CHROMAVIZ_CACHE_DISK_MB", "2048")) * 1024 * 1024,
+)
+
+# Background projection jobs, so /data never computes a layout inline
+projection_jobs = ProjectionJobs(max_workers=int(os.getenv("CHROMAVIZ_JOB_WORKERS", "1")))
+
+# Longest a /data?wait=N request may block for its layout before it answers 202
+MAX_DATA_WAIT = float(os.getenv("CHROMAVIZ_MAX_DATA_WAIT", "30"))
+
+# Collections kept loaded at once, and the memory their embeddings and pinned
+# layouts may use in total; the least recently used one is dropped first
+MAX_COLLECTIONS = int(os.getenv("CHROMAVIZ_MAX_COLLECTIONS", "8"))
+MAX_COLLECTION_BYTES = int(os.getenv("CHROMAVIZ_COLLECTIONS_MB", "2048")) * 1024 * 1024
+
+
+class CollectionState:
+    """
+    One visualized collection: its embeddings, content fingerprint and the
+    cache keys of its projection. `lock` serializes loading so concurrent
+    requests for the same collection share a single read. The latest layout
+    and clusters are pinned here as well, so they stay available when the
+    cache budget is too small to hold them.
+    """
+
+    def __init__(self, name: str, col=None):
+        self.name = name
+        self.collection = col
+        self.data = None
+        self.fingerprint = None
+        self.pinned = {}
+        self.lock = threading.Lock()
+
+    def set_data(self, new_data, col=None):
+        """
+        `new_data` holds "ids" and "embeddings"; "documents" and "metadatas"
+        are optional and are fetched from the collection on demand when absent.
+        """
+        new_data["embeddings"] = np.asarray(new_data["embeddings"], dtype=np.float32)
+        if col is not None:
+            self.collection = col
+        self.fingerprint = collection_fingerprint(new_data["ids"], new_data["embeddings"])
+        self.data = new_data
+        self.pinned = {key: entry for key, entry in self.pinned.items() if key in (self.cache_key(), self.cluster_key())}
+
+    def load(self, col):
+        ids, embeddings = load_embeddings(col, page_size=PAGE_SIZE)
+        self.set_data({"ids": ids, "embeddings": embeddings}, col)
+
+    def cache_key(self):
+        return ProjectionCache.key(self.name, f"{self.fingerprint}:lod{SAMPLE_SIZE}:k{CLUSTERS}")
+
+    def cluster_key(self):
+        return ProjectionCache.key(self.name, f"{self.fingerprint}:clusters:k{CLUSTERS}")
+
+    def cached(self, key):
+        """The pinned or cached entry for `key` (pinning it when it is current), or None."""
+        entry = self.pinned.get(key)
+        if entry is None:
+            entry = projection_cache.get(key)
+            if entry is not None:
+                self.pin(key, entry)
+        return entry
+
+    def pin(self, key, entry):
+        """Keep `entry` regardless of the cache budget, if it belongs to the current snapshot."""
+        if key in (self.cache_key(), self.cluster_key()):
+            self.pinned[key] = entry
+        return entry
+
+    def nbytes(self) -> int:
+        """Memory held by the loaded embeddings and the pinned entries."""
+        size = self.data["embeddings"].nbytes if self.data is not None else 0
+        return size + sum(value.nbytes for entry in self.pinned.values() for value in entry.values())
+
+    def details(self, indices):
+        """(ids, documents, metadatas) for the given point indices."""
+        ids = [self.data["ids"][i] for i in indices]
+        if "documents" in self.data:
+            return ids, [self.data["documents"][i] for i in indices], [self.data["metadatas"][i] for i in indices]
+        documents, metadatas = fetch_details(self.collection, ids, page_size=PAGE_SIZE)
+        return ids, documents, metadatas
+
+
+_states = OrderedDict()
+_states_lock = threading.Lock()
+_default_collection = None
+_get_collection = None
+_server_thread = None
+_server_port = None
+
+def _register(name: str) -> CollectionState:
+    """The state for `name`, created if needed and marked most recently used."""
+    with _states_lock:
+        state = _states.get(name)
+        if state is None:
+            state = _states[name] = CollectionState(name)
+        _states.move_to_end(name)
+    _trim_states()
+    return state
+
+def _trim_states():
+    """
+    Drop the least recently used states until MAX_COLLECTIONS and
+    MAX_COLLECTION_BYTES are met. The most recently used one is always kept.
+    """
+    with _states_lock:
+        total = sum(state.nbytes() for state in _states.values())
+        while len(_states) > 1 and (len(_states) > MAX_COLLECTIONS or total > MAX_COLLECTION_BYTES):
+            _, state = _states.popitem(last=False)
+            total -= state.nbytes()
+
+def _set_data(new_data, name="", col=None):
+    """Replace the data shown for collection `name` and start projecting it."""
+    global _default_collection
+    state = _register(name)
+    with state.lock:
+        state.set_data(new_data, col)
+    _trim_states()
+    _default_collection = name
+    _start_projection(state)
+    return state
+
+def _state_for_request():
+    """
+    (state, None) for the ?collection= of the current request (default: the
+    last one visualized), loading it through the collection resolver on first
+    use; otherwise (None, error response).
+    """
+    name = request.args.get("collection")
+    if name is None:
+        name = _default_collection
+    if name is None:
+        return None, (jsonify({'error': 'No collection selected; pass ?collection=<name>'}), 400)
+
+    with _states_lock:
+        state = _states.get(name)
+    if state is None and _get_collection is None:
+        return None, (jsonify({'error': f'Unknown collection {name}'}), 404)
+    state = _register(name)
+
+    with state.lock:
+        if state.data is None:
+            try:
+                state.load(state.collection or _get_collection(name))
+            except Exception as e:
+                with _states_lock:
+                    if _states.get(name) is state:
+                        del _states[name]
+                return None, (jsonify({'error': f'Failed to load collection {name}: {e}'}), 404)
+            _trim_states()
+    return state, None
+
+def _clusters(state, key, embeddings, report=None):
+    """Cluster labels for `embeddings`, computed once per fingerprint and cached under `key`."""
+    clusters = state.cached(key)
+    if clusters is None:
+        k = None if CLUSTERS == "auto" else int(CLUSTERS)
+        if report is not None:
+            report("clustering", 0.9, f"mini-batch k-means (k={CLUSTERS})")
+        clusters = state.pin(key, projection_cache.put(key, cluster_embeddings(embeddings, k=k)))
+    return clusters
+
+def _start_projection(state):
+    """Queue a projection for `state` unless it is cached or running."""
+    # Snapshot the keys and data, the collection may be reloaded while this runs
+    key = state.cache_key()
+    cluster_key = state.cluster_key()
+    embeddings = state.data["embeddings"]
+
+    def run(job):
+        if state.cached(key) is not None:
+            return
+        job.report("loading", 0.0, f"{len(embeddings)} embeddings")
+        projection = compute_projection(embeddings, report=job.report, sample_size=SAMPLE_SIZE)
+        projection["groups"] = _clusters(state, cluster_key, embeddings, report=job.report)["labels"]
+        # Pinned on the state too: the cache may be too small to keep it for /data
+        state.pin(key, projection_cache.put(key, projection))
+        _trim_states()
+
+    return projection_jobs.submit(key, run)
 
 @app.route("/")
 def hello_world():
@@ -45,37 +245,54 @@ def serve_assets(filename):
 
 @app.route("/import-data", methods=["POST"])
 def import_data_api():
-     global data
-     data = json.loads(request.data)
+     _set_data(json.loads(request.data), request.args.get("collection", ""))
      return '', 204
 
+def _projection_or_pending(wait: float = 0):
+    """
+    Return (state, projection, None) when the layout for the requested
+    collection is cached, otherwise (state, None, response) with the 202 job
+    status, a 500 if the job failed, or the error from resolving the collection.
+    A running job is waited on for up to `wait` seconds before answering 202.
+    """
+    state, error = _state_for_request()
+    if error is not None:
+        return None, None, error
+    key = state.cache_key()
+    deadline = time.monotonic() + max(0.0, min(wait, MAX_DATA_WAIT))
+    while True:
+        projection = state.cached(key)
+        if projection is not None:
+            return state, projection, None
+        failed = projection_jobs.pop_failed(key)
+        if failed is not None:
+            return state, None, (jsonify(failed.to_dict()), 500)
+        job = projection_jobs.active(key) or _start_projection(state)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not job.done.wait(remaining):
+            break
+    status = job.to_dict()
+    status["status_url"] = f"/jobs/{job.id}"
+    return state, None, (jsonify(status), 202, {"Location": status["status_url"], "Retry-After": "1"})
+
 @app.route("/data", methods=["GET"])
 def data_api():
-    df = pd.DataFrame.from_dict(data=data["embeddings"])
-    print(df)
-    print('Size of the dataframe: {}'.format(df.shape))
-    
-    pca_50 = PCA(n_components=50)
-    pca_result_50 = pca_50.fit_transform(df)
-
-    print('Cumulative explained variation for 50 principal components: {}'.format(np.sum(pca_50.explained_variance_ratio_)))
-
-    time_start = time.time()
-
-    tsne = TSNE(n_components=3, verbose=0, perplexity=40, n_iter=300)
-    tsne_pca_results = tsne.fit_transform(pca_result_50)
-
-    print('t-SNE done! Time elapsed: {} seconds'.format(time.time()-time_start))
-    tsne_pca_results = tsne_pca_results / 3
-
-    pca_3 = PCA(n_components=3)
-    pca_result_3 = pca_3.fit_transform(df)
-    pca_result_3 *= 10
-
-    groups = np.argmax(pca_result_50, axis=1)
+    """
+    Every point with its document and metadata, as JSON. Answers 202 with the
+    job status while the layout is computed, like the binary endpoints;
+    ?wait=N first waits up to N seconds (at most CHROMAVIZ_MAX_DATA_WAIT).
+    """
+    try:
+        wait = float(request.args.get("wait", 0))
+    except ValueError:
+        return jsonify({'error': 'wait must be a number of seconds'}), 400
+    state, projection, pending = _projection_or_pending(wait=wait)
+    if pending is not None:
+        return pending
 
+    ids, documents, metadatas = state.details(range(len(state.data["ids"])))
     points = []
-    for position, document, metadata, id, group in zip(tsne_pca_results.tolist(), data["documents"], data["metadatas"], data["ids"], groups.tolist()):
+    for position, document, metadata, id, group in zip(projection["positions"].tolist(), documents, metadatas, ids, projection["groups"].tolist()):
         point = {
         'position': position,
         'document': document,
@@ -86,8 +303,199 @@ def data_api():
         points.append(point)
     return json.dumps({'points': points})
 
-def visualize_collection(col: chromadb.api.models.Collection.Collection, port: int = 5001):
-    global data
-    data = col.get(include=["documents", "metadatas", "embeddings"])
-    app.run(port=port, debug=False)
-    return
\ No newline at end of file
+def _pack_buffers(header: dict, buffers) -> bytes:
+    """
+    Binary payload: a little-endian uint32 header length, a JSON header, then
+    each (name, array) in `buffers` as a 4-byte aligned little-endian buffer.
+    The header gets a {dtype, shape, offset} entry per buffer, with offsets
+    counted from the start of the payload.
+    """
+    def _align(n):
+        return (n + 3) & ~3
+
+    for name, array in buffers:
+        header[name] = {"dtype": array.dtype.name, "shape": [int(d) for d in array.shape], "offset": 10**12}
+    # Offsets depend on the header length, so settle them with a fixed-width placeholder first
+    header_len = _align(4 + len(json.dumps(header).encode("utf-8"))) - 4
+    offset = 4 + header_len
+    for name, array in buffers:
+        header[name]["offset"] = offset
+        offset = _align(offset + array.nbytes)
+    header_bytes = json.dumps(header).encode("utf-8").ljust(header_len, b" ")
+
+    out = bytearray(offset)
+    out[0:4] = np.uint32(header_len).astype("<u4").tobytes()
+    out[4:4 + header_len] = header_bytes
+    for name, array in buffers:
+        start = header[name]["offset"]
+        out[start:start + array.nbytes] = np.ascontiguousarray(array).tobytes()
+    return bytes(out)
+
+def _group_array(groups):
+    """Group ids as uint16 when they fit, else uint32 (little-endian)."""
+    if groups.size == 0 or int(groups.max()) < 65536:
+        return np.ascontiguousarray(groups, dtype="<u2")
+    return np.ascontiguousarray(groups, dtype="<u4")
+
+def _lod_order(projection, limit=None):
+    order = projection["order"]
+    if limit is not None:
+        order = order[:max(0, limit)]
+    return order
+
+def _pack_points(state, projection, limit=None) -> bytes:
+    """
+    Point payload: float32 positions (count x 3), uint16 or uint32 group ids
+    and uint32 point indices.
+
+    Points are sent in level-of-detail order (t-SNE sampled points first) and
+    truncated to `limit`; `indices` maps each one back to its /points index.
+    """
+    order = _lod_order(projection, limit)
+    groups = projection["groups"]
+    header = {
+        "collection": state.name,
+        "fingerprint": state.fingerprint,
+        "count": int(order.shape[0]),
+        "total": int(projection["order"].shape[0]),
+        "sampled": int(projection["sampled"]),
+        "group_count": int(groups.max()) + 1 if groups.size else 0,
+    }
+    return _pack_buffers(header, [
+        ("positions", np.ascontiguousarray(projection["positions"][order], dtype="<f4")),
+        ("groups", _group_array(groups[order])),
+        ("indices", np.ascontiguousarray(order, dtype="<u4")),
+    ])
+
+@app.route("/data.bin", methods=["GET"])
+def data_bin_api():
+    """?limit=N returns the first N points in level-of-detail order (default: the t-SNE sample)."""
+    state, projection, pending = _projection_or_pending()
+    if pending is not None:
+        return pending
+    try:
+        limit = int(request.args.get("limit", projection["sampled"]))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    return Response(_pack_points(state, projection, limit), mimetype="application/octet-stream")
+
+@app.route("/hulls.bin", methods=["GET"])
+def hulls_bin_api():
+    """
+    Convex hull edges of each group over the first ?limit=N points, as one
+    line-segments buffer: float32 endpoints (m x 2 x 3) and a group id per
+    segment. Hulls are computed once per layout and limit, then cached.
+    """
+    state, projection, pending = _projection_or_pending()
+    if pending is not None:
+        return pending
+    try:
+        limit = int(request.args.get("limit", projection["sampled"]))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+
+    order = _lod_order(projection, limit)
+    key = f"{state.cache_key()}:hulls:{order.shape[0]}"
+    hulls = projection_cache.get(key)
+    if hulls is None:
+        hulls = projection_cache.put(key, compute_hulls(projection["positions"][order], projection["groups"][order]))
+    header = {"collection": state.name, "fingerprint": state.fingerprint, "count": int(hulls["groups"].shape[0])}
+    payload = _pack_buffers(header, [
+        ("segments", np.ascontiguousarray(hulls["segments"], dtype="<f4")),
+        ("groups", _group_array(hulls["groups"])),
+    ])
+    return Response(payload, mimetype="application/octet-stream")
+
+@app.route("/clusters", methods=["GET"])
+def clusters_api():
+    """Number of clusters and the size of each."""
+    state, projection, pending = _projection_or_pending()
+    if pending is not None:
+        return pending
+    clusters = _clusters(state, state.cluster_key(), state.data["embeddings"])
+    return jsonify({
+        'collection': state.name,
+        'fingerprint': state.fingerprint,
+        'k': int(clusters["sizes"].shape[0]),
+        'sizes': clusters["sizes"].tolist(),
+    })
+
+@app.route("/points", methods=["GET"])
+def points_api():
+    """
+    Documents and metadata for the points listed in ?index=1,2,3 (payload
+    order), or for every point in cluster ?group=N.
+    """
+    try:
+        if "group" in request.args:
+            state, projection, pending = _projection_or_pending()
+            if pending is not None:
+                return pending
+            indices = np.flatnonzero(_clusters(state, state.cluster_key(), state.data["embeddings"])["labels"] == int(request.args["group"])).tolist()
+        else:
+            state, error = _state_for_request()
+            if error is not None:
+                return error
+            indices = [int(i) for i in request.args.get("index", "").split(",") if i.strip()]
+    except ValueError:
+        return jsonify({'error': 'index must be a comma separated list of integers and group an integer'}), 400
+    total = len(state.data["ids"])
+    indices = [i for i in indices if 0 <= i < total]
+    ids, documents, metadatas = state.details(indices)
+    out = []
+    for i, id, document, metadata in zip(indices, ids, documents, metadatas):
+        out.append({
+            'index': i,
+            'id': id,
+            'document': document,
+            'metadata': metadata,
+        })
+    return jsonify({'points': out})
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def job_status_api(job_id):
+    job = projection_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown job {job_id}'}), 404
+    return jsonify(job.to_dict())
+
+def start_visualizer(port: int = 5001, get_collection=None, background: bool = True):
+    """
+    Start the visualizer service. It serves any collection by name
+    (?collection=...), loading it through `get_collection(name)` on first use.
+    With `background=True` the server runs once on a daemon thread; later
+    calls only update the collection resolver.
+    """
+    global _server_thread, _server_port, _get_collection
+    if get_collection is not None:
+        _get_collection = get_collection
+    if not background:
+        _server_port = port
+        app.run(port=port, debug=False)
+        return
+    if _server_thread is None or not _server_thread.is_alive():
+        _server_port = port
+        _server_thread = threading.Thread(
+            target=app.run, kwargs={"port": port, "debug": False, "use_reloader": False}, daemon=True
+        )
+        _server_thread.start()
+
+def visualizer_port():
+    """The port the visualizer server listens on (None before it is started); it does not move on later calls."""
+    return _server_port
+
+def visualize_collection(col: chromadb.api.models.Collection.Collection, port: int = 5001, background: bool = False):
+    """
+    (Re)load `col` into the visualizer, make it the default collection and
+    start projecting it in the background. The server is started if it is
+    not running yet; by default this serves the visualizer and blocks.
+    """
+    global _default_collection
+    state = _register(col.name)
+    with state.lock:
+        state.load(col)
+    _trim_states()
+    _default_collection = col.name
+    _start_projection(state)
+    if not background or _server_thread is None or not _server_thread.is_alive():
+        start_visualizer(port, background=background)
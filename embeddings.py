@@ -0,0 +1,1311 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# ---- Embeddings over HTTP ---------------------------------------------------
+class BatchTooLarge(Exception):
+    """The embeddings server rejected or choked on a batch (413, timeout, out of memory)."""
+
+
+class AdaptiveBatchSize:
+    """
+    Batch size for HttpEmbeddingFunction tuned from what the server does with
+    it. The size grows by `grow` while texts/second keeps improving, falls
+    back to the last good size if it gets worse, and drops to the last good
+    size (or half) when a batch is too large; the payload of a rejected batch
+    also caps later payload bytes. Settled sizes are re-probed every
+    `reprobe_after` batches.
+    Slow batches (over half the request timeout) are treated like rejections
+    before they turn into timeouts.
+    """
+
+    def __init__(self, initial: int = 32, minimum: int = 1, maximum: int = 1024, grow: float = 1.5,
+                 samples: int = 3, reprobe_after: int = 50):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.size = min(self.maximum, max(self.minimum, int(initial)))
+        self.grow = float(grow)
+        self.samples = max(1, int(samples))
+        self.reprobe_after = int(reprobe_after)
+        self.max_bytes = None
+        self.best_rate = None
+        self.best_size = None
+        self.settled = 0
+        self.batches = 0
+        self.errors = 0
+        self._rates = []
+        self._lock = threading.Lock()
+
+    def batch_end(self, inputs, start: int) -> int:
+        """End index of the next batch starting at `start`, within the size and byte limits."""
+        with self._lock:
+            end = min(len(inputs), start + self.size)
+            max_bytes = self.max_bytes
+        if max_bytes is None:
+            return end
+        total = 0
+        for i in range(start, end):
+            total += len(inputs[i].encode("utf-8")) + 4
+            if total > max_bytes and i > start:
+                return i
+        return end
+
+    def record(self, count: int, seconds: float, payload_bytes: int, timeout: float = None) -> None:
+        with self._lock:
+            self.batches += 1
+            if timeout and seconds > timeout / 2:
+                self._shrink()
+                return
+            if count < self.size:
+                # Tail batches say little about the configured size
+                return
+            if self.settled:
+                self.settled -= 1
+                if not self.settled:
+                    self.best_rate = None
+                return
+            self._rates.append(count / max(seconds, 1e-6))
+            if len(self._rates) < self.samples:
+                return
+            rate = sorted(self._rates)[len(self._rates) // 2]
+            self._rates = []
+            if self.best_rate is None or rate > self.best_rate * 1.05:
+                self.best_rate, self.best_size = rate, self.size
+                if self.size < self.maximum:
+                    self.size = min(self.maximum, max(self.size + 1, int(self.size * self.grow)))
+                else:
+                    self.settled = self.reprobe_after
+            elif rate < self.best_rate * 0.9:
+                # Bigger batches made things worse: go back to the last good size
+                self.size = self.best_size
+                self.settled = self.reprobe_after
+            else:
+                # No longer improving: keep this size for a while
+                self.settled = self.reprobe_after
+
+    def too_large(self, count: int, payload_bytes: int) -> None:
+        with self._lock:
+            self.errors += 1
+            if count > 1:
+                self.max_bytes = int(payload_bytes * 0.9) if self.max_bytes is None else min(self.max_bytes, int(payload_bytes * 0.9))
+            if self.best_size is not None and self.best_size < count:
+                # Go back to the largest size that worked
+                self.size = min(self.size, self.best_size)
+            else:
+                self.size = min(self.size, max(self.minimum, count // 2))
+            self._shrink(halve=False)
+
+    def _shrink(self, halve: bool = True):
+        if halve:
+            self.size = max(self.minimum, self.size // 2)
+        self.best_rate = None
+        self._rates = []
+        self.settled = self.reprobe_after
+
+    def to_dict(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "batch_size": self.size,
+                "min_batch": self.minimum,
+                "max_batch": self.maximum,
+                "max_payload_bytes": self.max_bytes,
+                "best_texts_per_second": round(self.best_rate, 2) if self.best_rate else None,
+                "batches": self.batches,
+                "too_large": self.errors,
+            }
+
+
+# Response formats offered to the server, most compact first; JSON is always accepted
+BINARY_ACCEPT = "application/x-npy, application/octet-stream;q=0.9, application/json;q=0.5"
+
+
+def decode_vectors(resp) -> np.ndarray:
+    """
+    Embeddings from an /embed response as an (n, dim) float32 array, whatever
+    format the server answered with:
+      application/x-npy         a .npy file
+      application/octet-stream  raw little-endian float32, shape in X-Embedding-Shape: n,dim
+      application/json          {"vectors_b64": <base64 float32>, "shape": [n, dim]}
+                                or the plain {"vectors": [[float, ...], ...]}
+    """
+    content_type = (resp.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+    if content_type == "application/x-npy":
+        return np.load(io.BytesIO(resp.content), allow_pickle=False).astype(np.float32, copy=False)
+    if content_type == "application/octet-stream":
+        shape = resp.headers.get("X-Embedding-Shape")
+        if not shape:
+            raise ValueError("Binary response missing X-Embedding-Shape header.")
+        rows, dim = (int(x) for x in shape.split(","))
+        return np.frombuffer(resp.content, dtype="<f4").reshape(rows, dim)
+
+    data = resp.json()
+    if not isinstance(data, dict):
+        raise ValueError("Response JSON must be an object.")
+    if "vectors_b64" in data:
+        rows, dim = (int(x) for x in data["shape"])
+        return np.frombuffer(base64.b64decode(data["vectors_b64"]), dtype="<f4").reshape(rows, dim)
+    if "vectors" not in data:
+        raise ValueError("Response JSON missing 'vectors' key.")
+    vectors = data["vectors"]
+    if not isinstance(vectors, list):
+        raise ValueError("'vectors' must be a list.")
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError("Each embedding must be a list of numbers of the same length.")
+    return matrix
+
+
+def _is_too_large(err, resp) -> bool:
+    """413s, timeouts and server out-of-memory errors mean the batch should be smaller."""
+    if isinstance(err, requests.Timeout):
+        return True
+    if resp is None:
+        return False
+    if resp.status_code in (413, 507):
+        return True
+    return resp.status_code >= 500 and "memory" in (resp.text or "").lower()
+
+
+class Endpoint:
+    """One embeddings server as seen by EndpointPool."""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.in_flight = 0
+        self.ewma = None          # seconds per text
+        self.failures = 0         # consecutive
+        self.open_until = 0.0     # breaker open (ejected) until this monotonic time
+        self.probing = False      # half-open: one trial request in flight
+        self.requests = 0
+        self.errors = 0
+        self.ejections = 0
+
+    def state(self, now: float) -> str:
+        if not self.open_until:
+            return "closed"
+        return "open" if now < self.open_until else "half-open"
+
+
+class EndpointPool:
+    """
+    Load balancing over one or more embeddings servers. `pick()` chooses an
+    endpoint per request: `policy="least_outstanding"` takes the one with the
+    fewest requests in flight (ties go to the lower latency), `"latency"` the
+    lowest expected wait, i.e. latency EWMA x (requests in flight + 1).
+
+    Each endpoint has a circuit breaker: `failure_threshold` consecutive
+    failures eject it for `cooldown` seconds, after which a single trial
+    request either closes the breaker or ejects it again.
+    """
+
+    def __init__(self, urls, policy: str = "least_outstanding", failure_threshold: int = 3, cooldown: float = 10.0,
+                 alpha: float = 0.3):
+        self.endpoints = [Endpoint(u) for u in urls]
+        if not self.endpoints:
+            raise ValueError("At least one embeddings endpoint is required.")
+        self.policy = policy if policy in ("least_outstanding", "latency") else "least_outstanding"
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = float(cooldown)
+        self.alpha = float(alpha)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _available(endpoint: Endpoint, now: float) -> bool:
+        return endpoint.open_until <= now and not endpoint.probing
+
+    def _score(self, endpoint: Endpoint):
+        ewma = endpoint.ewma or 0.0  # unmeasured endpoints get tried first
+        if self.policy == "latency":
+            return (ewma * (endpoint.in_flight + 1), endpoint.in_flight)
+        return (endpoint.in_flight, ewma)
+
+    def pick(self, exclude=(), fallback: bool = True) -> Optional[Endpoint]:
+        """
+        The endpoint for the next request, preferring ones not in `exclude`.
+        Without `fallback`, returns None rather than an excluded or ejected one.
+        """
+        with self._lock:
+            now = time.monotonic()
+            available = [e for e in self.endpoints if self._available(e, now)]
+            candidates = [e for e in available if e not in exclude]
+            if candidates:
+                endpoint = min(candidates, key=self._score)
+            elif not fallback:
+                return None
+            elif available:
+                endpoint = min(available, key=self._score)
+            else:
+                # Every breaker is open: try the endpoint due back first rather than failing outright
+                endpoint = min(self.endpoints, key=lambda e: e.open_until)
+            if endpoint.open_until:
+                endpoint.probing = True
+            endpoint.in_flight += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def has_alternative(self, exclude) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            return any(self._available(e, now) and e not in exclude for e in self.endpoints)
+
+    def release(self, endpoint: Endpoint, ok: bool, seconds: Optional[float] = None, count: int = 1):
+        """Close out a request from `pick()`; `seconds` (for `count` texts) feeds the latency EWMA."""
+        with self._lock:
+            endpoint.in_flight -= 1
+            if ok:
+                endpoint.failures = 0
+                endpoint.open_until = 0.0
+                endpoint.probing = False
+                if seconds is not None:
+                    per_text = seconds / max(1, count)
+                    endpoint.ewma = per_text if endpoint.ewma is None else (
+                        self.alpha * per_text + (1 - self.alpha) * endpoint.ewma
+                    )
+                return
+            endpoint.errors += 1
+            endpoint.failures += 1
+            # A failed trial request re-ejects; requests already in flight when the breaker opened do not
+            if endpoint.probing or (not endpoint.open_until and endpoint.failures >= self.failure_threshold):
+                endpoint.open_until = time.monotonic() + self.cooldown
+                endpoint.probing = False
+                endpoint.ejections += 1
+                print(f"[embeddings] ejecting {endpoint.url} for {self.cooldown:g}s after {endpoint.failures} failure(s)")
+
+    def hedge_delay(self, endpoint: Endpoint, count: int, factor: float, minimum: float = 0.05) -> Optional[float]:
+        """How long to wait on `endpoint` before hedging a batch of `count` texts (None: no latency measured yet)."""
+        with self._lock:
+            if endpoint.ewma is None:
+                return None
+            return max(minimum, factor * endpoint.ewma * count)
+
+    def to_dict(self) -> List[Dict[str, object]]:
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "url": e.url,
+                    "state": e.state(now),
+                    "in_flight": e.in_flight,
+                    "ms_per_text": round(e.ewma * 1000.0, 3) if e.ewma is not None else None,
+                    "requests": e.requests,
+                    "errors": e.errors,
+                    "ejections": e.ejections,
+                }
+                for e in self.endpoints
+            ]
+
+
+class EndpointError(Exception):
+    """A request to one endpoint failed; keeps the URL and response body for the final error message."""
+
+    def __init__(self, url: str, error: Exception, body: Optional[str] = None):
+        super().__init__(str(error))
+        self.url = url
+        self.error = error
+        self.body = body
+
+
+class HttpEmbeddingFunction:
+    """
+    Minimal wrapper so Chroma can call a remote embeddings API.
+    Expects a server that supports: POST {base_url}/embed?model=...
+    Request body: {"texts": [...], "mode": "auto"}
+    Response: {"vectors": [[float, ...], ...]}
+
+    Inputs are split into batches and up to `concurrency` of them are in
+    flight at once over pooled keep-alive connections. Each batch is retried
+    on its own; results keep input order. With `adaptive` the batch size is
+    tuned by AdaptiveBatchSize (starting from `max_batch`), and a batch the
+    server finds too large is split in half and sent again.
+
+    With `wire_format="auto"` the request's Accept header offers compact
+    binary formats (see decode_vectors); servers that ignore it keep
+    answering JSON. Vectors come back as rows of a float32 array.
+
+    `base_url` may list several servers (a list, or comma-separated). Each
+    request goes to the endpoint EndpointPool picks (`balance` policy), a
+    failed request is retried on another endpoint without backing off, and
+    endpoints that keep failing are ejected by a circuit breaker. With
+    `hedge`, a batch still running after `hedge_factor` times its expected
+    latency is also sent to a second endpoint and the first answer wins.
+    """
+    def __init__(
+        self,
+        base_url: Union[str, Sequence[str]],
+        model: str,
+        timeout: int = 30,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        verify: bool = True,
+        max_batch: Optional[int] = None,
+        retries: int = 2,
+        backoff: float = 0.5,
+        concurrency: int = 1,
+        adaptive: bool = False,
+        max_batch_limit: int = 1024,
+        wire_format: str = "auto",
+        balance: str = "least_outstanding",
+        failure_threshold: int = 3,
+        cooldown: float = 10.0,
+        hedge: bool = False,
+        hedge_factor: float = 2.0,
+    ):
+        urls = [u.strip() for u in (base_url.split(",") if isinstance(base_url, str) else base_url) if u and u.strip()]
+        self.endpoints = EndpointPool(urls, policy=balance, failure_threshold=failure_threshold, cooldown=cooldown)
+        self.base_url = self.endpoints.endpoints[0].url
+        self.hedge = hedge
+        self.hedge_factor = float(hedge_factor)
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._hedge_executor = None
+        self.model = model
+        self.timeout = timeout
+        self.verify = verify
+        self.retries = max(0, int(retries))
+        self.backoff = float(backoff)
+        self.wire_format = (os.getenv("EMBEDDINGS_HTTP_FORMAT") or wire_format).strip().lower()
+
+        # Optional max batch size (env can override); the starting size when adaptive
+        env_max = os.getenv("EMBEDDINGS_HTTP_MAX_BATCH")
+        self.max_batch = int(env_max) if (env_max and env_max.isdigit()) else max_batch
+        self.batch_size = AdaptiveBatchSize(initial=self.max_batch or 32, maximum=max_batch_limit) if adaptive else None
+
+        # Batches in flight at once (env can override)
+        env_conc = os.getenv("EMBEDDINGS_HTTP_CONCURRENCY")
+        self.concurrency = max(1, int(env_conc) if (env_conc and env_conc.isdigit()) else int(concurrency))
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        # Reuse a session for performance; attach headers (e.g., auth).
+        # The connection pool is sized so every in-flight batch (and its hedge) keeps its own keep-alive connection.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=len(self.endpoints.endpoints), pool_maxsize=self.concurrency * (2 if hedge else 1)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        hdrs = dict(headers or {})
+        token = os.getenv("EMBEDDINGS_HTTP_AUTH_TOKEN", "").strip()
+        if token and not any(k.lower() == "authorization" for k in hdrs):
+            hdrs["Authorization"] = f"Bearer {token}"
+        # Default JSON content type (server may not require it but it's harmless)
+        hdrs.setdefault("Content-Type", "application/json")
+        self.session.headers.update(hdrs)
+
+    def __call__(self, input):
+        # Accept a single string or an iterable of strings
+        if isinstance(input, str):
+            inputs = [input]
+        else:
+            inputs = list(input or [])
+        if not inputs:
+            return []
+
+        def _batch_end(start):
+            if self.batch_size is not None:
+                return self.batch_size.batch_end(inputs, start)
+            if not self.max_batch or self.max_batch <= 0:
+                return len(inputs)
+            return min(len(inputs), start + self.max_batch)
+
+        # Batches are (start, end) ranges; halves of rejected batches go first
+        results = {}
+        splits = deque()
+        pos = 0
+        if self.concurrency == 1:
+            while pos < len(inputs) or splits:
+                start, end = splits.popleft() if splits else (pos, _batch_end(pos))
+                pos = max(pos, end)
+                try:
+                    results[start] = self._post_embed(inputs[start:end])
+                except BatchTooLarge:
+                    splits.extendleft(reversed(self._split(start, end)))
+        else:
+            in_flight = {}
+            pool = self._pool()
+            while pos < len(inputs) or splits or in_flight:
+                while len(in_flight) < self.concurrency and (splits or pos < len(inputs)):
+                    start, end = splits.popleft() if splits else (pos, _batch_end(pos))
+                    pos = max(pos, end)
+                    in_flight[pool.submit(self._post_embed, inputs[start:end])] = (start, end)
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, end = in_flight.pop(future)
+                    try:
+                        results[start] = future.result()
+                    except BatchTooLarge:
+                        splits.extend(self._split(start, end))
+
+        vectors_out = []
+        for start in sorted(results):
+            vectors_out.extend(results[start])
+
+        # Sanity check length
+        if len(vectors_out) != len(inputs):
+            raise RuntimeError(
+                f"Embedding server returned {len(vectors_out)} vectors for {len(inputs)} texts."
+            )
+
+        return vectors_out
+
+    @staticmethod
+    def _split(start, end):
+        if end - start <= 1:
+            raise RuntimeError("Embedding server rejected a single text as too large.")
+        mid = (start + end) // 2
+        return [(start, mid), (mid, end)]
+
+    def batch_info(self) -> Dict[str, object]:
+        """Current batching settings, for /embedmodelinfo."""
+        info = {"concurrency": self.concurrency, "adaptive": self.batch_size is not None, "wire_format": self.wire_format}
+        if self.batch_size is not None:
+            info.update(self.batch_size.to_dict())
+        else:
+            info["batch_size"] = self.max_batch
+        info["balance"] = self.endpoints.policy
+        info["endpoints"] = self.endpoints.to_dict()
+        if self.hedge:
+            info.update({"hedge_factor": self.hedge_factor, "hedges": self.hedges, "hedge_wins": self.hedge_wins})
+        return info
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="embed-http")
+            return self._executor
+
+    def _hedge_pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=self.concurrency * 2, thread_name_prefix="embed-hedge")
+            return self._hedge_executor
+
+    def _post_embed(self, batch):
+        body_bytes = json.dumps({"texts": list(batch), "mode": "auto"}).encode("utf-8")
+
+        tried = []
+        attempt = 0
+        while True:
+            endpoint = self.endpoints.pick(exclude=tried)
+            try:
+                if self.hedge:
+                    return self._send_hedged(endpoint, batch, body_bytes)
+                return self._send(endpoint, batch, body_bytes)
+            except EndpointError as e:
+                tried.append(endpoint)
+                # Backoff then retry (if any left); another healthy endpoint is tried at once
+                if attempt < self.retries:
+                    if not self.endpoints.has_alternative(tried):
+                        time.sleep(self.backoff * (2 ** attempt))
+                    attempt += 1
+                else:
+                    raise RuntimeError(
+                        f"HTTP embeddings request failed after {self.retries + 1} attempt(s): {e}. "
+                        f"URL={e.url}/embed params={{'model': {self.model!r}}} "
+                        f"{' body='+e.body[:500] if e.body else ''}"
+                    ) from e.error
+
+    def _send(self, endpoint: Endpoint, batch, body_bytes: bytes) -> np.ndarray:
+        """One request to `endpoint` (picked from self.endpoints, released here)."""
+        resp = None
+        started = time.perf_counter()
+        try:
+            while True:
+                accept = BINARY_ACCEPT if self.wire_format == "auto" else "application/json"
+                resp = self.session.post(
+                    f"{endpoint.url}/embed",
+                    params={"model": self.model},
+                    data=body_bytes,
+                    headers={"Accept": accept},
+                    timeout=self.timeout,
+                    verify=self.verify,
+                )
+                if resp.status_code == 406 and self.wire_format == "auto":
+                    # The server won't negotiate: stay on JSON from now on
+                    self.wire_format = "json"
+                    continue
+                break
+            resp.raise_for_status()
+
+            out = decode_vectors(resp)
+            if out.shape[0] != len(batch):
+                raise ValueError(f"Expected {len(batch)} vectors, got {out.shape[0]}.")
+        except Exception as e:
+            too_large = _is_too_large(e, resp)
+            # A server that answers "too large" is healthy; timeouts and other errors count against it
+            self.endpoints.release(endpoint, ok=too_large and not isinstance(e, requests.Timeout))
+            # Too large for the server: the caller halves the batch instead of retrying it as is
+            if self.batch_size is not None and too_large:
+                self.batch_size.too_large(len(batch), len(body_bytes))
+                raise BatchTooLarge(str(e)) from e
+            raise EndpointError(endpoint.url, e, getattr(resp, "text", None) if resp is not None else None) from e
+
+        elapsed = time.perf_counter() - started
+        self.endpoints.release(endpoint, ok=True, seconds=elapsed, count=len(batch))
+        if self.batch_size is not None:
+            self.batch_size.record(len(batch), elapsed, len(body_bytes), self.timeout)
+        return out
+
+    def _send_hedged(self, endpoint: Endpoint, batch, body_bytes: bytes) -> np.ndarray:
+        """`_send`, plus a second request to another endpoint if the first is slower than expected."""
+        delay = self.endpoints.hedge_delay(endpoint, len(batch), self.hedge_factor)
+        if delay is None:
+            return self._send(endpoint, batch, body_bytes)
+
+        pool = self._hedge_pool()
+        first = pool.submit(self._send, endpoint, batch, body_bytes)
+        wait([first], timeout=delay)
+        backup = None if first.done() else self.endpoints.pick(exclude=[endpoint], fallback=False)
+        if backup is None:
+            return first.result()
+
+        self.hedges += 1
+        second = pool.submit(self._send, backup, batch, body_bytes)
+        pending, errors = {first, second}, []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    out = future.result()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                if future is second:
+                    self.hedge_wins += 1
+                return out
+        # Both failed: a "too large" verdict from either decides how the caller retries
+        raise next((e for e in errors if isinstance(e, BatchTooLarge)), errors[0])
+
+
+# ---- Local embeddings on ONNX Runtime ----------------------------------------
+def _sentence_transformer_modules(model_path: str):
+    """(pooling mode, normalize, max_seq_length) from a saved SentenceTransformer folder."""
+    pooling, normalize, max_seq_length = "mean", False, None
+    modules_file = os.path.join(model_path, "modules.json")
+    modules = []
+    if os.path.exists(modules_file):
+        with open(modules_file, encoding="utf-8") as f:
+            modules = json.load(f)
+    for module in modules:
+        kind = module.get("type", "")
+        if kind.endswith("Normalize"):
+            normalize = True
+        elif kind.endswith("Pooling"):
+            with open(os.path.join(model_path, module.get("path", ""), "config.json"), encoding="utf-8") as f:
+                config = json.load(f)
+            if config.get("pooling_mode_cls_token"):
+                pooling = "cls"
+            elif config.get("pooling_mode_max_tokens"):
+                pooling = "max"
+            elif config.get("pooling_mode_lasttoken"):
+                pooling = "last"
+    config_file = os.path.join(model_path, "sentence_bert_config.json")
+    if os.path.exists(config_file):
+        with open(config_file, encoding="utf-8") as f:
+            max_seq_length = json.load(f).get("max_seq_length")
+    return pooling, normalize, max_seq_length
+
+
+def export_onnx(model_path: str, quantize: bool = True) -> str:
+    """
+    Export the transformer of the SentenceTransformer saved at `model_path` to
+    <model_path>/onnx/model.onnx (and, with `quantize`, a dynamically
+    int8-quantized model_int8.onnx). Existing files are reused.
+    Returns the path of the model to load.
+    """
+    onnx_dir = os.path.join(model_path, "onnx")
+    fp32_path = os.path.join(onnx_dir, "model.onnx")
+    int8_path = os.path.join(onnx_dir, "model_int8.onnx")
+
+    if not os.path.exists(fp32_path):
+        import inspect
+        import torch
+        from transformers import AutoModel, AutoTokenizer
+
+        print(f"[embeddings] exporting {model_path} to ONNX...")
+        tokenizer = AutoTokenizer.from_pretrained(model_path)
+        model = AutoModel.from_pretrained(model_path).eval()
+        sample = tokenizer(["export the encoder to onnx"], return_tensors="pt")
+        names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in sample]
+
+        class _Encoder(torch.nn.Module):
+            def __init__(self, model):
+                super().__init__()
+                self.model = model
+
+            def forward(self, *inputs):
+                return self.model(**dict(zip(names, inputs)))[0]
+
+        os.makedirs(onnx_dir, exist_ok=True)
+        kwargs = {}
+        if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+            kwargs["dynamo"] = False
+        tmp_path = fp32_path + ".tmp"
+        with torch.no_grad():
+            torch.onnx.export(
+                _Encoder(model),
+                tuple(sample[n] for n in names),
+                tmp_path,
+                input_names=names,
+                output_names=["last_hidden_state"],
+                dynamic_axes={n: {0: "batch", 1: "sequence"} for n in names + ["last_hidden_state"]},
+                opset_version=14,
+                **kwargs,
+            )
+        os.replace(tmp_path, fp32_path)
+
+    if not quantize:
+        return fp32_path
+    if not os.path.exists(int8_path):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        print("[embeddings] quantizing ONNX model to int8...")
+        tmp_path = int8_path + ".tmp"
+        quantize_dynamic(fp32_path, tmp_path, weight_type=QuantType.QInt8)
+        os.replace(tmp_path, int8_path)
+    return int8_path
+
+
+def plan_batches(token_counts, token_budget: int, max_batch: int):
+    """
+    Group text indices into batches of similar token length: texts are taken
+    shortest first and a batch closes once its padded size (longest text x
+    batch length) would exceed `token_budget` or it holds `max_batch` texts.
+    Short texts therefore travel in large batches and long texts in small ones.
+    """
+    batches, current, longest = [], [], 0
+    for i in np.argsort(np.asarray(token_counts), kind="stable"):
+        n = int(token_counts[i])
+        if current and (max(longest, n) * (len(current) + 1) > token_budget or len(current) >= max_batch):
+            batches.append(current)
+            current, longest = [], 0
+        current.append(int(i))
+        longest = max(longest, n)
+    if current:
+        batches.append(current)
+    return batches
+
+
+class LengthBucketedEmbedding:
+    """
+    Base for local embedding functions. Texts are measured in tokens, embedded
+    in length-bucketed batches (see plan_batches) by the subclass's
+    `_embed(texts) -> np.ndarray`, and returned in their original order.
+
+    Texts longer than the context window are counted and logged. With
+    `overlength="chunk"` they are split into window-sized chunks and the
+    average of the chunk vectors is used instead of the truncated text.
+    Subclasses set `tokenizer` and `max_length` and call `_init_bucketing`.
+    """
+
+    def _init_bucketing(self, context_window: Optional[int], token_budget: int, batch_size: int, overlength: str):
+        if context_window:
+            self.max_length = min(self.max_length, int(context_window))
+        self.token_budget = max(1, int(token_budget))
+        self.batch_size = max(1, int(batch_size))
+        self.overlength = overlength if overlength in ("truncate", "chunk") else "truncate"
+        self._counts_lock = threading.Lock()
+        self.texts = 0
+        self.batches = 0
+        self.overlength_texts = 0
+
+    def __call__(self, input):
+        texts = [input] if isinstance(input, str) else list(input or [])
+        if not texts:
+            return []
+
+        ids = self.tokenizer(texts, add_special_tokens=True, truncation=False, verbose=False)["input_ids"]
+        lengths = [len(x) for x in ids]
+        over = [i for i, n in enumerate(lengths) if n > self.max_length]
+        if over:
+            print(
+                f"[embeddings] {len(over)} of {len(texts)} texts exceed the {self.max_length}-token context window "
+                f"(longest {max(lengths[i] for i in over)} tokens); "
+                f"{'embedding them in chunks' if self.overlength == 'chunk' else 'they are truncated'}"
+            )
+
+        # Items to embed: each text, or its chunks when it is over-length and chunking is on
+        chunked = set(over) if self.overlength == "chunk" else set()
+        items, owners, item_lengths = [], [], []
+        for i, text in enumerate(texts):
+            pieces = self._chunks(text) if i in chunked else [text]
+            items.extend(pieces)
+            owners.extend([i] * len(pieces))
+            item_lengths.extend([min(lengths[i], self.max_length)] * len(pieces))
+
+        batches = plan_batches(item_lengths, self.token_budget, self.batch_size)
+        vectors = [None] * len(items)
+        for batch in batches:
+            for k, vector in zip(batch, self._embed([items[k] for k in batch])):
+                vectors[k] = vector
+
+        with self._counts_lock:
+            self.texts += len(texts)
+            self.batches += len(batches)
+            self.overlength_texts += len(over)
+
+        if len(items) == len(texts):
+            return vectors
+        # Average the chunks of each text; keep unit length if the model normalizes
+        out = [None] * len(texts)
+        grouped = {}
+        for owner, vector in zip(owners, vectors):
+            grouped.setdefault(owner, []).append(vector)
+        for owner, parts in grouped.items():
+            vector = np.mean(parts, axis=0).astype(np.float32)
+            if np.allclose(np.linalg.norm(parts[0]), 1.0, atol=1e-3):
+                vector /= max(float(np.linalg.norm(vector)), 1e-12)
+            out[owner] = vector
+        return out
+
+    def _chunks(self, text: str):
+        """`text` as pieces that each fit in the context window (special tokens included)."""
+        ids = self.tokenizer(text, add_special_tokens=False, truncation=False, verbose=False)["input_ids"]
+        special = self.tokenizer.num_special_tokens_to_add(pair=False)
+        window = max(1, self.max_length - special)
+        return [self.tokenizer.decode(ids[j:j + window]) for j in range(0, len(ids), window)]
+
+    def bucketing_stats(self) -> Dict[str, object]:
+        with self._counts_lock:
+            return {
+                "context_window": self.max_length,
+                "token_budget": self.token_budget,
+                "max_batch": self.batch_size,
+                "overlength": self.overlength,
+                "texts": self.texts,
+                "batches": self.batches,
+                "overlength_texts": self.overlength_texts,
+            }
+
+
+class SentenceTransformerEmbedding(LengthBucketedEmbedding):
+    """Local SentenceTransformer (PyTorch) model with length-bucketed batching."""
+
+    def __init__(self, model_path: str, context_window: Optional[int] = None, token_budget: int = 4096,
+                 batch_size: int = 128, overlength: str = "truncate"):
+        from sentence_transformers import SentenceTransformer
+
+        self.model_path = model_path
+        self.model = SentenceTransformer(model_path)
+        self.tokenizer = self.model.tokenizer
+        self.max_length = int(self.model.max_seq_length or min(self.tokenizer.model_max_length, 512))
+        self._init_bucketing(context_window, token_budget, batch_size, overlength)
+        self.model.max_seq_length = self.max_length
+
+    def _embed(self, texts) -> np.ndarray:
+        return self.model.encode(texts, batch_size=len(texts), convert_to_numpy=True, show_progress_bar=False).astype(np.float32, copy=False)
+
+
+class OnnxEmbeddingFunction(LengthBucketedEmbedding):
+    """
+    SentenceTransformer model run on ONNX Runtime (CPU). The encoder is
+    exported from the saved model folder on first use (see export_onnx);
+    tokenization, pooling and normalization follow the folder's
+    SentenceTransformer configuration, so vectors match the torch model.
+    `threads` sets ONNX Runtime's intra-op threads (0 lets it decide).
+    """
+
+    def __init__(self, model_path: str, quantize: bool = True, threads: int = 0, context_window: Optional[int] = None,
+                 token_budget: int = 4096, batch_size: int = 128, overlength: str = "truncate"):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        self.model_path = model_path
+        self.quantize = quantize
+        self.onnx_path = export_onnx(model_path, quantize=quantize)
+        self.pooling, self.normalize, max_seq_length = _sentence_transformer_modules(model_path)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
+        self.max_length = int(max_seq_length or min(self.tokenizer.model_max_length, 512))
+        self._init_bucketing(context_window, token_budget, batch_size, overlength)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = max(0, int(threads))
+        options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(self.onnx_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def _embed(self, texts) -> np.ndarray:
+        encoded = self.tokenizer(texts, padding=True, truncation=True, max_length=self.max_length, return_tensors="np")
+        feeds = {name: encoded[name].astype(np.int64) for name in self.input_names if name in encoded}
+        if "token_type_ids" in self.input_names and "token_type_ids" not in feeds:
+            feeds["token_type_ids"] = np.zeros_like(feeds["input_ids"])
+        hidden = self.session.run(None, feeds)[0]
+        mask = encoded["attention_mask"].astype(np.float32)[:, :, None]
+
+        if self.pooling == "cls":
+            pooled = hidden[:, 0]
+        elif self.pooling == "max":
+            pooled = np.where(mask > 0, hidden, -1e9).max(axis=1)
+        elif self.pooling == "last":
+            pooled = hidden[np.arange(hidden.shape[0]), mask[:, :, 0].sum(axis=1).astype(np.int64) - 1]
+        else:
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+        pooled = pooled.astype(np.float32)
+        if self.normalize:
+            pooled /= np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+        return pooled
+
+
+def text_key(model: str, text: str) -> bytes:
+    """Cache key for one text: a hash over the model name and the text."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(model.encode("utf-8"))
+    h.update(b"\0")
+    h.update(text.encode("utf-8"))
+    return h.digest()
+
+
+def model_revision(path: str, exclude: Sequence[str] = ()) -> str:
+    """
+    Short hash over the names, sizes and modification times of the files at
+    `path` (a file or a model folder, minus the `exclude` subfolders), so a
+    re-downloaded or re-exported model gets a new revision.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    if os.path.isfile(path):
+        files = [(os.path.basename(path), path)]
+    else:
+        files = []
+        for root, dirs, names in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if os.path.relpath(os.path.join(root, d), path) not in exclude)
+            files.extend((os.path.relpath(os.path.join(root, n), path), os.path.join(root, n)) for n in sorted(names))
+    for name, full in files:
+        st = os.stat(full)
+        h.update(f"{name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def local_model_key(backend: str, model: str, model_path: str) -> str:
+    """
+    Cache identity of a local model: the backend, the model name, the
+    revision of its folder and the pooling/normalize settings saved with it.
+    """
+    try:
+        pooling, normalize, _ = _sentence_transformer_modules(model_path)
+    except (OSError, ValueError):
+        pooling, normalize = "mean", False
+    key = f"{backend}:{model}@{model_revision(model_path, exclude=('onnx',))}:{pooling}"
+    return key + (":normalize" if normalize else "")
+
+
+def http_model_key(base_url: str, model: str) -> str:
+    """Cache identity of a remote model: the server URL(s) and the model name."""
+    urls = sorted(u.strip().rstrip("/") for u in base_url.split(",") if u.strip())
+    return f"http:{','.join(urls)}:{model}"
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding store with two tiers: an in-memory LRU of
+    `memory_items` vectors and, when `db_path` is set, a SQLite table of
+    float32 blobs bounded to `max_disk_bytes` (least recently used rows are
+    evicted first). Counters are exposed through `stats()`.
+    """
+
+    def __init__(self, memory_items: int = 50000, db_path: Optional[str] = None, max_disk_bytes: int = 1024 * 1024 * 1024):
+        self.memory_items = max(0, int(memory_items))
+        self.db_path = db_path
+        self.max_disk_bytes = int(max_disk_bytes)
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key BLOB PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings(last_used)")
+            self._db.commit()
+            row = self._db.execute("SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings").fetchone()
+            self._disk_bytes = int(row[0])
+
+    def _remember(self, key: bytes, vector: np.ndarray):
+        if not self.memory_items:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        """Cached vectors for `keys` in order, None where the key is unknown."""
+        out = [None] * len(keys)
+        missing = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    out[i] = vector
+                    self.hits += 1
+                else:
+                    missing.setdefault(key, []).append(i)
+
+            if missing and self._db is not None:
+                found = []
+                unique = list(missing)
+                # SQLite limits the number of bound parameters per statement
+                for start in range(0, len(unique), 500):
+                    chunk = unique[start:start + 500]
+                    rows = self._db.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        self._remember(key, vector)
+                        for i in missing.pop(key):
+                            out[i] = vector
+                            self.hits += 1
+                            self.disk_hits += 1
+                        found.append(key)
+                if found:
+                    now = time.time()
+                    self._db.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, k) for k in found])
+                    self._db.commit()
+
+            self.misses += sum(len(v) for v in missing.values())
+        return out
+
+    def put_many(self, keys: List[bytes], vectors) -> None:
+        rows = []
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                vector = np.asarray(vector, dtype=np.float32)
+                self._remember(key, vector)
+                rows.append((key, vector.tobytes(), time.time()))
+            if self._db is None or not rows:
+                return
+            # Keys are content hashes, so a key already on disk holds the same vector
+            for key, blob, used in rows:
+                if self._db.execute("INSERT OR IGNORE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)", (key, blob, used)).rowcount:
+                    self._disk_bytes += len(blob)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        """Drop least recently used rows until the table is 90% of its budget."""
+        target = int(self.max_disk_bytes * 0.9)
+        while self._disk_bytes > target:
+            rows = self._db.execute(
+                "SELECT key, LENGTH(vector) FROM embeddings ORDER BY last_used LIMIT 1000"
+            ).fetchall()
+            if not rows:
+                self._disk_bytes = 0
+                break
+            dropped = []
+            for key, size in rows:
+                dropped.append((key,))
+                self._disk_bytes -= size
+                if self._disk_bytes <= target:
+                    break
+            self._db.executemany("DELETE FROM embeddings WHERE key = ?", dropped)
+            self.evictions += len(dropped)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_items": len(self._memory),
+                "memory_limit": self.memory_items,
+                "disk_path": self.db_path,
+                "disk_bytes": self._disk_bytes if self._db is not None else 0,
+                "disk_limit_bytes": self.max_disk_bytes if self._db is not None else 0,
+                "evictions": self.evictions,
+            }
+
+
+class CachedEmbeddingFunction:
+    """
+    Wraps a Chroma embedding function so texts already embedded with the same
+    model are served from an EmbeddingCache. Only the distinct texts that
+    miss the cache reach the wrapped function, in a single call.
+    """
+
+    def __init__(self, embedding_function, model: str, cache: EmbeddingCache):
+        self.embedding_function = embedding_function
+        self.model = model
+        self.cache = cache
+
+    def __call__(self, input):
+        texts = [input] if isinstance(input, str) else list(input or [])
+        if not texts:
+            return []
+
+        keys = [text_key(self.model, t) for t in texts]
+        vectors = self.cache.get_many(keys)
+
+        pending = OrderedDict()
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                pending.setdefault(keys[i], []).append(i)
+        if pending:
+            first = [positions[0] for positions in pending.values()]
+            computed = self.embedding_function([texts[i] for i in first])
+            if len(computed) != len(first):
+                raise RuntimeError(f"Embedding function returned {len(computed)} vectors for {len(first)} texts.")
+            computed = [np.asarray(v, dtype=np.float32) for v in computed]
+            self.cache.put_many(list(pending), computed)
+            for positions, vector in zip(pending.values(), computed):
+                for i in positions:
+                    vectors[i] = vector
+
+        # Copies, so callers can't modify cached vectors in place
+        return [np.array(v, dtype=np.float32) for v in vectors]
+
+    def stats(self) -> Dict[str, object]:
+        out = self.cache.stats()
+        out["model"] = self.model
+        return out
+
+
+class CoalescingEmbeddingFunction:
+    """
+    Micro-batches single-text calls. Concurrent callers are queued and a
+    dispatcher thread sends them to the wrapped function as one batch of up
+    to `max_items`, then hands each caller its own vector. A lone request is
+    sent at once; only when the previous batch held several requests (i.e.
+    under load) does the dispatcher wait up to `window_ms` for more.
+    Calls with more than one text go straight through.
+    """
+
+    def __init__(self, embedding_function, window_ms: float = 3.0, max_items: int = 64):
+        self.embedding_function = embedding_function
+        self.window = max(0.0, float(window_ms)) / 1000.0
+        self.max_items = max(1, int(max_items))
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._busy = False
+        self.requests = 0
+        self.batches = 0
+
+    def __call__(self, input):
+        texts = [input] if isinstance(input, str) else list(input or [])
+        if len(texts) != 1:
+            return self.embedding_function(texts) if texts else []
+
+        future = Future()
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._dispatch, name="embed-coalescer", daemon=True)
+                self._thread.start()
+            self._queue.append((texts[0], future))
+            self._cond.notify()
+        return [future.result()]
+
+    def _next_batch(self):
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+            # Under load, give other callers a moment to join this batch
+            if self._busy and self.window and len(self._queue) < self.max_items:
+                deadline = time.perf_counter() + self.window
+                while len(self._queue) < self.max_items:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            count = min(self.max_items, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+            self._busy = count > 1
+            self.requests += count
+            self.batches += 1
+            return batch
+
+    def _dispatch(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                vectors = self.embedding_function([text for text, _ in batch])
+                if len(vectors) != len(batch):
+                    raise RuntimeError(f"Embedding function returned {len(vectors)} vectors for {len(batch)} texts.")
+                for (_, future), vector in zip(batch, vectors):
+                    future.set_result(vector)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def stats(self) -> Dict[str, object]:
+        with self._cond:
+            return {
+                "window_ms": self.window * 1000.0,
+                "max_items": self.max_items,
+                "requests": self.requests,
+                "batches": self.batches,
+                "mean_batch": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            }
+
+
+class EmbeddingsNotReady(RuntimeError):
+    """Raised when an embedding is requested before the model finished loading (or when it failed to)."""
+
+
+class LazyEmbeddingFunction:
+    """
+    Stand-in for an embedding function that is still being built. `start()`
+    runs `factory()` on a background thread and warms the result up with a
+    small dummy batch, so the first real request does not pay for lazy
+    initialization. Calls made meanwhile wait up to `wait_timeout` seconds.
+    A factory returning None means embeddings are disabled.
+
+    `state` is 'loading', 'warming', 'ready', 'disabled' or 'failed';
+    `status()` reports it for a readiness probe.
+    """
+
+    def __init__(self, factory, warmup: bool = True, wait_timeout: float = 300.0):
+        self.factory = factory
+        self.warmup = warmup
+        self.wait_timeout = wait_timeout
+        self.state = "loading"
+        self.error = None
+        self._function = None
+        self._done = threading.Event()
+        self._started = None
+        self.load_seconds = None
+        self.warmup_seconds = None
+
+    @property
+    def embedding_function(self):
+        # The loaded function (None until ready), so unwrap() sees through the proxy
+        return self._function
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def start(self) -> "LazyEmbeddingFunction":
+        self._started = time.perf_counter()
+        threading.Thread(target=self._load, name="embed-loader", daemon=True).start()
+        return self
+
+    def _load(self):
+        try:
+            function = self.factory()
+            self.load_seconds = round(time.perf_counter() - self._started, 3)
+            if function is None:
+                self.state = "disabled"
+                return
+            if self.warmup:
+                self.state = "warming"
+                t0 = time.perf_counter()
+                # Warm the model itself: through the cache a restart would only see hits
+                model = function
+                while getattr(model, "embedding_function", None) is not None:
+                    model = model.embedding_function
+                try:
+                    model(["warm-up", "warm-up " * 16])
+                except Exception as e:
+                    # The function exists; a server that is not up yet may still answer later requests
+                    print(f"[embeddings] warm-up failed ({e}); continuing without it")
+                self.warmup_seconds = round(time.perf_counter() - t0, 3)
+            self._function = function
+            self.state = "ready"
+            print(f"[embeddings] ready (load {self.load_seconds}s, warm-up {self.warmup_seconds or 0}s)")
+        except Exception as e:
+            self.error = str(e)
+            self.state = "failed"
+            print(f"[embeddings] ERROR loading embedding function: {e}")
+        finally:
+            self._done.set()
+
+    def __call__(self, input):
+        if not self._done.wait(self.wait_timeout):
+            raise EmbeddingsNotReady(f"The embedding model is still loading ({self.state}); try again shortly.")
+        if self._function is None:
+            reason = f": {self.error}" if self.error else ""
+            raise EmbeddingsNotReady(f"Embeddings are unavailable ({self.state}{reason}).")
+        return self._function(input)
+
+    def status(self) -> Dict[str, object]:
+        elapsed = round(time.perf_counter() - self._started, 3) if self._started is not None else None
+        return {
+            "state": self.state,
+            "ready": self.state == "ready",
+            "error": self.error,
+            "seconds_since_start": elapsed,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+        }
+
+
+def unwrap(embedding_function, cls):
+    """The first wrapper (or wrapped function) of type `cls` in a chain of embedding function wrappers."""
+    fn = embedding_function
+    while fn is not None:
+        if isinstance(fn, cls):
+            return fn
+        fn = getattr(fn, "embedding_function", None)
+    return None
+
+
+def coalescing_from_env(embedding_function):
+    """
+    Wrap `embedding_function` in a CoalescingEmbeddingFunction unless disabled:
+      EMBEDDINGS_COALESCE:           'true' (default) | 'false'
+      EMBEDDINGS_COALESCE_WINDOW_MS: how long a batch waits for more requests under load (default 3)
+      EMBEDDINGS_COALESCE_MAX:       requests per batch (default 64)
+    """
+    if (os.getenv("EMBEDDINGS_COALESCE", "true") or "").strip().lower() not in ("1", "true", "yes", "y", "on"):
+        return embedding_function
+    return CoalescingEmbeddingFunction(
+        embedding_function,
+        window_ms=float(os.getenv("EMBEDDINGS_COALESCE_WINDOW_MS", "3")),
+        max_items=int(os.getenv("EMBEDDINGS_COALESCE_MAX", "64")),
+    )
+
+
+def cache_from_env(default_dir: str) -> Optional[EmbeddingCache]:
+    """
+    EmbeddingCache configured from the environment, or None when disabled:
+      EMBEDDINGS_CACHE:        'true' (default) | 'false'
+      EMBEDDINGS_CACHE_ITEMS:  vectors kept in memory (default 50000)
+      EMBEDDINGS_CACHE_PATH:   SQLite file ('' keeps the cache in memory only)
+      EMBEDDINGS_CACHE_MB:     on-disk budget (default 1024)
+    """
+    if (os.getenv("EMBEDDINGS_CACHE", "true") or "").strip().lower() not in ("1", "true", "yes", "y", "on"):
+        return None
+    db_path = os.getenv("EMBEDDINGS_CACHE_PATH")
+    if db_path is None:
+        db_path = os.path.join(default_dir, "embedding-cache.sqlite3")
+    try:
+        return EmbeddingCache(
+            memory_items=int(os.getenv("EMBEDDINGS_CACHE_ITEMS", "50000")),
+            db_path=db_path or None,
+            max_disk_bytes=int(os.getenv("EMBEDDINGS_CACHE_MB", "1024")) * 1024 * 1024,
+        )
+    except Exception as e:
+        print(f"[embeddings] cache disabled, could not open {db_path}: {e}")
+        return None
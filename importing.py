@@ -0,0 +1,715 @@
+import codecs
+import contextlib
+import hashlib
+import itertools
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+import traceback
+import uuid
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+
+# ---- Streaming import -------------------------------------------------------
+CHUNK_SIZE = 64 * 1024
+MAX_RECORD_CHARS = 16 * 1024 * 1024
+
+_WHITESPACE = re.compile(r"\s*")
+_SCALAR_END = re.compile(r"[\s,\]}]")
+_STRUCTURE = re.compile(r'[\[\]{}"]')
+_STRING_END = re.compile(r'["\\]')
+_DECODER = json.JSONDecoder()
+
+
+class ImportFormatError(ValueError):
+    """The upload is not a JSON array of records or NDJSON."""
+
+
+class _JsonReader:
+    """Reads JSON values one at a time from a binary stream, holding only the unparsed tail in memory."""
+
+    def __init__(self, stream, chunk_size: int, max_record_chars: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.max_record_chars = max_record_chars
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0  # characters dropped from the front of the buffer
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if self.pos:
+            self.offset += self.pos
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        if not chunk:
+            self.eof = True
+            tail = self.decoder.decode(b"", final=True)
+            self.buffer += tail
+            return bool(tail)
+        try:
+            self.buffer += self.decoder.decode(chunk)
+        except UnicodeDecodeError as e:
+            raise ImportFormatError(f"Upload is not valid UTF-8: {e}") from None
+        return True
+
+    def peek(self):
+        """The next non-whitespace character (not consumed), or None at the end of the stream."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return None
+
+    def take(self, allowed: str) -> str:
+        c = self.peek()
+        if c is None or c not in allowed:
+            found = "end of upload" if c is None else repr(c)
+            raise ImportFormatError(f"Expected one of {' '.join(allowed)} at character {self.offset + self.pos}, found {found}.")
+        self.pos += 1
+        return c
+
+    def _more(self) -> bool:
+        """Read another chunk for the unfinished value at `pos`, unless it is already too large."""
+        if len(self.buffer) - self.pos > self.max_record_chars:
+            raise ImportFormatError(
+                f"Record at character {self.offset + self.pos} is invalid or larger than {self.max_record_chars} characters."
+            )
+        return self._fill()
+
+    def _check_prefix(self, last: int):
+        """Fail now if the partial value at `pos` has a syntax error before `last`, its last bracket or quote."""
+        try:
+            _DECODER.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError as e:
+            # A value that is merely cut short fails at or after its last bracket or quote
+            if e.pos - self.pos < last:
+                raise ImportFormatError(f"Invalid JSON at character {self.offset + e.pos}: {e.msg}.") from None
+
+    def _buffer_value(self):
+        """
+        Read chunks until the buffer holds the whole value at `pos` (or the
+        upload ends). Each chunk is scanned once for brackets and strings, so
+        a record spanning many chunks is parsed once rather than once per
+        chunk; the partial record is test-parsed each time it doubles in
+        size, so a malformed one fails long before max_record_chars.
+        """
+        scanned = 0  # characters after `pos`, which moves when _fill drops consumed text
+        if self.buffer[self.pos:self.pos + 1] not in ("{", "[", '"'):
+            # A number or literal: complete once a delimiter follows it
+            while not _SCALAR_END.search(self.buffer, self.pos + scanned):
+                scanned = len(self.buffer) - self.pos
+                if not self._more():
+                    return
+            return
+        depth, in_string, last, check = 0, False, 0, 4 * self.chunk_size
+        while True:
+            match = (_STRING_END if in_string else _STRUCTURE).search(self.buffer, self.pos + scanned)
+            if match is None:
+                # An escape may already have skipped past the end of the buffer
+                scanned = max(scanned, len(self.buffer) - self.pos)
+                if scanned > check:
+                    self._check_prefix(last)
+                    check *= 2
+                if not self._more():
+                    return
+                continue
+            at = match.start() - self.pos
+            scanned = at + 1
+            char = match.group()
+            if char == "\\":
+                scanned += 1
+                continue
+            last = at
+            if char == '"':
+                in_string = not in_string
+                if in_string:
+                    continue
+            else:
+                depth += 1 if char in "{[" else -1
+            if depth == 0:
+                return
+
+    def value(self):
+        self.peek()
+        self._buffer_value()
+        try:
+            value, end = _DECODER.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError as e:
+            raise ImportFormatError(f"Invalid JSON at character {self.offset + e.pos}: {e.msg}.") from None
+        self.pos = end
+        return value
+
+
+def iter_records(stream, chunk_size: int = CHUNK_SIZE, max_record_chars: int = MAX_RECORD_CHARS) -> Iterator[dict]:
+    """
+    Yield import records ({"id", "document", "metadata"} objects) from a
+    binary stream as they are parsed. The body is either a JSON array of
+    records or NDJSON (one record per line), told apart by its first
+    character. Only the unparsed remainder of the current chunk is held in
+    memory, so the upload size does not matter.
+    """
+    reader = _JsonReader(stream, chunk_size, max_record_chars)
+    first = reader.peek()
+    if first is None:
+        return
+
+    count = 0
+
+    def record(value):
+        if not isinstance(value, dict):
+            raise ImportFormatError(f"Record {count + 1} is not a JSON object.")
+        return value
+
+    if first == "[":
+        reader.take("[")
+        if reader.peek() == "]":
+            reader.take("]")
+        else:
+            while True:
+                yield record(reader.value())
+                count += 1
+                if reader.take(",]") == "]":
+                    break
+        if reader.peek() is not None:
+            raise ImportFormatError(f"Unexpected data after the JSON array at character {reader.offset + reader.pos}.")
+        return
+
+    while reader.peek() is not None:
+        yield record(reader.value())
+        count += 1
+
+
+def batched(records: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    """Group `records` into lists of `size`, consuming the iterable lazily."""
+    size = max(1, int(size))
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ---- Precomputed embeddings -------------------------------------------------
+SIDECAR_BLOCK_ROWS = 1024
+
+
+class NpyRows:
+    """
+    Rows of a 2-D float .npy file (a sidecar of embeddings aligned with the
+    records), read from a binary stream a block at a time so the file never
+    has to fit in memory.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        try:
+            version = np.lib.format.read_magic(stream)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+        except ValueError as e:
+            raise ImportFormatError(f"The embeddings file is not a .npy array: {e}") from None
+        if len(shape) != 2 or fortran_order or dtype.kind != "f":
+            raise ImportFormatError(f"The embeddings file must hold a 2-D float array (got {dtype} {shape}).")
+        self.rows, self.dim = shape
+        self.dtype = dtype
+        self.read = 0
+
+    def take(self, count: int) -> np.ndarray:
+        count = max(0, min(int(count), self.rows - self.read))
+        size = count * self.dim * self.dtype.itemsize
+        data = bytearray()
+        while len(data) < size:
+            chunk = self.stream.read(size - len(data))
+            if not chunk:
+                raise ImportFormatError(f"The embeddings file ends after {self.read + len(data) // (self.dim * self.dtype.itemsize)} rows.")
+            data += chunk
+        self.read += count
+        return np.frombuffer(bytes(data), dtype=self.dtype).reshape(count, self.dim).astype(np.float32, copy=False)
+
+    def skip(self, count: int):
+        """Move past `count` rows (already imported ones, on resume)."""
+        count = max(0, min(int(count), self.rows - self.read))
+        if self.stream.seekable():
+            self.stream.seek(count * self.dim * self.dtype.itemsize, os.SEEK_CUR)
+            self.read += count
+            return
+        while count:
+            count -= self.take(min(count, SIDECAR_BLOCK_ROWS)).shape[0]
+
+
+def with_embeddings(records: Iterable[dict], rows: NpyRows) -> Iterator[dict]:
+    """Give each record the matching row of `rows` as its `embedding` (unless it carries one already)."""
+    block = np.empty((0, rows.dim), dtype=np.float32)
+    matched = rows.read
+    for record in records:
+        if not block.shape[0]:
+            block = rows.take(SIDECAR_BLOCK_ROWS)
+            if not block.shape[0]:
+                raise ImportFormatError(f"The embeddings file has {rows.rows} rows but there are more records.")
+        if record.get("embedding") is None:
+            record["embedding"] = block[0]
+        block = block[1:]
+        matched += 1
+        yield record
+    if matched != rows.rows:
+        raise ImportFormatError(f"The embeddings file has {rows.rows} rows but there are {matched} records.")
+
+
+def record_embeddings(batch: List[dict], dimension: Optional[int] = None) -> List[Optional[list]]:
+    """
+    Each record's precomputed `embedding` as a list of floats (None where it
+    has none). Raises ImportFormatError for anything but a finite vector of
+    `dimension` numbers.
+    """
+    out = []
+    for record in batch:
+        vector = record.get("embedding")
+        if vector is None:
+            out.append(None)
+            continue
+        try:
+            vector = np.asarray(vector, dtype=np.float32)
+        except (TypeError, ValueError):
+            raise ImportFormatError(f"Record {record.get('id')!r}: embedding must be an array of numbers.") from None
+        if vector.ndim != 1 or (dimension and vector.shape[0] != dimension):
+            raise ImportFormatError(
+                f"Record {record.get('id')!r}: embedding has shape {vector.shape}, expected ({dimension or 'n'},)."
+            )
+        if not np.isfinite(vector).all():
+            raise ImportFormatError(f"Record {record.get('id')!r}: embedding contains NaN or infinity.")
+        out.append(vector.tolist())
+    return out
+
+
+def embed_batch(batch: List[dict], embed, dimension: Optional[int] = None) -> Optional[List[list]]:
+    """
+    Embeddings for a batch of import records: precomputed ones are used as
+    they are (see record_embeddings) and only the other records' documents go
+    through `embed`. With `embed=None` (embeddings disabled) a batch without
+    any precomputed embedding gives None, leaving it to the collection.
+    """
+    vectors = record_embeddings(batch, dimension)
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    if not missing:
+        return vectors
+    if embed is None:
+        if len(missing) == len(batch):
+            return None
+        raise ImportFormatError(f"{len(missing)} records in a batch have no embedding and embeddings are disabled.")
+    computed = embed([batch[i].get("document") for i in missing])
+    for i, vector in zip(missing, computed):
+        vectors[i] = vector.tolist() if hasattr(vector, "tolist") else list(vector)
+    return vectors
+
+
+# ---- Skip unchanged records -------------------------------------------------
+CONTENT_HASH_KEY = "content_hash"
+
+
+def content_hash(record: dict) -> str:
+    """sha256 of a record's document, metadata (minus the stored hash) and precomputed embedding, if any."""
+    metadata = {k: v for k, v in (record.get("metadata") or {}).items() if k != CONTENT_HASH_KEY}
+    digest = hashlib.sha256(
+        json.dumps({"document": record.get("document"), "metadata": metadata}, sort_keys=True, default=str).encode("utf-8")
+    )
+    if record.get("embedding") is not None:
+        digest.update(np.asarray(record["embedding"], dtype=np.float32).tobytes())
+    return digest.hexdigest()
+
+
+class UnchangedFilter:
+    """
+    Re-import mode that only writes new or changed records. `select(batch)`
+    fetches the stored hashes of the batch's ids in one get(), stamps each
+    new or changed record's metadata with its content hash and returns those
+    records; the rest are skipped. `commit()` is called once the oldest
+    selected batch has been written and adds its inserted, updated and
+    skipped counts to `counts`.
+
+    select() may run ahead of the writes (see embed_ahead), so an id selected
+    in an earlier batch that is not committed yet is compared with that
+    pending write rather than with the stale stored hash: it counts as
+    updated or skipped, never as inserted twice.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.counts = {"inserted": 0, "updated": 0, "skipped": 0}
+        self._pending = {}    # batch sequence number -> (tally, ids written)
+        self._in_flight = {}  # id -> (sequence number, content hash) of a selected, uncommitted write
+        self._selected = 0
+        self._committed = 0
+        self._lock = threading.Lock()
+
+    def select(self, batch: List[dict]) -> List[dict]:
+        existing = self.collection.get(ids=[record.get("id") for record in batch], include=["metadatas"])
+        stored = {
+            doc_id: (metadata or {}).get(CONTENT_HASH_KEY)
+            for doc_id, metadata in zip(existing.get("ids") or [], existing.get("metadatas") or [])
+        }
+        with self._lock:
+            seq = self._selected
+            self._selected += 1
+            changed, written, tally = [], [], {"inserted": 0, "updated": 0, "skipped": 0}
+            for record in batch:
+                doc_id, digest = record.get("id"), content_hash(record)
+                if doc_id in self._in_flight:
+                    known, previous = True, self._in_flight[doc_id][1]
+                else:
+                    known, previous = doc_id in stored, stored.get(doc_id)
+                if not known:
+                    tally["inserted"] += 1
+                elif previous != digest:
+                    tally["updated"] += 1
+                else:
+                    tally["skipped"] += 1
+                    continue
+                self._in_flight[doc_id] = (seq, digest)
+                written.append(doc_id)
+                changed.append({**record, "metadata": {**(record.get("metadata") or {}), CONTENT_HASH_KEY: digest}})
+            self._pending[seq] = (tally, written)
+        return changed
+
+    def commit(self) -> dict:
+        with self._lock:
+            tally, written = self._pending.pop(self._committed, ({}, []))
+            for doc_id in written:
+                # A later batch may have selected the same id again; that write is still pending
+                if self._in_flight.get(doc_id, (None,))[0] == self._committed:
+                    del self._in_flight[doc_id]
+            self._committed += 1
+            for name, count in tally.items():
+                self.counts[name] += count
+        return tally
+
+
+_DONE = object()
+
+
+def embed_ahead(
+    batches: Iterable[List[dict]], embed, depth: int = 2, dimension: Optional[int] = None, select=None
+) -> Iterator[tuple]:
+    """
+    Yield (batch, records, vectors) for each batch of import records, where
+    `records` are the ones to write (`select(batch)`, or the whole batch) and
+    `vectors` their embeddings from `embed_batch`. A background thread embeds
+    up to `depth` batches ahead, so the caller can write batch N while batch
+    N+1 is being embedded; the bounded queue holds the embedding side back
+    when writes are the slower stage. Errors from `batches`, `select` or
+    `embed` are raised in the caller, in batch order.
+    """
+    pending = queue.Queue(maxsize=max(1, int(depth)))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for batch in batches:
+                if stop.is_set():
+                    return
+                records = select(batch) if select is not None else batch
+                vectors = embed_batch(records, embed, dimension) if records else []
+                if not put((batch, records, vectors, None)):
+                    return
+        except Exception as e:
+            put((None, None, None, e))
+            return
+        put(_DONE)
+
+    threading.Thread(target=produce, name="import-embed", daemon=True).start()
+    try:
+        while True:
+            item = pending.get()
+            if item is _DONE:
+                return
+            batch, records, vectors, error = item
+            if error is not None:
+                raise error
+            yield batch, records, vectors
+    finally:
+        # The caller stopped early (or finished): let the embedding thread wind down
+        stop.set()
+
+
+# ---- Background import jobs -------------------------------------------------
+class JobStopped(Exception):
+    """Raised at a checkpoint once the job has been asked to stop."""
+
+
+class ImportJob:
+    """
+    State of one background import, persisted as job.json next to the
+    spooled upload. `records_done` is the checkpoint: every record before it
+    has been committed, and a resumed run starts there.
+    """
+
+    FIELDS = (
+        "id", "collection", "batch_limit", "status", "error", "created", "started", "finished", "updated",
+        "bytes_total", "bytes_done", "records_done", "batches_done", "runs",
+        "skip_unchanged", "records_inserted", "records_updated", "records_skipped",
+    )
+
+    def __init__(self, **fields):
+        self.id = uuid.uuid4().hex
+        self.collection = None
+        self.batch_limit = 100
+        self.status = "queued"
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.updated = self.created
+        self.bytes_total = 0
+        self.bytes_done = 0
+        self.records_done = 0
+        self.batches_done = 0
+        self.runs = 0
+        # With skip_unchanged (see UnchangedFilter), committed records by outcome
+        self.skip_unchanged = False
+        self.records_inserted = 0
+        self.records_updated = 0
+        self.records_skipped = 0
+        for name, value in fields.items():
+            if name in self.FIELDS:
+                setattr(self, name, value)
+        # This run only, for throughput and ETA
+        self.run_started = None
+        self.run_records = 0
+        self.run_bytes = 0
+
+    def to_dict(self) -> dict:
+        out = {name: getattr(self, name) for name in self.FIELDS}
+        out["job"] = out.pop("id")
+        out["progress"] = round(self.bytes_done / self.bytes_total, 4) if self.bytes_total else 0.0
+        out["records_per_sec"] = None
+        out["eta_seconds"] = None
+        if self.status == "running" and self.run_started is not None:
+            elapsed = time.time() - self.run_started
+            if elapsed > 0 and self.records_done > self.run_records:
+                out["records_per_sec"] = round((self.records_done - self.run_records) / elapsed, 1)
+            if elapsed > 0 and self.bytes_done > self.run_bytes:
+                rate = (self.bytes_done - self.run_bytes) / elapsed
+                out["eta_seconds"] = round(max(0, self.bytes_total - self.bytes_done) / rate, 1)
+        return out
+
+
+class ImportJobs:
+    """
+    Imports that run in the background and survive a crash or restart.
+    Each job is a folder under `root` with the upload (and any sidecar
+    embeddings .npy) spooled to disk and job.json, rewritten after every
+    committed batch. `importer(job, batches, checkpoint)` does the writing:
+    it upserts each batch from `batches` and then calls `checkpoint(batch)`. Resuming skips the committed records, so
+    at most the batches in flight at a crash are written again, which upserts
+    make harmless. Up to `max_running` jobs import at once; the rest queue.
+    """
+
+    def __init__(self, root: str, importer, max_running: int = 1):
+        self.root = root
+        self.importer = importer
+        self._slots = threading.Semaphore(max(1, int(max_running)))
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._threads = {}
+        self._stops = {}
+        self._stop_status = {}
+        os.makedirs(root, exist_ok=True)
+        for name in sorted(os.listdir(root)):
+            try:
+                with open(os.path.join(root, name, "job.json"), encoding="utf-8") as f:
+                    job = ImportJob(**json.load(f))
+            except (OSError, ValueError):
+                continue
+            self._jobs[job.id] = job
+
+    def _records_path(self, job: ImportJob) -> str:
+        return os.path.join(self.root, job.id, "records")
+
+    def _embeddings_path(self, job: ImportJob) -> str:
+        return os.path.join(self.root, job.id, "embeddings.npy")
+
+    def _save(self, job: ImportJob):
+        job.updated = time.time()
+        path = os.path.join(self.root, job.id, "job.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({name: getattr(job, name) for name in ImportJob.FIELDS}, f)
+        os.replace(path + ".tmp", path)
+
+    def create(self, collection: str, batch_limit: int, source, embeddings=None, skip_unchanged: bool = False) -> ImportJob:
+        """
+        Spool `source` (a binary stream with a JSON array or NDJSON body, or a
+        list of records) to disk and start importing it into `collection`.
+        `embeddings` is an optional binary stream with a .npy array holding
+        one embedding per record, in record order.
+        """
+        job = ImportJob(collection=collection, batch_limit=max(1, int(batch_limit)), skip_unchanged=bool(skip_unchanged))
+        os.makedirs(os.path.join(self.root, job.id))
+        path = self._records_path(job)
+        if isinstance(source, list):
+            with open(path, "w", encoding="utf-8") as f:
+                for record in source:
+                    f.write(json.dumps(record))
+                    f.write("\n")
+        else:
+            with open(path, "wb") as f:
+                shutil.copyfileobj(source, f, CHUNK_SIZE)
+        if embeddings is not None:
+            with open(self._embeddings_path(job), "wb") as f:
+                shutil.copyfileobj(embeddings, f, CHUNK_SIZE)
+            try:
+                with open(self._embeddings_path(job), "rb") as f:
+                    NpyRows(f)
+            except ImportFormatError:
+                shutil.rmtree(os.path.join(self.root, job.id), ignore_errors=True)
+                raise
+        job.bytes_total = os.path.getsize(path)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._save(job)
+        self.start(job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[ImportJob]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created, reverse=True)
+
+    def start(self, job_id: str) -> bool:
+        """(Re)start a job from its checkpoint; False if it is done, unknown or already running."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            thread = self._threads.get(job_id)
+            if job is None or job.status == "done" or (thread is not None and thread.is_alive()):
+                return False
+            if not os.path.exists(self._records_path(job)):
+                return False
+            job.status = "queued"
+            job.error = None
+            stop = self._stops[job_id] = threading.Event()
+            thread = self._threads[job_id] = threading.Thread(
+                target=self._run, args=(job, stop), name=f"import-job-{job_id[:8]}", daemon=True
+            )
+        self._save(job)
+        thread.start()
+        return True
+
+    def _signal(self, job_id: str, status: str):
+        with self._lock:
+            thread = self._threads.get(job_id)
+            if thread is None or not thread.is_alive():
+                return None
+            self._stop_status[job_id] = status
+            self._stops[job_id].set()
+            return thread
+
+    def stop(self, job_id: str, status: str = "cancelled", timeout: Optional[float] = None) -> bool:
+        """
+        Stop a job after its current batch, leaving it as `status` (it can be
+        started again later); waits up to `timeout`. False if it was not active.
+        """
+        thread = self._signal(job_id, status)
+        if thread is None:
+            return False
+        thread.join(timeout)
+        return True
+
+    def stop_all(self, status: str = "interrupted", timeout: Optional[float] = None) -> List[str]:
+        """Stop every active job (e.g. before /restart); returns their ids so they can be started again."""
+        with self._lock:
+            active = [job_id for job_id, thread in self._threads.items() if thread.is_alive()]
+        # Signal all first: a queued job only sees its signal once a running one frees the slot
+        threads = {job_id: self._signal(job_id, status) for job_id in active}
+        for thread in threads.values():
+            if thread is not None:
+                thread.join(timeout)
+        return [job_id for job_id, thread in threads.items() if thread is not None]
+
+    def resume_pending(self) -> List[str]:
+        """Start the jobs a crash or restart left unfinished."""
+        pending = [job.id for job in self.list() if job.status in ("queued", "running", "interrupted")]
+        return [job_id for job_id in reversed(pending) if self.start(job_id)]
+
+    def _run(self, job: ImportJob, stop: threading.Event):
+        with self._slots:
+            if stop.is_set():
+                job.status = self._stop_status.get(job.id, "cancelled")
+                self._save(job)
+                return
+            job.status = "running"
+            job.runs += 1
+            job.started = job.started or time.time()
+            job.run_started = time.time()
+            job.run_records = job.records_done
+            job.run_bytes = job.bytes_done
+            self._save(job)
+            print(f"[import] job {job.id} -> '{job.collection}' from record {job.records_done}")
+            try:
+                sidecar = os.path.exists(self._embeddings_path(job))
+                with contextlib.ExitStack() as files:
+                    f = files.enter_context(open(self._records_path(job), "rb"))
+                    rows = None
+                    if sidecar:
+                        rows = NpyRows(files.enter_context(open(self._embeddings_path(job), "rb")))
+                        rows.skip(job.records_done)
+
+                    # File position as each batch was read: batches may be parsed well ahead of their commit
+                    offsets = {}
+
+                    def read_batches():
+                        records = itertools.islice(iter_records(f), job.records_done, None)
+                        if rows is not None:
+                            records = with_embeddings(records, rows)
+                        for batch in batched(records, job.batch_limit):
+                            offsets[id(batch)] = f.tell()
+                            yield batch
+
+                    def checkpoint(batch):
+                        job.records_done += len(batch)
+                        job.batches_done += 1
+                        job.bytes_done = max(job.bytes_done, offsets.pop(id(batch), job.bytes_done))
+                        self._save(job)
+                        if stop.is_set():
+                            raise JobStopped()
+
+                    self.importer(job, read_batches(), checkpoint)
+                job.status = "done"
+                job.bytes_done = job.bytes_total
+                os.remove(self._records_path(job))
+                if sidecar:
+                    os.remove(self._embeddings_path(job))
+            except JobStopped:
+                job.status = self._stop_status.get(job.id, "cancelled")
+            except Exception as e:
+                traceback.print_exc()
+                job.status = "error"
+                job.error = str(e)
+            job.finished = time.time()
+            self._save(job)
+            print(f"[import] job {job.id} {job.status} after {job.records_done} records")
@@ -0,0 +1,234 @@
+"""
+Embedding throughput benchmark.
+
+    python tests/bench/embedding_throughput.py [--backend http,local] [--model-path /app/models/all-MiniLM-L6-v2]
+        [--batch-sizes 16,64,256] [--concurrency 1,4,8] [--latency-ms 20 --per-text-ms 0.2 --jitter-ms 5 --dim 384]
+        [--out results.json] [--compare earlier.json]
+
+The http backend drives HttpEmbeddingFunction against tests/bench/stub_server.py,
+started in a child process so its CPU is not counted as the client's. The
+local backend runs SentenceTransformerEmbedding on --model-path (concurrency
+does not apply). Corpora are the documents of import-files/testdata_chromaflow_rows_*.json
+plus synthetic short, medium and long texts.
+
+Every backend x corpus x batch size x concurrency combination reports texts/s,
+p50/p99 latency of the individual batches and the client's CPU time. Results
+are written as JSON (default tests/bench/results/embedding-throughput-<time>.json);
+--compare prints the texts/s of an earlier results file next to this run's.
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, ROOT)
+
+from embeddings import HttpEmbeddingFunction  # noqa: E402
+
+WORDS = (
+    "vector database embedding search query document collection model token "
+    "server cache batch latency throughput memory index cluster distance metric "
+    "the a of and to in is it that for on with as at by from this be or are"
+).split()
+
+# Synthetic corpora: (name, words per text)
+SYNTHETIC = (("synthetic-short", (3, 12)), ("synthetic-medium", (30, 80)), ("synthetic-long", (200, 400)))
+
+
+def load_corpora(count: int, seed: int = 0):
+    corpora = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "import-files", "testdata_chromaflow_rows_*.json"))):
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)
+        texts = [str(r.get("document") or "") for r in records if r.get("document")]
+        corpora.append((os.path.splitext(os.path.basename(path))[0], texts))
+    rng = random.Random(seed)
+    for name, (low, high) in SYNTHETIC:
+        corpora.append((name, [" ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high))) for _ in range(count)]))
+    return corpora
+
+
+def instrument(fn, method: str):
+    """Time every call of `fn.method` (one batch); returns the list the latencies are appended to."""
+    latencies = []
+    original = getattr(fn, method)
+
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    setattr(fn, method, timed)
+    return latencies
+
+
+def measure(fn, latencies, texts, repeat: int) -> dict:
+    fn(texts[: min(len(texts), 8)])  # warm up connections / the model
+    rates, cpu, wall = [], 0.0, 0.0
+    del latencies[:]
+    for _ in range(repeat):
+        cpu_start, started = time.process_time(), time.perf_counter()
+        vectors = fn(texts)
+        elapsed = time.perf_counter() - started
+        cpu += time.process_time() - cpu_start
+        wall += elapsed
+        if len(vectors) != len(texts):
+            raise RuntimeError(f"got {len(vectors)} vectors for {len(texts)} texts")
+        rates.append(len(texts) / elapsed)
+    ms = np.asarray(latencies) * 1000.0 if latencies else np.zeros(1)
+    return {
+        "texts": len(texts),
+        "texts_per_sec": round(float(np.median(rates)), 1),
+        "batches": len(latencies) // repeat,
+        "batch_p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "batch_p99_ms": round(float(np.percentile(ms, 99)), 2),
+        "client_cpu_sec": round(cpu / repeat, 3),
+        "client_cpu_percent": round(100.0 * cpu / wall, 1) if wall else 0.0,
+    }
+
+
+def start_stub(args):
+    command = [
+        sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_server.py"),
+        "--port", "0", "--latency-ms", str(args.latency_ms), "--per-text-ms", str(args.per_text_ms),
+        "--jitter-ms", str(args.jitter_ms), "--dim", str(args.dim), "--workers", str(args.server_workers),
+        "--format", args.format,
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline().strip()
+    if not line:
+        process.kill()
+        raise RuntimeError("stub server did not start")
+    return process, line.rsplit(" ", 1)[-1]
+
+
+def run_http(args, corpora, results):
+    process, url = start_stub(args)
+    print(f"stub server: {url} (latency {args.latency_ms}ms + {args.per_text_ms}ms/text, jitter {args.jitter_ms}ms, dim {args.dim})")
+    try:
+        for name, texts in corpora:
+            for batch_size in args.batch_sizes:
+                for concurrency in args.concurrency:
+                    fn = HttpEmbeddingFunction(url, "stub", max_batch=batch_size, concurrency=concurrency, wire_format=args.format)
+                    latencies = instrument(fn, "_send")
+                    row = {"backend": "http", "corpus": name, "batch_size": batch_size, "concurrency": concurrency}
+                    row.update(measure(fn, latencies, texts, args.repeat))
+                    report(row, results)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def run_local(args, corpora, results):
+    from embeddings import SentenceTransformerEmbedding
+
+    for batch_size in args.batch_sizes:
+        fn = SentenceTransformerEmbedding(args.model_path, batch_size=batch_size, token_budget=args.token_budget)
+        latencies = instrument(fn, "_embed")
+        for name, texts in corpora:
+            row = {"backend": "local", "corpus": name, "batch_size": batch_size, "concurrency": 1}
+            row.update(measure(fn, latencies, texts, args.repeat))
+            report(row, results)
+
+
+def report(row, results):
+    results.append(row)
+    print(
+        f"{row['backend']:<6} {row['corpus']:<32} batch {row['batch_size']:>5} conc {row['concurrency']:>3}  "
+        f"{row['texts_per_sec']:>10.1f} texts/s  p50 {row['batch_p50_ms']:>8.2f}ms  p99 {row['batch_p99_ms']:>8.2f}ms  "
+        f"cpu {row['client_cpu_sec']:>7.3f}s ({row['client_cpu_percent']:.0f}%)"
+    )
+
+
+def key(row):
+    return row["backend"], row["corpus"], row["batch_size"], row["concurrency"]
+
+
+def compare(results, path):
+    with open(path, encoding="utf-8") as f:
+        earlier = {key(row): row for row in json.load(f)["results"]}
+    print(f"\ncompared with {path}:")
+    for row in results:
+        before = earlier.get(key(row))
+        if before is None:
+            continue
+        ratio = row["texts_per_sec"] / before["texts_per_sec"] if before["texts_per_sec"] else float("inf")
+        print(
+            f"{row['backend']:<6} {row['corpus']:<32} batch {row['batch_size']:>5} conc {row['concurrency']:>3}  "
+            f"{before['texts_per_sec']:>10.1f} -> {row['texts_per_sec']:>10.1f} texts/s  x{ratio:.2f}"
+        )
+
+
+def int_list(value: str):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", default="http", help="comma-separated: http, local")
+    parser.add_argument("--model-path", help="saved SentenceTransformer folder, for the local backend")
+    parser.add_argument("--batch-sizes", type=int_list, default=[16, 64, 256])
+    parser.add_argument("--concurrency", type=int_list, default=[1, 4, 8], help="http requests in flight")
+    parser.add_argument("--count", type=int, default=2000, help="texts per synthetic corpus")
+    parser.add_argument("--corpus", action="append", help="only run corpora whose name contains this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per configuration (texts/s is the median)")
+    parser.add_argument("--token-budget", type=int, default=4096, help="local backend padded tokens per batch")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--per-text-ms", type=float, default=0.2)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--server-workers", type=int, default=4, help="batches the stub server processes at once")
+    parser.add_argument("--format", choices=("auto", "json"), default="auto", help="http response format")
+    parser.add_argument("--out", help="results file (default tests/bench/results/embedding-throughput-<time>.json)")
+    parser.add_argument("--compare", help="earlier results file to compare texts/s against")
+    args = parser.parse_args()
+
+    backends = [b.strip() for b in args.backend.split(",") if b.strip()]
+    if "local" in backends and not args.model_path:
+        parser.error("--model-path is required for the local backend")
+    corpora = load_corpora(args.count)
+    if args.corpus:
+        corpora = [(name, texts) for name, texts in corpora if any(c in name for c in args.corpus)]
+
+    results = []
+    if "http" in backends:
+        run_http(args, corpora, results)
+    if "local" in backends:
+        run_local(args, corpora, results)
+
+    out = args.out or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results",
+        f"embedding-throughput-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json",
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "args": {k: v for k, v in vars(args).items() if k not in ("out", "compare")},
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nresults written to {out}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
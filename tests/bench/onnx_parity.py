@@ -0,0 +1,89 @@
+"""
+Parity and throughput check for the ONNX Runtime embeddings backend.
+
+    python tests/bench/onnx_parity.py /app/models/all-MiniLM-L6-v2 [--texts corpus.txt] [--threads 4]
+
+Embeds the same texts with the torch SentenceTransformer and with
+OnnxEmbeddingFunction (fp32, then int8 unless --no-quantize), prints the
+cosine similarity between matching vectors and the texts/second of each
+backend, and exits non-zero when a backend falls below its minimum cosine.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from embeddings import OnnxEmbeddingFunction  # noqa: E402
+
+WORDS = (
+    "vector database embedding search query document collection model token "
+    "server cache batch latency throughput memory index cluster distance metric "
+    "the a of and to in is it that for on with as at by from this be or are"
+).split()
+
+
+def sample_texts(count: int, seed: int = 0):
+    """Sentences from 3 to 200 words, so padding and truncation both get exercised."""
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.choice((3, 8, 20, 60, 200)))) for _ in range(count)]
+
+
+def timed(fn, texts, batch_size):
+    fn(texts[:batch_size])  # warm up
+    started = time.perf_counter()
+    vectors = np.vstack([np.asarray(fn(texts[i:i + batch_size]), dtype=np.float32) for i in range(0, len(texts), batch_size)])
+    return vectors, len(texts) / (time.perf_counter() - started)
+
+
+def cosine(a, b):
+    a = a / np.maximum(np.linalg.norm(a, axis=1, keepdims=True), 1e-12)
+    b = b / np.maximum(np.linalg.norm(b, axis=1, keepdims=True), 1e-12)
+    return (a * b).sum(axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("model_path", help="saved SentenceTransformer folder (EMBEDDING_MODEL_PATH)")
+    parser.add_argument("--texts", help="file with one text per line (default: synthetic sentences)")
+    parser.add_argument("--count", type=int, default=512, help="number of synthetic texts")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=0, help="ONNX Runtime intra-op threads (0 = default)")
+    parser.add_argument("--no-quantize", action="store_true", help="skip the int8 model")
+    parser.add_argument("--min-cosine", type=float, default=0.999, help="minimum cosine for the fp32 model")
+    parser.add_argument("--min-cosine-int8", type=float, default=0.97, help="minimum cosine for the int8 model")
+    args = parser.parse_args()
+
+    if args.texts:
+        with open(args.texts, encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+    else:
+        texts = sample_texts(args.count)
+
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(args.model_path, device="cpu")
+    reference, torch_rate = timed(lambda batch: model.encode(batch, batch_size=args.batch_size), texts, args.batch_size)
+    print(f"torch          {torch_rate:10.1f} texts/s")
+
+    failed = False
+    variants = [(False, args.min_cosine)] + ([] if args.no_quantize else [(True, args.min_cosine_int8)])
+    for quantize, minimum in variants:
+        fn = OnnxEmbeddingFunction(args.model_path, quantize=quantize, threads=args.threads, batch_size=args.batch_size)
+        vectors, rate = timed(fn, texts, args.batch_size)
+        sims = cosine(reference, vectors)
+        ok = sims.min() >= minimum
+        failed |= not ok
+        print(
+            f"onnx {'int8' if quantize else 'fp32'}      {rate:10.1f} texts/s  x{rate / torch_rate:.2f}  "
+            f"cosine min {sims.min():.5f} mean {sims.mean():.5f}  {'ok' if ok else f'FAIL (< {minimum})'}"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
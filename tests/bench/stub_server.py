@@ -0,0 +1,108 @@
+"""
+Stub embeddings server for benchmarks and manual testing.
+
+    python tests/bench/stub_server.py [--port 9005] [--latency-ms 20] [--per-text-ms 0.2] [--jitter-ms 5] [--dim 384]
+
+Answers POST /embed?model=... ({"texts": [...]}) with random unit vectors
+after a simulated model time of latency + per-text cost x batch size, plus
+exponentially distributed jitter. `--workers` batches are "on the model" at
+once; more requests queue, like a server with a fixed number of model slots.
+Responses are .npy when the Accept header offers application/x-npy (see
+embeddings.decode_vectors), JSON otherwise. GET /healthz answers 200.
+With --max-batch, larger batches get a 413.
+"""
+import argparse
+import io
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import numpy as np
+
+
+def make_handler(args):
+    slots = threading.Semaphore(max(1, args.workers))
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *a):
+            pass
+
+        def _reply(self, status: int, body: bytes, content_type: str = "application/json", headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if urlparse(self.path).path == "/healthz":
+                self._reply(200, b'{"ok": true}')
+            else:
+                self._reply(404, b'{"error": "not found"}')
+
+        def do_POST(self):
+            if urlparse(self.path).path != "/embed":
+                self._reply(404, b'{"error": "not found"}')
+                return
+            texts = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))["texts"]
+            if args.max_batch and len(texts) > args.max_batch:
+                self._reply(413, b'{"error": "batch too large"}')
+                return
+
+            with slots:
+                delay = args.latency_ms + args.per_text_ms * len(texts)
+                if args.jitter_ms:
+                    delay += random.expovariate(1.0 / args.jitter_ms)
+                time.sleep(delay / 1000.0)
+
+            vectors = np.random.default_rng().standard_normal((len(texts), args.dim)).astype(np.float32)
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+            if args.format == "auto" and "application/x-npy" in (self.headers.get("Accept") or ""):
+                buffer = io.BytesIO()
+                np.save(buffer, vectors)
+                self._reply(200, buffer.getvalue(), "application/x-npy")
+            else:
+                self._reply(200, json.dumps({"vectors": vectors.tolist()}).encode("utf-8"))
+
+    return Handler
+
+
+def serve(args) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args))
+    server.daemon_threads = True
+    return server
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--port", type=int, default=9005, help="0 picks a free port")
+    p.add_argument("--latency-ms", type=float, default=20.0, help="fixed cost per request")
+    p.add_argument("--per-text-ms", type=float, default=0.2, help="added cost per text in the batch")
+    p.add_argument("--jitter-ms", type=float, default=5.0, help="mean of the exponential jitter (0 disables)")
+    p.add_argument("--dim", type=int, default=384, help="embedding dimension")
+    p.add_argument("--workers", type=int, default=4, help="batches processed at once")
+    p.add_argument("--max-batch", type=int, default=0, help="answer 413 above this many texts (0 = no limit)")
+    p.add_argument("--format", choices=("auto", "json"), default="auto", help="'json' ignores the Accept header")
+    return p
+
+
+def main():
+    args = parser().parse_args()
+    server = serve(args)
+    # The first line tells a parent process which port was picked
+    print(f"stub embeddings server on http://127.0.0.1:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -11,5 +11,8 @@ module.exports = {
   plugins: ['react-refresh'],
   rules: {
     'react-refresh/only-export-components': 'warn',
+    // react-three-fiber elements take three.js props, and components here pass props unchecked
+    'react/no-unknown-property': 'off',
+    'react/prop-types': 'off',
   },
 }
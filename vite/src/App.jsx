@@ -1,8 +1,10 @@
-import { useEffect, useState, createContext } from 'react'
+import { useEffect, useState } from 'react'
 import BarLoader from "react-spinners/ClipLoader";
 import './App.css'
 import ThreePointVis from './ThreePointViz';
 import Footer from './Footer';
+import { parsePointPayload } from './pointPayload';
+import { apiUrl } from './api';
 
 function App() {
 
@@ -11,28 +13,71 @@ function App() {
   const [error, setError] = useState(null)
 
   const [settings, setSettings] = useState({showDocuments:true, showMetadata: true, showLines: true})
+  const [progress, setProgress] = useState(null)
+  // Number of points requested; null lets the server send its t-SNE sample
+  const [limit, setLimit] = useState(null)
   
   
 
   useEffect(() => {
-    setLoading(true)
-    setData({})
-    fetch(`http://127.0.0.1:5000/data`)
-      .then(res => res.json())
-      .then(
-        (result) => {
-          setLoading(false);
-          setData(result);
-        },
-        // Note: it's important to handle errors here
-        // instead of a catch() block so that we don't swallow
-        // exceptions from actual bugs in components.
-        (error) => {
-          setLoading(false);
-          setError(error);
-        }
-      )
-  }, [])
+    let timer = null
+
+    // /data.bin answers 202 with the job status until the projection is ready;
+    // the job is then polled at /jobs/<id> and the points fetched once it ends
+    const poll = (job) => {
+      fetch(`jobs/${job}`)
+        .then(res => res.json())
+        .then(
+          (body) => {
+            if (body.status === 'queued' || body.status === 'running') {
+              setProgress(body);
+              timer = setTimeout(() => poll(job), 1000);
+              return;
+            }
+            load();
+          },
+          (error) => {
+            setLoading(false);
+            setError(error);
+          }
+        )
+    }
+
+    const load = () => {
+      fetch(apiUrl('data.bin', { limit }))
+        .then(res => res.ok && res.status !== 202
+          ? res.arrayBuffer().then(buffer => ({ status: res.status, body: parsePointPayload(buffer) }))
+          : res.json().then(body => ({ status: res.status, body })))
+        .then(
+          ({ status, body }) => {
+            if (status === 202) {
+              setProgress(body);
+              timer = setTimeout(() => poll(body.job), 1000);
+              return;
+            }
+            if (status !== 200) {
+              setLoading(false);
+              setError(body.error || `HTTP ${status}`);
+              return;
+            }
+            setLoading(false);
+            setData(body);
+          },
+          // Note: it's important to handle errors here
+          // instead of a catch() block so that we don't swallow
+          // exceptions from actual bugs in components.
+          (error) => {
+            setLoading(false);
+            setError(error);
+          }
+        )
+    }
+    load()
+    return () => clearTimeout(timer)
+  }, [limit])
+
+  // Reveal more of a sampled collection; later points were interpolated onto the sample layout
+  const showMore = () => setLimit(Math.min(data.total, Math.max(data.count * 2, 1)))
 
   return (
     <>
@@ -45,14 +90,24 @@ function App() {
         size={150}
         aria-label="Loading Spinner"
         data-testid="loader"
-      /></div>
+      />
+      {progress && <p>{progress.stage} ({Math.round(progress.progress * 100)}%, {progress.stage_elapsed}s) {progress.detail}</p>}
+      </div>
+    }
+    { !loading && error &&
+    <div style={{
+      position: 'absolute', left: '50%', top: '50%',
+      transform: 'translate(-50%, -50%)'
+  }}>
+      <p>{String(error)}</p>
+      </div>
     }
-    { !loading && <>
+    { !loading && !error && <>
     <div className="vis-container">
         <ThreePointVis data={data} settings={[settings, setSettings]} />
       </div>
     
-    <Footer settings={[settings, setSettings]}></Footer></>
+    <Footer settings={[settings, setSettings]} more={data.count < data.total ? { shown: data.count, total: data.total, showMore } : null}></Footer></>
     }
     </>
     
@@ -1,4 +1,3 @@
-import React from 'react';
 import './ButtonGroup.css'; // CSS styles for the button group
 const ButtonGroup = (settings) => {
     
@@ -27,6 +26,10 @@ const ButtonGroup = (settings) => {
         <button className={`btn ${settings.settings[0].showLines ? 'active' : ''}`} onClick={handleToggleLines}>
           lines
         </button>
+        {settings.more &&
+        <button className="btn" onClick={settings.more.showMore}>
+          more ({settings.more.shown}/{settings.more.total})
+        </button>}
       </div>
     );
   };
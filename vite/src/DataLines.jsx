@@ -1,100 +1,54 @@
-import { useEffect, useLayoutEffect, useRef, useState } from "react"
+import { useEffect, useLayoutEffect, useMemo, useRef, useState } from "react"
 import * as THREE from "three"
-import { ConvexGeometry } from 'three/addons/geometries/ConvexGeometry.js';
+import { parsePayload } from './pointPayload';
+import { apiUrl } from './api';
 
-function Line({ start, end, color }) {
-  const ref = useRef()
-  useLayoutEffect(() => {
-    ref.current.geometry.setFromPoints([start, end].map((point) => new THREE.Vector3(...point)))
-  }, [start, end])
-  return (
-    <line ref={ref}>
-      <bufferGeometry />
-      <lineBasicMaterial color={color} />
-    </line>
-  )
-}
+const GRAY = new THREE.Color("gray")
 
+// Group hulls are computed and cached by the server (/hulls.bin) and drawn as
+// a single LineSegments geometry. Highlighting rewrites its color attribute
+// instead of creating a React component per edge.
 const DataLines = ({ data, palette, highlightedGroup }) => {
+  const geometryRef = useRef()
+  const [hulls, setHulls] = useState(null)
+  const colors = useMemo(() => palette.map((c) => new THREE.Color(c.hex())), [palette])
 
-  function organizePointsByGroup(points) {
-    const groupedPoints = new Map();
-  
-    // Iterate over the points and group them by the group value
-    for (const point of points) {
-      const { group } = point;
-  
-      // If the group doesn't exist as a key in the map, create a new array
-      if (!groupedPoints.has(group)) {
-        groupedPoints.set(group, []);
-      }
-  
-      // Push the current point into the array associated with its group
-      groupedPoints.get(group).push(point);
-    }
-  
-    // Convert the map object into an array of arrays
-    const result = Array.from(groupedPoints.values());
-  
-    return result;
-  }
-
-  function calculateConvexHull(points) {
-        const vertices = []
-
-        const color = points[0].group
-      
-        // Add points to the geometry
-        points.forEach((point) => {
-          vertices.push(new THREE.Vector3(point.position[0], point.position[1], point.position[2]));
-        });
-      
-        // Calculate the convex hull
-        const convexHull = new ConvexGeometry(vertices);
-    // Get the attributes from the convex hull geometry
-    const positionAttribute = convexHull.getAttribute('position');
-    const vertexCount = convexHull.getAttribute('position').count;
-
-    // Collect the start and end positions of the lines
-    const lines = [[]];
-
-    // Iterate over the vertices in sets of 3
-    for (let i = 0; i < vertexCount; i += 3) {
-      const start = new THREE.Vector3().fromBufferAttribute(positionAttribute, i);
-      const middle = new THREE.Vector3().fromBufferAttribute(positionAttribute, i + 1);
-      const end = new THREE.Vector3().fromBufferAttribute(positionAttribute, i + 2);
-
-      lines.push([[start.x, start.y, start.z], [middle.x, middle.y, middle.z], color]);
+  useEffect(() => {
+    if (!data.positions) return
+    let cancelled = false
+    fetch(apiUrl('hulls.bin', { limit: data.count }))
+      .then(res => res.status === 200 ? res.arrayBuffer() : null)
+      .then(buffer => { if (!cancelled && buffer) setHulls(parsePayload(buffer)) })
+    return () => { cancelled = true }
+  }, [data.positions, data.count])
 
-      lines.push([[middle.x, middle.y, middle.z], [end.x, end.y, end.z], color]);
+  const colorArray = useMemo(() => hulls ? new Float32Array(hulls.count * 2 * 3) : null, [hulls])
 
-      lines.push([[end.x, end.y, end.z], [start.x, start.y, start.z], color]);
+  useLayoutEffect(() => {
+    const geometry = geometryRef.current
+    if (!geometry || !hulls) return
+    for (let i = 0; i < hulls.count; i++) {
+      const group = hulls.groups[i]
+      const color = (highlightedGroup < 0 || highlightedGroup == group) ? colors[group % colors.length] : GRAY
+      color.toArray(colorArray, i * 6)
+      color.toArray(colorArray, i * 6 + 3)
     }
+    geometry.attributes.color.needsUpdate = true
+  }, [hulls, colorArray, colors, highlightedGroup])
 
-    return lines;
+  if (!hulls || !hulls.count) {
+    return null
   }
 
-  var [lineComponents, setLineComponents] = useState([])
-
-  useEffect(() => {
-    if(data.points){
-      setLineComponents([])
-      const groups = organizePointsByGroup(data.points)
-      var lines = []
-      groups.forEach((group) => {
-        if(group.length > 5){
-          lines = (lines.concat(calculateConvexHull(group)))
-        }
-      })
-      for (let index = 0; index < lines.length; index++) {
-        const d = lines[index];
-        if(d.length > 2){
-          setLineComponents(lineComponents => [...lineComponents, <Line start={d[0]} end={d[1]} color={(highlightedGroup < 0 || (highlightedGroup == d[2])) ? palette[d[2]].hex(): "gray"} key={index} />])
-        }
-      }
-  }}, [data.points, highlightedGroup])
-    
-    return lineComponents;
-  }
+  return (
+    <lineSegments key={hulls.fingerprint + hulls.count} frustumCulled={false}>
+      <bufferGeometry ref={geometryRef}>
+        <bufferAttribute attach="attributes-position" count={hulls.count * 2} array={hulls.segments} itemSize={3} />
+        <bufferAttribute attach="attributes-color" count={hulls.count * 2} array={colorArray} itemSize={3} />
+      </bufferGeometry>
+      <lineBasicMaterial vertexColors />
+    </lineSegments>
+  )
+}
 
-export default DataLines;
\ No newline at end of file
+export default DataLines;
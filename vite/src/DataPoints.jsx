@@ -1,40 +1,95 @@
 import { Html } from '@react-three/drei';
-import { useState } from 'react';
+import { useThree } from '@react-three/fiber';
+import { useEffect, useLayoutEffect, useMemo, useRef, useState } from 'react';
+import * as THREE from 'three';
 import Tooltip from './Tooltip';
+import { pointPosition } from './pointPayload';
+import { PointOctree } from './octree';
 
-function DataPoint({ datum, colorArray, highlightedGroup, setHighlightedGroup, settings}) {
-  const [hovered, setHovered] = useState(false);
+const MIN_SIZE = 0.02
+const MAX_SIZE = 0.045
+const GRAY = new THREE.Color('gray')
 
-  const handlePointerOver = () => {
-    setHovered(true);
-    setHighlightedGroup(datum.group)
-  };
+// All points are drawn by one InstancedMesh. Hover picking goes through an
+// octree, and highlighting rewrites the instance color buffer in place, so
+// no per-point React components are created or re-rendered.
+const DataPoints = ({ data, palette, highlightedGroup, setHighlightedGroup, settings  }) => {
+  const meshRef = useRef()
+  const hoveredRef = useRef(-1)
+  const [hovered, setHovered] = useState(-1)
+  const { camera, gl, raycaster, pointer } = useThree()
+  const count = data.positions ? data.count : 0
+
+  const sizes = useMemo(() => {
+    const out = new Float32Array(count)
+    for (let i = 0; i < count; i++) {
+      out[i] = Math.random() * (MAX_SIZE - MIN_SIZE) + MIN_SIZE
+    }
+    return out
+  }, [count])
+
+  const octree = useMemo(() => new PointOctree(data.positions || [], count, sizes, MAX_SIZE), [data.positions, count, sizes])
+  const colors = useMemo(() => palette.map((c) => new THREE.Color(c.hex())), [palette])
+
+  useLayoutEffect(() => {
+    const mesh = meshRef.current
+    if (!mesh) return
+    const matrix = new THREE.Matrix4()
+    for (let i = 0; i < count; i++) {
+      matrix.makeScale(sizes[i], sizes[i], sizes[i])
+      matrix.setPosition(data.positions[i * 3], data.positions[i * 3 + 1], data.positions[i * 3 + 2])
+      mesh.setMatrixAt(i, matrix)
+    }
+    mesh.instanceMatrix.needsUpdate = true
+  }, [data.positions, count, sizes])
+
+  useLayoutEffect(() => {
+    const mesh = meshRef.current
+    if (!mesh || !count) return
+    for (let i = 0; i < count; i++) {
+      const group = data.groups[i]
+      const color = (highlightedGroup < 0 || highlightedGroup == group) ? colors[group % colors.length] : GRAY
+      mesh.setColorAt(i, color)
+    }
+    mesh.instanceColor.needsUpdate = true
+  }, [data.groups, count, colors, highlightedGroup])
 
-  const handlePointerOut = () => {
-    setHovered(false);
-    setHighlightedGroup(-1)
-  };
+  useEffect(() => {
+    hoveredRef.current = -1
+    setHovered(-1)
+  }, [octree])
 
-  const [size, setSize] = useState(Math.random() * (0.05 - 0.025) + 0.02)
+  useEffect(() => {
+    const handlePointerMove = () => {
+      raycaster.setFromCamera(pointer, camera)
+      const hit = octree.raycast(raycaster.ray)
+      if (hit !== hoveredRef.current) {
+        hoveredRef.current = hit
+        setHovered(hit)
+        setHighlightedGroup(hit < 0 ? -1 : data.groups[hit])
+      }
+    }
+    gl.domElement.addEventListener('pointermove', handlePointerMove)
+    return () => gl.domElement.removeEventListener('pointermove', handlePointerMove)
+  }, [octree, camera, gl, raycaster, pointer, data.groups, setHighlightedGroup])
+
+  if (!count) {
+    return null
+  }
 
   return (
-    <mesh position={datum.position} onPointerOver={handlePointerOver} onPointerOut={handlePointerOut}>
-      <sphereGeometry attach="geometry" args={[size]} />
-      <meshBasicMaterial attach="material" color={(highlightedGroup < 0 || (highlightedGroup == datum.group)) ? colorArray[datum.group].hex(): "gray"} />
-      {hovered && (
-        <Html style={{ pointerEvents: 'none' }}>
-          <Tooltip tip={datum} settings={settings}></Tooltip>
+    <>
+      <instancedMesh key={count} ref={meshRef} args={[null, null, count]} raycast={() => null} frustumCulled={false}>
+        <sphereGeometry attach="geometry" args={[1, 12, 8]} />
+        <meshBasicMaterial attach="material" />
+      </instancedMesh>
+      {hovered >= 0 && (
+        <Html position={pointPosition(data, hovered)} style={{ pointerEvents: 'none' }}>
+          <Tooltip index={data.indices[hovered]} settings={settings}></Tooltip>
         </Html>
       )}
-    </mesh>
+    </>
   );
-}
-
-const DataPoints = ({ data, palette, highlightedGroup, setHighlightedGroup, settings  }) => {
-    
-  if(data.points){
-  return data.points.map((d, index) => <DataPoint settings={settings} datum={d} key={index} colorArray={palette} highlightedGroup={highlightedGroup} setHighlightedGroup={setHighlightedGroup}/>);
-  }
 };
 
-export default DataPoints;
\ No newline at end of file
+export default DataPoints;
@@ -1,9 +1,9 @@
 import ButtonGroup from "./ButtonGroup"
 
-const Footer = ({ settings }) => {
+const Footer = ({ settings, more }) => {
   return(
     <div className="footer">
-      <ButtonGroup settings={settings} />
+      <ButtonGroup settings={settings} more={more} />
       <h4>chroma visualizer 0.0.2</h4>
     </div>
   )
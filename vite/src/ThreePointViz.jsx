@@ -1,5 +1,5 @@
 import { Canvas} from '@react-three/fiber';
-import { useRef, useState, useContext } from 'react';
+import { useRef, useState, useMemo } from 'react';
 import { useLayoutEffect } from 'react';
 import { Vector3 } from 'three';
 import { OrbitControls } from '@react-three/drei'
@@ -23,7 +23,10 @@ function Line({ start, end }) {
 
 const ThreePointVis = ({data, settings}) => {
 
-  const palette = distinctColors({count: 50, lightMin:50, lightMax: 80, chromaMin:70})
+  // One color per cluster; memoized so the point color buffer is only
+  // rewritten when the highlight or the number of clusters changes
+  const groupCount = Math.max(1, data.group_count || 0)
+  const palette = useMemo(() => distinctColors({count: groupCount, lightMin:50, lightMax: 80, chromaMin:70}), [groupCount])
 
   const [highlightedGroup, setHighlightedGroup] = useState(-1)
 
@@ -1,7 +1,18 @@
 
-import { Tooltip as ReactTooltip } from 'react-tooltip'
+import { useEffect, useState } from 'react'
+import { apiUrl } from './api'
 
-const Tooltip = ({tip, settings}) => {
+const Tooltip = ({index, settings}) => {
+
+    // Documents and metadata are not part of the point payload; fetch them on hover
+    const [tip, setTip] = useState(null)
+    useEffect(() => {
+      let cancelled = false
+      fetch(apiUrl('points', { index }))
+        .then(res => res.ok ? res.json() : null)
+        .then(result => { if (!cancelled && result && result.points.length) setTip(result.points[0]) })
+      return () => { cancelled = true }
+    }, [index])
 
     const renderList = (data) => {
         if (typeof data === 'object' && data !== null) {
@@ -19,11 +30,15 @@ const Tooltip = ({tip, settings}) => {
         }
       };
 
+    if (!tip) {
+      return null
+    }
+
     return (<div style={{ pointerEvents: 'none', width: "25vw", padding: "5px", margin: 0, listStyleType: "none", backgroundColor: "grey", borderRadius: "5px", wordWrap: "break-word" }}>
     <><span><strong>id: </strong></span></>
     {renderList(tip.id)}
     {settings[0].showDocuments && <><br></br><span><strong>document:</strong></span></>}
-    {settings[0].showDocuments && (renderList(tip.document.substr(0, 50)))}
+    {settings[0].showDocuments && (renderList((tip.document ?? '').substr(0, 50)))}
     {settings[0].showMetadata && <><br></br><span><strong>metadata:</strong></span></>}
     {settings[0].showMetadata && <div style={{marginLeft: "1em"}}>{(renderList(tip.metadata))}</div>}
   </div>)
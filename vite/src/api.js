@@ -0,0 +1,13 @@
+// The visualizer is served by the same Flask app as its API, so requests use
+// relative URLs. The collection comes from the page's own ?collection=...
+const collection = new URLSearchParams(window.location.search).get('collection')
+
+export function apiUrl(path, params = {}) {
+  const query = new URLSearchParams()
+  if (collection !== null) query.set('collection', collection)
+  for (const [key, value] of Object.entries(params)) {
+    if (value !== null && value !== undefined) query.set(key, value)
+  }
+  const qs = query.toString()
+  return qs ? `${path}?${qs}` : path
+}
@@ -0,0 +1,85 @@
+import * as THREE from 'three'
+
+const LEAF_SIZE = 32
+const MAX_DEPTH = 12
+
+// Static octree over a packed Float32Array of xyz positions, used to pick
+// the point under the cursor without testing every point against the ray.
+export class PointOctree {
+  constructor(positions, count, radii, maxRadius) {
+    this.positions = positions
+    this.radii = radii
+    this.maxRadius = maxRadius
+
+    const indices = new Uint32Array(count)
+    const box = new THREE.Box3()
+    const point = new THREE.Vector3()
+    for (let i = 0; i < count; i++) {
+      indices[i] = i
+      box.expandByPoint(point.fromArray(positions, i * 3))
+    }
+    this.root = count ? this.build(indices, box, 0) : null
+  }
+
+  build(indices, box, depth) {
+    // Bounds are grown by the largest point radius so ray tests cover whole spheres
+    const bounds = box.clone().expandByScalar(this.maxRadius)
+    if (indices.length <= LEAF_SIZE || depth >= MAX_DEPTH) {
+      return { bounds, indices }
+    }
+
+    const center = box.getCenter(new THREE.Vector3())
+    const buckets = Array.from({ length: 8 }, () => [])
+    for (const i of indices) {
+      const octant = (this.positions[i * 3] > center.x ? 1 : 0)
+        | (this.positions[i * 3 + 1] > center.y ? 2 : 0)
+        | (this.positions[i * 3 + 2] > center.z ? 4 : 0)
+      buckets[octant].push(i)
+    }
+
+    const children = []
+    buckets.forEach((bucket, octant) => {
+      if (!bucket.length) return
+      const min = new THREE.Vector3(
+        octant & 1 ? center.x : box.min.x,
+        octant & 2 ? center.y : box.min.y,
+        octant & 4 ? center.z : box.min.z)
+      const max = new THREE.Vector3(
+        octant & 1 ? box.max.x : center.x,
+        octant & 2 ? box.max.y : center.y,
+        octant & 4 ? box.max.z : center.z)
+      children.push(this.build(Uint32Array.from(bucket), new THREE.Box3(min, max), depth + 1))
+    })
+    return { bounds, children }
+  }
+
+  // Index of the nearest point whose sphere the ray passes through, or -1
+  raycast(ray) {
+    let best = -1
+    let bestDistance = Infinity
+    const point = new THREE.Vector3()
+    const closest = new THREE.Vector3()
+    const stack = this.root ? [this.root] : []
+
+    while (stack.length) {
+      const node = stack.pop()
+      if (!ray.intersectsBox(node.bounds)) continue
+      if (node.children) {
+        stack.push(...node.children)
+        continue
+      }
+      for (const i of node.indices) {
+        point.fromArray(this.positions, i * 3)
+        const radius = this.radii[i]
+        if (ray.distanceSqToPoint(point) > radius * radius) continue
+        ray.closestPointToPoint(point, closest)
+        const distance = closest.distanceTo(ray.origin)
+        if (distance < bestDistance) {
+          bestDistance = distance
+          best = i
+        }
+      }
+    }
+    return best
+  }
+}
@@ -0,0 +1,34 @@
+// Decodes the binary payloads served by /data.bin and /hulls.bin:
+// [uint32 header length][JSON header][buffer][buffer]...
+// The header describes each buffer as {dtype, shape, offset}. All numbers are
+// little-endian and buffers are 4-byte aligned, so the typed arrays below are
+// views onto the response without any copying.
+const TYPED_ARRAYS = {
+  float32: Float32Array,
+  uint16: Uint16Array,
+  uint32: Uint32Array,
+}
+
+export function parsePayload(buffer) {
+  const headerLength = new DataView(buffer).getUint32(0, true)
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength)))
+
+  const out = { ...header }
+  for (const [name, value] of Object.entries(header)) {
+    if (value && typeof value === 'object' && value.dtype in TYPED_ARRAYS) {
+      const length = value.shape.reduce((a, b) => a * b, 1)
+      out[name] = new TYPED_ARRAYS[value.dtype](buffer, value.offset, length)
+    }
+  }
+  return out
+}
+
+// /data.bin: positions (count x 3), groups, and indices mapping points back
+// to their /points index (points arrive in level-of-detail order)
+export function parsePointPayload(buffer) {
+  return parsePayload(buffer)
+}
+
+export function pointPosition(data, index) {
+  return [data.positions[index * 3], data.positions[index * 3 + 1], data.positions[index * 3 + 2]]
+}